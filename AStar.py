@@ -5,197 +5,289 @@ Calculates optimal paths for zombies to chase the player,
 accounting for obstacles and walls.
 """
 
-import pygame
+from collections import OrderedDict
+from heapq import heappush, heappop
 
 import config
+import JPS
 from ObjectClass import Zombie
 from TileClass import Tile
 
 
-def AStar(screen, survivor, FPS, totalFrames):
-	"""
-	Run A* pathfinding for all zombies to find paths to the player.
-
-	Args:
-		screen: Pygame screen surface
-		survivor: Player character
-		FPS (int): Frames per second
-		totalFrames (int): Total frames elapsed
-	"""
+expanded = 0  # Nodes expanded by the last search
 
-	#Surroundind Nodes in 8 Directions
-	N = -32
-	S = 32
-	E = 1
-	W = -1
+#Flat Copies Of The Last Keyed Grid, Reused Until The Key Changes
+flatKey = None
+flatGrid = None  # (walkable list, cost list or None)
 
-	NW = -33
-	NE = -31
-	SE = 33
-	SW = 31
 
-	half = Tile.width // 2
-
-	#Reset F,G,H Values: Zombie Blocked By Walls
-	for tile in Tile.List:
-		tile.parent = None
-		tile.F, tile.G, tile.H = 0, 0, 0
+def flatten(walkable, cost, key=None):
+	"""
+	Get flat Python lists of a grid, reusing the last ones while `key` is unchanged.
 
+	Args:
+		walkable (ndarray): (rows, cols) bool array
+		cost (ndarray): (rows, cols) step costs, or None
+		key (hashable, optional): Identifies the grid's contents; None
+			always converts afresh. Defaults to None.
 
-	def blockyPath(surroundingTiles, diagonals, surTile):
-		if surTile.number not in diagonals:
-			surroundingTiles.append(surTile)
+	Returns:
+		tuple: (walkable list, cost list or None)
+	"""
+	global flatKey, flatGrid
 
-		return surroundingTiles
+	if key is None or key != flatKey:
+		flatGrid = (walkable.ravel().tolist(), cost.ravel().tolist() if cost is not None else None)
+		flatKey = key
 
+	return flatGrid
 
-	#Get List of Surrounding Nodes
-	def getSurroundingTiles(baseNode):
-		
-		array = (
-				(baseNode.number + N),
-				(baseNode.number + NE),
-				(baseNode.number + E),
-				(baseNode.number + SE),
-				(baseNode.number + S),
-				(baseNode.number + SW),
-				(baseNode.number + W),
-				(baseNode.number + NW)
-				)
 
-		#print array
+def search(walkable, start, goal, cost=None, key=None):
+	"""
+	Find the shortest blocky (4-directional) path on a walkability array.
 
+	Uses a binary-heap open set with lazy deletion and a hashed closed set,
+	expanding nodes in an iterative loop. The heuristic is computed only
+	for the cells pushed on the open set. The number of nodes expanded is
+	left in the module's `expanded`.
 
-		surroundingTiles = []
+	Args:
+		walkable (ndarray): (rows, cols) bool array, True where a cell can be entered
+		start (tuple): (col, row) cell to search from
+		goal (tuple): (col, row) cell to reach
+		cost (ndarray, optional): (rows, cols) cost of entering each cell.
+			Defaults to config.TILE_STEP_COST everywhere.
+		key (hashable, optional): Changes whenever walkable or cost do,
+			e.g. (Tile.mapVersion, shape); lets repeated searches skip
+			flattening the grid. Defaults to None.
+
+	Returns:
+		list: (col, row) cells from start to goal (both included), or an
+		empty list if the goal cannot be reached
+	"""
+	global expanded
 
-		baseNumber = baseNode.number
-		diagonals = [baseNumber + NE, baseNumber + NW, baseNumber + SE, baseNumber + SW]
+	expanded = 0
+	if start == goal:
+		return [start]
 
-		for tileNumber in array:
+	rows, cols = walkable.shape
+	step = config.TILE_STEP_COST
 
-			surTile = Tile.getTile(tileNumber)
+	#Flat Python Lists Are Much Faster To Index Than The Array Itself
+	open_, enter = flatten(walkable, cost, key)
 
-			if tileNumber not in range(1,Tile.totalTiles + 1):
-				continue
+	goalCol, goalRow = goal
+	source = start[1] * cols + start[0]
+	target = goalRow * cols + goalCol
 
-			if surTile.walkable and surTile not in closedList:
-				
-				#For Diagonal Movements
-				#surroundingTiles.append(surTile)	
-				
-				#For Blocky Movement
-				surroundingTiles = blockyPath(surroundingTiles, diagonals, surTile) 
+	openHeap = [(0, 0, source)]
+	G = {source: 0}
+	parent = {source: None}
+	closed = set()
 
-		return surroundingTiles
+	while openHeap:
+		current = heappop(openHeap)[2]
 
+		#Stale Heap Entry: Cell Already Expanded With A Lower G
+		if current in closed:
+			continue
 
-	#Calculate G Value: Bottom Left
-	def G(tile):
-		
-		diff = tile.number - tile.parent.number
+		if current == target:
+			break
+
+		closed.add(current)
+		g = G[current]
+		col = current % cols
+
+		surrounding = []
+		if current >= cols:
+			surrounding.append(current - cols)	#N
+		if col < cols - 1:
+			surrounding.append(current + 1)		#E
+		if current < (rows - 1) * cols:
+			surrounding.append(current + cols)	#S
+		if col > 0:
+			surrounding.append(current - 1)		#W
+
+		for node in surrounding:
+			if not open_[node] or node in closed:
+				continue
 
-		if diff in (N, S, E, W): #Straights = +10
-			tile.G = tile.parent.G + 10
+			moveCost = g + (enter[node] if enter is not None else step)
 
-		elif diff in (NE, NW, SE, SW): #Diagonals = +14
-			tile.G = tile.parent.G + 14
+			if moveCost < G.get(node, moveCost + 1):
+				G[node] = moveCost
+				parent[node] = current
+				#Prefer Deeper Nodes On F Ties
+				h = step * (abs(node % cols - goalCol) + abs(node // cols - goalRow))
+				heappush(openHeap, (moveCost + h, -moveCost, node))
+	else:
+		expanded = len(closed)
+		return []
 
+	expanded = len(closed)
 
-	#Calculate H Value: Bottom Right
-	def H():
-		
-		for tile in Tile.List:
-			tile.H = 10 * (abs(tile.x - survivor.x) + abs(tile.y - survivor.y)) / Tile.width
+	#Walk The Parents Back From The Goal
+	path = []
+	node = target
+	while node is not None:
+		path.append((node % cols, node // cols))
+		node = parent[node]
 
+	path.reverse()
+	return path
 
-	#Calculate F Value: Top Right
-	def F(tile):
-		#F = G + H    =>  A* Algorithm
-		tile.F = tile.G + tile.H
 
+def find_path(start, goal):
+	"""
+	Find the shortest blocky path between two tiles of the game map.
 
-	#Update the Lists
-	def swap(tile):
-		openList.remove(tile)
-		closedList.append(tile)
+	Uses JPS.search instead of A* when config.PATH_SEARCH is "jps".
 
+	Args:
+		start (Tile): Tile to search from
+		goal (Tile): Tile to reach
 
-	#Get Lowest F-Value Tile
-	def getLFT():
-		
-		Fvals = []
+	Returns:
+		list: Tiles from start to goal (both included), or an empty list
+		if the goal cannot be reached
+	"""
+	searchFunction = JPS.search if config.PATH_SEARCH == "jps" else search
+	key = (Tile.mapVersion, Tile.walkableGrid.shape)
+	cells = searchFunction(Tile.walkableGrid, (start.col, start.row), (goal.col, goal.row), Tile.costGrid, key)
+	return [Tile.at(*cell) for cell in cells]
 
-		for tile in openList:
-			Fvals.append(tile.F)
 
-		revOpenList = openList[::-1]
+def lastExpanded():
+	"""
+	Get the nodes expanded by the most recent find_path search.
 
-		for tile in revOpenList:
-			if tile.F == min(Fvals):
-				return tile
+	Returns:
+		int: Expanded nodes (jump points for JPS)
+	"""
+	return JPS.expanded if config.PATH_SEARCH == "jps" else expanded
 
 
+class PathCache:
+	"""
+	Bounded LRU cache of tile paths keyed by (start tile, goal tile, map version).
 
-	#Calculate New Possible G Values
-	def moveToGCost(LFT, tile):
+	The whole cache is dropped as soon as Tile.mapVersion moves, since any
+	stored path may now run through a wall.
+	"""
 
-		GVal = 0
-		diff = LFT.number - tile.number
+	def __init__(self, size):
+		"""
+		Create an empty cache.
 
-		if diff in (N, S, E, W): #10
-			GVal = LFT.G + 10
+		Args:
+			size (int): Maximum number of paths kept
+		"""
+		self.size = size
+		self.paths = OrderedDict()
+		self.mapVersion = Tile.mapVersion
+		self.hits, self.misses, self.suffixHits = 0, 0, 0
+		self.expanded = 0  # Nodes expanded over all misses
 
-		elif diff in (NE, NW, SE, SW): #14
-			GVal = LFT.G + 14
+	def findPath(self, start, goal):
+		"""
+		Get the path between two tiles, searching only on a cache miss.
 
-		return GVal
+		Args:
+			start (Tile): Tile to search from
+			goal (Tile): Tile to reach
 
+		Returns:
+			list: Tiles from start to goal (shared, do not modify)
+		"""
+		if self.mapVersion != Tile.mapVersion:
+			self.paths.clear()
+			self.mapVersion = Tile.mapVersion
 
+		key = (start.number, goal.number, Tile.mapVersion)
+		path = self.paths.get(key)
 
-	#Recursive function to estimate the path
-	def loop():
+		if path is not None:
+			self.paths.move_to_end(key)
+			self.hits += 1
+			return path
 
-		LFT = getLFT()
-		#Draw The Tree Path
-		#pygame.draw.line(screen, [0, 255, 255], [LFT.parent.x + half, LFT.parent.y + half], [LFT.x + half, LFT.y + half] ) 
+		self.misses += 1
+		path = find_path(start, goal)
+		self.expanded += lastExpanded()
+		self.paths[key] = path
 
-		swap(LFT)
-		surroundingNodes = getSurroundingTiles(LFT)
+		if len(self.paths) > self.size:
+			self.paths.popitem(last=False)	#Evict Least Recently Used
 
+		return path
 
-		for node in surroundingNodes:
+	def stats(self):
+		"""
+		Get the cache counters.
 
-			if node not in openList:
-				openList.append(node)
-				node.parent = LFT
+		Returns:
+			dict: hits, suffix hits, misses, stored paths, overall hit rate
+			and nodes expanded per search
+		"""
+		lookups = self.hits + self.suffixHits + self.misses
 
+		return {
+			"hits": self.hits,
+			"suffixHits": self.suffixHits,
+			"misses": self.misses,
+			"paths": len(self.paths),
+			"hitRate": (self.hits + self.suffixHits) / lookups if lookups else 0.0,
+			"expandedPerSearch": self.expanded / self.misses if self.misses else 0.0
+		}
 
-			#Perform G Check - Avoid ZigZag Paths
-			elif node in openList:
 
-				calG = moveToGCost(LFT, node)
+cache = PathCache(config.PATH_CACHE_SIZE)
 
-				if calG < node.G:
-					node.parent = LFT
-					G(node)
-					F(node)
 
+def followPath(zombie, survivorTile, pathKey):
+	"""
+	Give an idle zombie its next tile towards the player.
 
+	Args:
+		zombie (Zombie): Idle zombie
+		survivorTile (Tile): Player's tile
+		pathKey (tuple): (player tile number, map version) the path is for
+	"""
+	zombieTile = zombie.getTile()
 
-		if openList == [] or survivor.getTile() in closedList:
-			return
+	#Same Goal And Map: Keep Walking The Rest Of The Previous Path
+	if zombie.pathKey == pathKey and len(zombie.path) > 1 and zombie.path[1] is zombieTile:
+		path = zombie.path[1:]
+		cache.suffixHits += 1
+	else:
+		path = cache.findPath(zombieTile, survivorTile)
 
-		for node in openList:
-			G(node)
-			F(node)
+	zombie.path, zombie.pathKey = path, pathKey
 
-			#Draw The Tree Path
-			#pygame.draw.line(screen, [255, 0, 0], [node.parent.x + half, node.parent.y + half], [node.x + half, node.y + half] )
+	#Draw The Calculated Path Using Small Blue Circles
+	#for tile in path:
+	#	pygame.draw.circle(screen, [34, 95, 200], [tile.centerx, tile.centery], 5)
 
+	#Move Zombies - Chase The Player (Stop On The Adjacent Tile)
+	if len(path) > 2:
+		zombie.setTarget(path[1])
 
-		loop()
 
+def AStar(screen, survivor, FPS, totalFrames):
+	"""
+	Run A* pathfinding for all zombies to find paths to the player.
 
+	Args:
+		screen: Pygame screen surface
+		survivor: Player character
+		FPS (int): Frames per second
+		totalFrames (int): Total frames elapsed
+	"""
+	survivorTile = survivor.getTile()
+	pathKey = (survivorTile.number, Tile.mapVersion)
 
 	#Perform A-Star Algorithm for each Zombie
 	for zombie in Zombie.List:
@@ -204,60 +296,4 @@ def AStar(screen, survivor, FPS, totalFrames):
 		if zombie.tx != None or zombie.ty != None:
 			continue
 
-		openList = []
-		closedList = []
-
-		zombieTile = zombie.getTile()
-		openList.append(zombieTile)
-
-		surroundingNodes = getSurroundingTiles(zombieTile)
-
-		for node in surroundingNodes:
-			node.parent = zombieTile
-			openList.append(node)
-
-		swap(zombieTile)
-
-		H()
-
-		for node in surroundingNodes:
-			G(node)
-			F(node)
-			
-			#Draw The Tree Path
-			#pygame.draw.line(screen, [255, 0, 0], [node.parent.x + half, node.parent.y + half], [node.x + half, node.y + half] )
-
-
-		loop()
-
-
-		#Store The Path Tiles
-		returnTiles = []
-
-		parent = survivor.getTile()
-
-		while True:
-
-			returnTiles.append(parent)
-			parent = parent.parent
-
-			if parent == None:
-				break
-
-			if parent.number == zombieTile.number:
-				break
-
-
-		#Draw The Calculated Path Using Small Blue Circles
-		#for tile in returnTiles:
-		#	pygame.draw.circle(screen, [34, 95, 200], [tile.x + half, tile.y + half], 5)
-
-
-		#Move Zombies - Chase The Player
-		if len(returnTiles) > 1:
-			nextTile = returnTiles[-1]
-			zombie.setTarget(nextTile)
-
-
-
-
+		followPath(zombie, survivorTile, pathKey)
@@ -0,0 +1,57 @@
+"""
+Jump Point Search Micro-Benchmark
+
+Compares AStar.search with JPS.search on the benchmark maps, for the same
+random start and goal tiles: nodes expanded per query (plus the tiles JPS
+steps over while jumping) and time per query. Both must find paths of
+the same length.
+
+Usage:
+	python -m Benchmarks.JPSBench [queries]
+"""
+
+import sys
+import time
+from random import Random
+
+import AStar
+import JPS
+from Benchmarks import Scenarios
+from TileClass import Tile
+
+
+def runQueries(search, module, queries):
+	"""Total time, expanded nodes and path lengths over a list of queries."""
+	expanded, scanned, lengths = 0, 0, []
+	key = (Tile.mapVersion, Tile.walkableGrid.shape)
+
+	start = time.perf_counter()
+	for source, goal in queries:
+		lengths.append(len(search(Tile.walkableGrid, source, goal, Tile.costGrid, key)))
+		expanded += module.expanded
+		scanned += getattr(module, "scanned", 0)
+	elapsed = time.perf_counter() - start
+
+	return elapsed, expanded, scanned, lengths
+
+
+def main(count=200):
+	"""Print the comparison table for each benchmark map."""
+	print(f"{'map':>8} {'A* expanded':>12} {'JPS expanded':>13} {'JPS scanned':>12} {'A* ms':>7} {'JPS ms':>7}")
+
+	for mapName in Scenarios.MAPS:
+		Scenarios.buildMap(mapName)
+		rng = Random(count)
+		cells = [(tile.col, tile.row) for tile in Scenarios.openTiles()]
+		queries = [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+		aTime, aExpanded, _, aLengths = runQueries(AStar.search, AStar, queries)
+		jTime, jExpanded, jScanned, jLengths = runQueries(JPS.search, JPS, queries)
+		assert aLengths == jLengths, "JPS found a different path length than A*"
+
+		print(f"{mapName:>8} {aExpanded / count:>12.1f} {jExpanded / count:>13.1f} {jScanned / count:>12.1f} "
+			f"{aTime / count * 1000:>7.3f} {jTime / count * 1000:>7.3f}")
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
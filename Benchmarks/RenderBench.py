@@ -0,0 +1,89 @@
+"""
+Frame Rendering Micro-Benchmark
+
+Times Game.render with full-screen repaints (config.DIRTY_RECTS = False)
+against the dirty-rectangle renderer, for hordes of different sizes moving
+between tiles.
+
+Runs headless when SDL_VIDEODRIVER=dummy is set; the dummy driver makes
+presenting the frame almost free, so the numbers are the CPU cost of
+repainting the background and drawing the sprites.
+
+Usage:
+	python -m Benchmarks.RenderBench [counts...]
+"""
+
+import sys
+import time
+from random import Random
+
+import numpy as np
+
+import config
+import Main
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def spawnHorde(rng, count):
+	"""Put `count` zombies on random open tiles."""
+	Zombie.clear()
+	openTiles = [Tile.at(col, row) for row, col in np.argwhere(Tile.walkableGrid).tolist()]
+
+	for _ in range(count):
+		tile = rng.choice(openTiles)
+		Zombie.pool.acquire(tile.x, tile.y)
+
+
+def retarget(rng):
+	"""Send every idle zombie towards a random neighbouring tile."""
+	for zombie in Zombie.List:
+		if zombie.tx is None:
+			dx, dy = rng.choice(STEPS)
+			zombie.tx = min(max(zombie.x + dx * Tile.width, 0), config.SCREEN_WIDTH - Tile.width)
+			zombie.ty = min(max(zombie.y + dy * Tile.height, 0), config.SCREEN_HEIGHT - Tile.height)
+
+
+def timeFrames(game, count, dirty, frames=120):
+	"""Mean time per rendered frame, with the horde moving at 60 FPS."""
+	rng = Random(count)
+	config.DIRTY_RECTS = dirty
+	spawnHorde(rng, count)
+	game.renderer.invalidate()
+
+	elapsed = 0.0
+	for _ in range(frames):
+		game.survivor.health = config.PLAYER_HEALTH
+		retarget(rng)
+		Zombie.update_movement(1 / 60)
+
+		start = time.perf_counter()
+		game.render()
+		elapsed += time.perf_counter() - start
+
+	return elapsed / frames
+
+
+def main(counts=(10, 100, 1000)):
+	"""Print the per-frame render cost for each horde size."""
+	game = Main.Game()
+
+	print(f"{'zombies':>8} {'full ms':>8} {'dirty ms':>9} {'speedup':>8} {'partial frames':>15}")
+
+	for count in counts:
+		fullTime = timeFrames(game, count, False)
+		before = game.renderer.stats()
+		dirtyTime = timeFrames(game, count, True)
+		after = game.renderer.stats()
+
+		partial = (after["partialFrames"] - before["partialFrames"]) / (after["frames"] - before["frames"])
+		print(f"{count:>8} {fullTime * 1000:>8.3f} {dirtyTime * 1000:>9.3f} {fullTime / dirtyTime:>7.1f}x {partial:>14.0%}")
+
+	Zombie.clear()
+
+
+if __name__ == "__main__":
+	main(tuple(int(arg) for arg in sys.argv[1:]) or (10, 100, 1000))
@@ -0,0 +1,148 @@
+"""
+Seeded Benchmark Scenarios
+
+Builds reproducible game states for the benchmark suite: a map (empty,
+the shipped Tile.invalids map, or random wall-heavy maps) populated with
+a given number of zombies and bullets. The same name and seed always
+give the same state.
+"""
+
+from random import Random
+
+import numpy as np
+
+import config
+
+
+MAPS = ("empty", "shipped", "walls20", "walls35")
+COUNTS = (10, 100, 1000)
+DIRECTIONS = ('N', 'E', 'S', 'W')
+
+game = None
+shippedMap = None  # Walkable grid exactly as Tile.preInit built it
+
+
+def setup():
+	"""
+	Create the headless game the scenarios run in (once per process).
+
+	Returns:
+		Main.Game: The shared headless game
+	"""
+	global game, shippedMap
+
+	if game is None:
+		import Main
+		from TileClass import Tile
+
+		game = Main.Game(headless=True)
+		shippedMap = Tile.walkableGrid.copy()
+
+	return game
+
+
+def buildMap(name, seed=0):
+	"""
+	Load one of the benchmark maps into the tile grid.
+
+	Args:
+		name (str): One of MAPS; "wallsNN" has NN% random walls
+		seed (int, optional): Seed for random maps. Defaults to 0.
+
+	Returns:
+		numpy.ndarray: The walkable grid that was loaded
+	"""
+	from TileClass import Tile
+
+	setup()
+	shape = Tile.walkableGrid.shape
+
+	if name == "empty":
+		walkable = np.ones(shape, dtype=bool)
+	elif name == "shipped":
+		walkable = shippedMap.copy()
+	elif name.startswith("walls"):
+		density = int(name[len("walls"):]) / 100
+		walkable = np.random.default_rng(seed).random(shape) >= density
+	else:
+		raise ValueError(f"Unknown benchmark map: {name}")
+
+	#The Player Always Starts On Open Ground
+	walkable[config.PLAYER_START_Y // config.TILE_HEIGHT, config.PLAYER_START_X // config.TILE_WIDTH] = True
+
+	Tile.setMap(walkable)
+	return walkable
+
+
+def openTiles():
+	"""Get every walkable tile except the player's start tile."""
+	from TileClass import Tile
+
+	start = Tile.at_pixel(config.PLAYER_START_X, config.PLAYER_START_Y)
+	tiles = [Tile.at(col, row) for row, col in np.argwhere(Tile.walkableGrid).tolist()]
+	return [tile for tile in tiles if tile is not start]
+
+
+def spawnZombies(count, seed=0):
+	"""
+	Replace the horde with `count` idle zombies on random open tiles.
+
+	Args:
+		count (int): Number of zombies
+		seed (int, optional): Placement seed. Defaults to 0.
+	"""
+	from ObjectClass import Zombie
+
+	rng = Random(seed)
+	tiles = openTiles()
+
+	Zombie.clear()
+	for _ in range(count):
+		tile = rng.choice(tiles)
+		Zombie.pool.acquire(tile.x, tile.y)
+
+
+def spawnBullets(count, seed=0):
+	"""
+	Replace all bullets with `count` bullets at random open positions.
+
+	Args:
+		count (int): Number of bullets
+		seed (int, optional): Placement seed. Defaults to 0.
+	"""
+	from ObjectClass import Bullets
+
+	rng = Random(seed)
+	tiles = openTiles()
+
+	Bullets.pool.clear()
+	if Bullets.store is not None:
+		Bullets.store.clear()
+
+	for _ in range(count):
+		tile = rng.choice(tiles)
+		direction = rng.choice(DIRECTIONS)
+		velx = {'E': config.BULLET_SPEED, 'W': -config.BULLET_SPEED}.get(direction, 0)
+		vely = {'S': config.BULLET_SPEED, 'N': -config.BULLET_SPEED}.get(direction, 0)
+		Bullets.fire(tile.centerx, tile.centery, velx, vely, direction, rng.choice(("pistol", "shotgun", "automatic")))
+
+
+def load(mapName, zombies=0, bullets=0, seed=0):
+	"""
+	Set up a complete scenario: map, horde, bullets and a fresh survivor.
+
+	Args:
+		mapName (str): One of MAPS
+		zombies (int, optional): Number of zombies. Defaults to 0.
+		bullets (int, optional): Number of bullets. Defaults to 0.
+		seed (int, optional): Scenario seed. Defaults to 0.
+
+	Returns:
+		Main.Game: The headless game holding the scenario
+	"""
+	game = setup()
+	buildMap(mapName, seed)
+	game.reset_game_state()
+	spawnZombies(zombies, seed)
+	spawnBullets(bullets, seed)
+	return game
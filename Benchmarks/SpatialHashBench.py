@@ -0,0 +1,83 @@
+"""
+Bullet-vs-Zombie Collision Micro-Benchmark
+
+Compares the old all-pairs loop (every bullet against every zombie) with
+the SpatialHash broad phase used by Bullets.collisionLoop, for the same
+number of bullets and zombies scattered over the screen.
+
+Usage:
+	python -m Benchmarks.SpatialHashBench [counts...]
+"""
+
+import sys
+import time
+from random import Random
+
+import pygame
+
+import config
+from SpatialHash import SpatialHash
+
+
+def makeRects(rng, count, width, height):
+	"""Scatter rects of the given size uniformly over the screen."""
+	return [
+		pygame.Rect(rng.randrange(config.SCREEN_WIDTH - width), rng.randrange(config.SCREEN_HEIGHT - height), width, height)
+		for _ in range(count)
+	]
+
+
+def allPairs(bullets, zombies):
+	"""Old loop: test every bullet against every zombie."""
+	hits = 0
+	for bullet in bullets:
+		for zombie in zombies:
+			if bullet.colliderect(zombie):
+				hits += 1
+				break
+	return hits
+
+
+def hashed(bullets, zombies, grid):
+	"""New loop: rebuild the hash, then test only nearby zombies."""
+	grid.rebuild(zombies)
+	hits = 0
+	for bullet in bullets:
+		for zombie in grid.query(bullet):
+			if bullet.colliderect(zombie):
+				hits += 1
+				break
+	return hits
+
+
+def timeIt(function, *args, budget=1.0):
+	"""Best time of repeated calls, running for about `budget` seconds."""
+	best, spent, result = float('inf'), 0.0, None
+	while spent < budget:
+		start = time.perf_counter()
+		result = function(*args)
+		elapsed = time.perf_counter() - start
+		best, spent = min(best, elapsed), spent + elapsed
+	return best, result
+
+
+def main(counts=(100, 1000, 5000)):
+	"""Print the scaling table for each entity count."""
+	rng = Random(1234)
+	grid = SpatialHash()
+
+	print(f"{'entities':>9} {'all-pairs ms':>13} {'hashed ms':>10} {'speedup':>8}")
+
+	for count in counts:
+		bullets = makeRects(rng, count, config.BULLET_WIDTH, config.BULLET_HEIGHT)
+		zombies = makeRects(rng, count, config.TILE_WIDTH, config.TILE_HEIGHT)
+
+		bruteTime, bruteHits = timeIt(allPairs, bullets, zombies)
+		hashTime, hashHits = timeIt(hashed, bullets, zombies, grid)
+		assert bruteHits == hashHits, "Broad phase missed a collision"
+
+		print(f"{count:>9} {bruteTime * 1000:>13.2f} {hashTime * 1000:>10.2f} {bruteTime / hashTime:>7.1f}x")
+
+
+if __name__ == "__main__":
+	main(tuple(int(arg) for arg in sys.argv[1:]) or (100, 1000, 5000))
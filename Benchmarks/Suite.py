@@ -0,0 +1,265 @@
+"""
+Benchmark Suite for the Game's Hot Paths
+
+Times AStar.AStar (with A* and JPS searches), HPAStar.HPAStar,
+Bullets.collisionLoop, Tile.getTile and Game.render on the seeded
+scenarios in Benchmarks.Scenarios, records per-call latency percentiles,
+and compares runs against a stored JSON baseline.
+
+Usage:
+	python -m Benchmarks.Suite run [--out FILE] [--budget SECONDS] [--only PREFIX]
+	python -m Benchmarks.Suite compare BASELINE CURRENT [--threshold FRACTION] [--metric p50]
+
+compare exits with status 1 if any benchmark got slower than the
+threshold allows.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from random import Random
+
+import numpy as np
+import pygame
+
+import config
+from Benchmarks import Scenarios
+
+
+def percentile(ordered, fraction):
+	"""Nearest-rank percentile of an ascending list."""
+	index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+	return ordered[index]
+
+
+def measure(call, prepare=None, budget=0.5, minSamples=5, maxSamples=2000):
+	"""
+	Time repeated calls and summarise their latency.
+
+	Args:
+		call (callable): Code under test
+		prepare (callable, optional): Untimed setup run before every call
+		budget (float, optional): Seconds of timed calls to aim for
+		minSamples (int, optional): Calls to make even over budget
+		maxSamples (int, optional): Calls to stop at
+
+	Returns:
+		dict: samples, mean, p50, p90, p99 and max, in milliseconds
+	"""
+	if prepare:
+		prepare()
+	call()	#Warm Up
+
+	samples, spent = [], 0.0
+	while (spent < budget or len(samples) < minSamples) and len(samples) < maxSamples:
+		if prepare:
+			prepare()
+		start = time.perf_counter()
+		call()
+		elapsed = time.perf_counter() - start
+		samples.append(elapsed * 1000)
+		spent += elapsed
+
+	samples.sort()
+	return {
+		"samples": len(samples),
+		"mean": sum(samples) / len(samples),
+		"p50": percentile(samples, 0.50),
+		"p90": percentile(samples, 0.90),
+		"p99": percentile(samples, 0.99),
+		"max": samples[-1]
+	}
+
+
+def benchAStar(mapName, count, budget):
+	"""A* for a horde of idle zombies, path cache and reused paths cleared."""
+	import AStar
+	from ObjectClass import Zombie
+
+	game = Scenarios.load(mapName, zombies=count)
+
+	def prepare():
+		AStar.cache = AStar.PathCache(config.PATH_CACHE_SIZE)
+		for zombie in Zombie.List:
+			zombie.tx, zombie.ty = None, None
+			zombie.path, zombie.pathKey = [], None
+
+	return measure(lambda: AStar.AStar(game.screen, game.survivor, config.FPS, 0), prepare, budget)
+
+
+def benchJPS(mapName, count, budget):
+	"""Same as benchAStar, with Jump Point Search behind the path cache."""
+	previous, config.PATH_SEARCH = config.PATH_SEARCH, "jps"
+	try:
+		return benchAStar(mapName, count, budget)
+	finally:
+		config.PATH_SEARCH = previous
+
+
+def benchHPAStar(mapName, count, budget):
+	"""Hierarchical A* for a horde of idle zombies, leg cache and current legs cleared."""
+	import HPAStar
+	from ObjectClass import Zombie
+
+	game = Scenarios.load(mapName, zombies=count)
+	HPAStar.graph.sync()
+
+	def prepare():
+		HPAStar.graph.legs.clear()
+		for zombie in Zombie.List:
+			zombie.tx, zombie.ty = None, None
+			zombie.path, zombie.pathKey = [], None
+
+	return measure(lambda: HPAStar.HPAStar(game.screen, game.survivor, config.FPS, 0), prepare, budget)
+
+
+def benchCollisions(mapName, count, budget):
+	"""One bullet update and collision pass with `count` zombies and bullets."""
+	from ObjectClass import Bullets
+
+	Scenarios.load(mapName, zombies=count, bullets=count)
+	prepare = lambda: Scenarios.spawnBullets(count)
+
+	return measure(lambda: Bullets.collisionLoop(1 / config.FPS), prepare, budget)
+
+
+def benchGetTile(budget):
+	"""1,000 Tile.getTile lookups of random tile numbers."""
+	from TileClass import Tile
+
+	Scenarios.load("shipped")
+	numbers = [Random(0).randrange(1, Tile.totalTiles) for _ in range(1000)]
+
+	def lookups():
+		for number in numbers:
+			Tile.getTile(number)
+
+	return measure(lookups, None, budget)
+
+
+def benchRender(count, budget):
+	"""One Game.render frame on the shipped map with `count` zombies and bullets."""
+	game = Scenarios.load("shipped", zombies=count, bullets=count)
+	return measure(game.render, game.renderer.invalidate, budget)
+
+
+def cases():
+	"""Yield (name, function, args) for every benchmark in the suite."""
+	for mapName in Scenarios.MAPS:
+		for count in Scenarios.COUNTS:
+			yield f"astar/{mapName}/{count}", benchAStar, (mapName, count)
+			yield f"jps/{mapName}/{count}", benchJPS, (mapName, count)
+			yield f"hpastar/{mapName}/{count}", benchHPAStar, (mapName, count)
+			yield f"collisions/{mapName}/{count}", benchCollisions, (mapName, count)
+
+	yield "getTile/shipped/1000", benchGetTile, ()
+
+	for count in Scenarios.COUNTS:
+		yield f"render/shipped/{count}", benchRender, (count,)
+
+
+def run(budget=0.5, only=None):
+	"""
+	Run the suite.
+
+	Args:
+		budget (float, optional): Seconds of timed calls per benchmark
+		only (str, optional): Only run benchmarks whose name starts with this
+
+	Returns:
+		dict: meta (environment) and results (name -> latency summary)
+	"""
+	results = {}
+
+	for name, function, args in cases():
+		if only and not name.startswith(only):
+			continue
+
+		results[name] = function(*args, budget)
+		print(f"{name:<28} p50 {results[name]['p50']:9.3f} ms   p99 {results[name]['p99']:9.3f} ms", flush=True)
+
+	return {
+		"meta": {
+			"python": platform.python_version(),
+			"pygame": pygame.version.ver,
+			"numpy": np.__version__,
+			"machine": platform.machine(),
+			"created": time.strftime("%Y-%m-%d %H:%M:%S")
+		},
+		"results": results
+	}
+
+
+def compare(baseline, current, threshold=0.15, metric="p50"):
+	"""
+	Compare two suite runs and print the change of every shared benchmark.
+
+	Args:
+		baseline (dict): Earlier run() output
+		current (dict): Newer run() output
+		threshold (float, optional): Allowed slowdown as a fraction
+		metric (str, optional): Latency field to compare
+
+	Returns:
+		list: Names of benchmarks that regressed beyond the threshold
+	"""
+	regressions = []
+	print(f"{'benchmark':<28} {'baseline':>10} {'current':>10} {'change':>8}")
+
+	for name, old in baseline["results"].items():
+		new = current["results"].get(name)
+		if new is None:
+			continue
+
+		change = new[metric] / old[metric] - 1 if old[metric] else 0.0
+		flag = ""
+		if change > threshold:
+			regressions.append(name)
+			flag = "  REGRESSION"
+
+		print(f"{name:<28} {old[metric]:10.3f} {new[metric]:10.3f} {change:+8.1%}{flag}")
+
+	return regressions
+
+
+def main():
+	"""Command line entry point."""
+	parser = argparse.ArgumentParser(description="Zombie Apocalypse benchmark suite.")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	runParser = commands.add_parser("run", help="run the suite and write a JSON baseline")
+	runParser.add_argument("--out", default="benchmark.json", help="output file (default benchmark.json)")
+	runParser.add_argument("--budget", type=float, default=0.5, help="seconds of timed calls per benchmark")
+	runParser.add_argument("--only", help="only run benchmarks whose name starts with this")
+
+	compareParser = commands.add_parser("compare", help="flag regressions between two runs")
+	compareParser.add_argument("baseline")
+	compareParser.add_argument("current")
+	compareParser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown (default 0.15 = 15%%)")
+	compareParser.add_argument("--metric", default="p50", choices=("mean", "p50", "p90", "p99", "max"))
+
+	args = parser.parse_args()
+
+	if args.command == "run":
+		result = run(args.budget, args.only)
+		with open(args.out, "w") as file:
+			json.dump(result, file, indent=2)
+		print(f"Wrote {args.out}")
+
+	else:
+		with open(args.baseline) as file:
+			baseline = json.load(file)
+		with open(args.current) as file:
+			current = json.load(file)
+
+		regressions = compare(baseline, current, args.threshold, args.metric)
+		if regressions:
+			print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+			sys.exit(1)
+		print("No regressions")
+
+
+if __name__ == "__main__":
+	main()
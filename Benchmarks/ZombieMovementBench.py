@@ -0,0 +1,106 @@
+"""
+Zombie Movement Micro-Benchmark
+
+Compares the old per-zombie movement loop (Rect arithmetic and a rotate()
+call per axis step) with the vectorized Zombie.update_movement, stepping
+the same horde of zombies towards neighbouring tiles.
+
+Usage:
+	python -m Benchmarks.ZombieMovementBench [counts...]
+"""
+
+import sys
+import time
+from random import Random
+
+import pygame
+
+import config
+from ObjectClass import Zombie
+
+
+STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+class RectZombie(pygame.Rect):
+	"""Zombie as it was before the movement arrays: plain attributes on a Rect."""
+
+	rotate = Zombie.rotate
+
+	def __init__(self, zombie):
+		pygame.Rect.__init__(self, zombie.x, zombie.y, zombie.width, zombie.height)
+		self.tx, self.ty, self.vel = zombie.tx, zombie.ty, zombie.vel
+		self.direction, self.img = zombie.direction, zombie.img
+
+
+def perObject(zombies, delta_time):
+	"""Old loop: one zombie at a time."""
+	for zombie in zombies:
+		if zombie.tx != None and zombie.ty != None:
+
+			X = zombie.x - zombie.tx
+			Y = zombie.y - zombie.ty
+			move_distance = zombie.vel * delta_time
+
+			if X < 0:
+				zombie.x += min(move_distance, abs(X))
+				zombie.rotate('E')
+			elif X > 0:
+				zombie.x -= min(move_distance, abs(X))
+				zombie.rotate('W')
+
+			if Y > 0:
+				zombie.y -= min(move_distance, abs(Y))
+				zombie.rotate('N')
+			elif Y < 0:
+				zombie.y += min(move_distance, abs(Y))
+				zombie.rotate('S')
+
+			if abs(X) < 1 and abs(Y) < 1:
+				zombie.x = zombie.tx
+				zombie.y = zombie.ty
+				zombie.tx, zombie.ty = None, None
+
+
+def spawnHorde(rng, count):
+	"""Fill the pool with zombies on random tiles, each heading for a neighbour."""
+	Zombie.clear()
+	cols = config.SCREEN_WIDTH // config.TILE_WIDTH
+	rows = config.SCREEN_HEIGHT // config.TILE_HEIGHT
+
+	for _ in range(count):
+		col, row = rng.randrange(1, cols - 1), rng.randrange(1, rows - 1)
+		zombie = Zombie.pool.acquire(col * config.TILE_WIDTH, row * config.TILE_HEIGHT)
+		dCol, dRow = rng.choice(STEPS)
+		zombie.tx, zombie.ty = (col + dCol) * config.TILE_WIDTH, (row + dRow) * config.TILE_HEIGHT
+
+	return list(Zombie.List)
+
+
+def timeFrames(function, rng, count, legacy=False, frames=60):
+	"""Mean time per frame of `frames` movement steps at 60 FPS."""
+	zombies = spawnHorde(rng, count)
+	if legacy:
+		zombies = [RectZombie(zombie) for zombie in zombies]
+
+	start = time.perf_counter()
+	for _ in range(frames):
+		function(zombies, 1 / 60)
+	return (time.perf_counter() - start) / frames
+
+
+def main(counts=(100, 1000, 2000)):
+	"""Print the per-frame cost for each horde size."""
+	print(f"{'zombies':>8} {'per-object ms':>14} {'vectorized ms':>14} {'speedup':>8}")
+
+	for count in counts:
+		oldTime = timeFrames(perObject, Random(count), count, legacy=True)
+		newTime = timeFrames(lambda zombies, dt: Zombie.update_movement(dt), Random(count), count)
+
+		print(f"{count:>8} {oldTime * 1000:>14.3f} {newTime * 1000:>14.3f} {oldTime / newTime:>7.1f}x")
+
+	Zombie.clear()
+
+
+if __name__ == "__main__":
+	main(tuple(int(arg) for arg in sys.argv[1:]) or (100, 1000, 2000))
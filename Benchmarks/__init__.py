@@ -0,0 +1,9 @@
+"""
+Benchmarks for Zombie Apocalypse
+
+Stand-alone timing scripts for the game's hot paths. Run them from the
+repository root, e.g. python -m Benchmarks.SpatialHashBench
+
+Suite runs every hot path on the seeded scenarios in Scenarios and keeps
+JSON baselines: python -m Benchmarks.Suite run / compare
+"""
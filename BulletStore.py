@@ -0,0 +1,191 @@
+"""
+Array-Backed Bullets for Zombie Apocalypse
+
+Alternative to one Bullets rect per shot: positions, velocities, types and
+alive flags of every bullet live in preallocated NumPy arrays, so motion,
+screen-bounds culling and wall tests run as single vectorized passes.
+Select it with config.BULLET_BACKEND = "arrays".
+"""
+
+import numpy as np
+import pygame
+
+import config
+from ObjectClass import Bullets
+from Sprites import Sprites
+from TileClass import Tile
+
+
+TYPES = ("pistol", "shotgun", "automatic")
+DIRECTIONS = ("N", "E", "S", "W")
+
+
+class BulletStore:
+	"""
+	Struct-of-arrays bullet container.
+
+	Live bullets are always packed into slots [0, count); dead ones are
+	squeezed out once per frame by compact().
+	"""
+
+	def __init__(self, capacity=config.BULLET_STORE_CAPACITY):
+		"""
+		Preallocate storage for a fixed number of bullets.
+
+		Args:
+			capacity (int, optional): Maximum live bullets. Defaults to
+				config.BULLET_STORE_CAPACITY.
+		"""
+		self.capacity = capacity
+		self.count = 0
+		self.dropped = 0  # Shots lost because the store was full
+
+		self.x = np.zeros(capacity)
+		self.y = np.zeros(capacity)
+		self.velx = np.zeros(capacity)
+		self.vely = np.zeros(capacity)
+		self.type = np.zeros(capacity, dtype=np.int8)
+		self.direction = np.zeros(capacity, dtype=np.int8)
+		self.alive = np.zeros(capacity, dtype=bool)
+
+		self.damage = [Bullets.gunDmg[name] for name in TYPES]
+		self.images = [[Sprites.bullets[name][facing] for facing in DIRECTIONS] for name in TYPES]
+		self.probe = pygame.Rect(0, 0, Bullets.width, Bullets.height)
+
+	def __len__(self):
+		return self.count
+
+	def clear(self):
+		"""Remove every bullet."""
+		self.count = 0
+
+	def fire(self, x, y, velx, vely, direction, type_):
+		"""
+		Add a bullet, mirroring the Bullets constructor.
+
+		Args:
+			x (int): Starting X coordinate
+			y (int): Starting Y coordinate
+			velx (int): X velocity (pixels per second)
+			vely (int): Y velocity (pixels per second)
+			direction (str): Direction bullet is traveling ('N', 'S', 'E', 'W')
+			type_ (str): Bullet type ("pistol", "shotgun", "automatic")
+		"""
+		if self.count == self.capacity:
+			self.dropped += 1
+			return
+
+		i = self.count
+		self.x[i], self.y[i] = x, y
+		self.velx[i], self.vely[i] = velx, vely
+		self.type[i] = TYPES.index(type_)
+		self.direction[i] = DIRECTIONS.index(direction)
+		self.count += 1
+
+	def update(self, width, height, delta_time, zombieHash):
+		"""
+		Move every bullet, cull it against the screen, zombies and walls.
+
+		Args:
+			width (int): World width in pixels
+			height (int): World height in pixels
+			delta_time (float): Time elapsed since last frame in seconds
+			zombieHash (SpatialHash): Zombies bucketed for this frame
+		"""
+		n = self.count
+		if n == 0:
+			return
+
+		x, y, alive = self.x[:n], self.y[:n], self.alive[:n]
+
+		#Motion
+		x += self.velx[:n] * delta_time
+		y += self.vely[:n] * delta_time
+
+		#Screen Bounds (Same Test As Bullets.offScreen)
+		alive[:] = (x >= 0) & (y >= 0) & (x + Bullets.width <= width) & (y + Bullets.height <= height)
+
+		#Walls: Look All Four Corners Up In The Walkable Grid At Once
+		inside = np.flatnonzero(alive)
+		left = (x[inside] // Tile.width).astype(np.intp)
+		right = ((x[inside] + Bullets.width - 1) // Tile.width).astype(np.intp)
+		top = (y[inside] // Tile.height).astype(np.intp)
+		bottom = ((y[inside] + Bullets.height - 1) // Tile.height).astype(np.intp)
+
+		walkable = Tile.walkableGrid
+		clear = walkable[top, left] & walkable[top, right] & walkable[bottom, left] & walkable[bottom, right]
+
+		#Zombies: Only Bullets With A Zombie In A Neighbouring Hash Cell
+		if zombieHash.cells:
+			size = zombieHash.cellSize
+			occupied = np.array(list(zombieHash.cells.keys()), dtype=np.intp)
+			occupied = occupied[(occupied[:, 0] >= 0) & (occupied[:, 1] >= 0)]
+
+			#Mark Every Cell Within One Step Of A Zombie (Padded By One)
+			near = np.zeros((height // size + 3, width // size + 3), dtype=bool)
+			for dx in (0, 1, 2):
+				for dy in (0, 1, 2):
+					near[occupied[:, 1] + dy, occupied[:, 0] + dx] = True
+
+			cellX = (x[inside] // size).astype(np.intp) + 1
+			cellY = (y[inside] // size).astype(np.intp) + 1
+			candidates = inside[near[cellY, cellX]]
+
+			probe, types = self.probe, self.type
+			for i in candidates.tolist():
+				probe.topleft = (x[i], y[i])
+				for zombie in zombieHash.query(probe):
+					if probe.colliderect(zombie):
+						zombie.health -= self.damage[types[i]]
+						alive[i] = False
+						break
+
+		alive[inside[~clear]] = False
+		self.compact()
+
+	def compact(self):
+		"""Pack the live bullets into the front of the arrays."""
+		n = self.count
+		keep = np.flatnonzero(self.alive[:n])
+		k = len(keep)
+
+		if k != n:
+			for array in (self.x, self.y, self.velx, self.vely, self.type, self.direction):
+				array[:k] = array[keep]
+			self.count = k
+
+	def draw(self, screen, camera=None):
+		"""
+		Draw every live bullet in view with a single Surface.blits call.
+
+		Args:
+			screen: Pygame screen surface
+			camera (Camera, optional): View to draw. Defaults to drawing in
+				world coordinates.
+
+		Returns:
+			list: Screen areas drawn to
+		"""
+		n = self.count
+		if n == 0:
+			return []
+
+		shown = slice(0, n)
+		x, y = self.x[:n], self.y[:n]
+
+		if camera is not None:
+			view = camera.rect
+			shown = np.flatnonzero((x > view.left - Bullets.width) & (x < view.right)
+				& (y > view.top - Bullets.height) & (y < view.bottom))
+			x, y = x[shown] - view.x, y[shown] - view.y
+
+		images = self.images
+		return screen.blits(
+			[
+				(images[kind][facing], (bx, by))
+				for kind, facing, bx, by in zip(
+					self.type[shown].tolist(), self.direction[shown].tolist(),
+					x.tolist(), y.tolist()
+				)
+			]
+		)
@@ -0,0 +1,78 @@
+"""
+Camera for Zombie Apocalypse
+
+A screen-sized viewport onto the world that follows the survivor. Entities
+keep world coordinates (pixels on the whole map); the camera's offset
+turns them into screen coordinates when drawing, and turns mouse clicks
+back into world coordinates.
+"""
+
+import pygame
+
+import config
+from TileClass import Tile
+
+
+class Camera:
+	"""
+	Viewport onto the world, kept inside the world's bounds.
+
+	When the world is no larger than the screen, the camera never moves.
+	"""
+
+	def __init__(self, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT):
+		"""
+		Create a camera at the world's top-left corner.
+
+		Args:
+			width (int, optional): Viewport width in pixels. Defaults to
+				config.SCREEN_WIDTH.
+			height (int, optional): Viewport height in pixels. Defaults to
+				config.SCREEN_HEIGHT.
+		"""
+		self.rect = pygame.Rect(0, 0, width, height)
+		self.scrolling = True  # False while the whole world is in view at offset (0, 0)
+
+	@property
+	def offset(self):
+		"""tuple: World position of the screen's top-left corner."""
+		return self.rect.topleft
+
+	def follow(self, target):
+		"""
+		Centre the view on a target, without showing anything past the world's edge.
+
+		Args:
+			target (pygame.Rect): What to follow (the survivor)
+		"""
+		rows, cols = Tile.walkableGrid.shape
+		world = pygame.Rect(0, 0, cols * Tile.width, rows * Tile.height)
+
+		self.rect.center = target.center
+		self.rect.clamp_ip(world)
+		self.scrolling = self.rect.topleft != (0, 0) or not self.rect.contains(world)
+
+	def toWorld(self, x, y):
+		"""
+		Convert a screen position to world coordinates.
+
+		Args:
+			x (int): Screen X in pixels
+			y (int): Screen Y in pixels
+
+		Returns:
+			tuple: (x, y) in world pixels
+		"""
+		return x + self.rect.x, y + self.rect.y
+
+	def visible(self, rect):
+		"""
+		Check whether something overlaps the view.
+
+		Args:
+			rect (pygame.Rect): Area in world pixels
+
+		Returns:
+			bool: True if any of it is on screen
+		"""
+		return self.rect.colliderect(rect)
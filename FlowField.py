@@ -0,0 +1,118 @@
+"""
+Flow Field Pathfinding for Zombie Apocalypse
+
+Runs a single breadth-first search outward from the player's tile and
+stores, for every tile, the distance to the player and the direction of the
+next tile on a shortest path. Zombies then look up their next step in
+constant time, so the cost of pathfinding no longer grows with the number
+of zombies.
+"""
+
+import numpy as np
+
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+#(dCol, dRow) For Each Direction Index: N, E, S, W
+OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+class Field:
+	"""
+	Shared distance/direction field rooted at the player's tile.
+
+	The field is only rebuilt when the player changes tile or a wall is edited
+	(detected through Tile.mapVersion).
+	"""
+
+	distance = None   # (rows, cols) steps to the goal, -1 if unreachable
+	direction = None  # (rows, cols) index into OFFSETS of the next step
+	goal = None       # Tile number the field was built for
+	mapVersion = -1
+
+	@staticmethod
+	def build(goalTile):
+		"""
+		Rebuild the field from the goal tile.
+
+		Both the distance map and the per-cell direction are computed as
+		whole-array operations on Tile.walkableGrid.
+
+		Args:
+			goalTile (Tile): Tile the zombies should converge on
+		"""
+		distance = Tile.distanceMap(goalTile.col, goalTile.row)
+
+		#Point Every Cell At Its Closest Neighbour (Unreachable = Infinite)
+		steps = np.where(distance < 0, np.inf, distance)
+		padded = np.pad(steps, 1, constant_values=np.inf)
+		neighbours = np.stack((
+			padded[:-2, 1:-1],		#N
+			padded[1:-1, 2:],		#E
+			padded[2:, 1:-1],		#S
+			padded[1:-1, :-2]		#W
+		))
+
+		Field.distance = distance
+		Field.direction = np.argmin(neighbours, axis=0)
+		Field.goal = goalTile.number
+		Field.mapVersion = Tile.mapVersion
+
+	@staticmethod
+	def update(survivor):
+		"""
+		Rebuild the field if the player moved to a new tile or a wall changed.
+
+		Args:
+			survivor: Player character
+		"""
+		goalTile = survivor.getTile()
+
+		if goalTile.number != Field.goal or Tile.mapVersion != Field.mapVersion:
+			Field.build(goalTile)
+
+	@staticmethod
+	def getNextTile(tile):
+		"""
+		Get the next tile towards the goal from the given tile.
+
+		Args:
+			tile (Tile): Tile to step from
+
+		Returns:
+			Tile: Next tile on a shortest path, or None if the tile cannot
+			reach the goal or is already next to it
+		"""
+		#Unreachable, or Already Next To The Player
+		if Field.distance[tile.row, tile.col] <= 1:
+			return None
+
+		dCol, dRow = OFFSETS[Field.direction[tile.row, tile.col]]
+		return Tile.at(tile.col + dCol, tile.row + dRow)
+
+
+def FlowField(screen, survivor, FPS, totalFrames):
+	"""
+	Steer all idle zombies along the shared flow field towards the player.
+
+	Drop-in alternative to AStar.AStar with the same signature.
+
+	Args:
+		screen: Pygame screen surface
+		survivor: Player character
+		FPS (int): Frames per second
+		totalFrames (int): Total frames elapsed
+	"""
+	Field.update(survivor)
+
+	for zombie in Zombie.List:
+
+		#Zombie Still Walking To Its Current Target
+		if zombie.tx != None or zombie.ty != None:
+			continue
+
+		nextTile = Field.getNextTile(zombie.getTile())
+
+		if nextTile is not None:
+			zombie.setTarget(nextTile)
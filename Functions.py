@@ -4,8 +4,108 @@ Utility Functions for Zombie Apocalypse
 Contains helper functions used throughout the game.
 """
 
+from collections import OrderedDict
+
 import pygame
 
+import config
+
+
+fonts = {}  # (name, size, bold) -> pygame Font
+
+
+def getFont(name, size, bold=False):
+	"""
+	Get a system font, looking it up only the first time it is asked for.
+
+	Args:
+		name (str): Font name
+		size (int): Font size
+		bold (bool, optional): Use bold font. Defaults to False.
+
+	Returns:
+		pygame.font.Font: The shared font object
+	"""
+	key = (name, size, bold)
+	font = fonts.get(key)
+
+	if font is None:
+		font = pygame.font.SysFont(name, size, bold=bold)
+		fonts[key] = font
+
+	return font
+
+
+class TextCache:
+	"""
+	Bounded LRU cache of rendered text surfaces keyed by (text, font, colour).
+
+	HUD lines and menu labels are the same string frame after frame, so
+	they are only rendered again when their text actually changes.
+	"""
+
+	def __init__(self, size):
+		"""
+		Create an empty cache.
+
+		Args:
+			size (int): Maximum number of surfaces kept
+		"""
+		self.size = size
+		self.surfaces = OrderedDict()
+		self.hits, self.misses, self.evictions = 0, 0, 0
+
+	def render(self, text, font, color):
+		"""
+		Get the rendered surface for a string, rendering only on a cache miss.
+
+		Args:
+			text (str): Text to render
+			font (tuple): (name, size, bold) as passed to getFont()
+			color (tuple): RGB color
+
+		Returns:
+			pygame.Surface: Antialiased text (shared, do not draw on it)
+		"""
+		key = (text, font, tuple(color))
+		surface = self.surfaces.get(key)
+
+		if surface is not None:
+			self.surfaces.move_to_end(key)
+			self.hits += 1
+			return surface
+
+		self.misses += 1
+		surface = getFont(*font).render(text, True, color)
+		self.surfaces[key] = surface
+
+		if len(self.surfaces) > self.size:
+			self.surfaces.popitem(last=False)	#Evict Least Recently Used
+			self.evictions += 1
+
+		return surface
+
+	def stats(self):
+		"""
+		Get the cache counters.
+
+		Returns:
+			dict: hits, misses, evictions, stored surfaces, loaded fonts and hit rate
+		"""
+		lookups = self.hits + self.misses
+
+		return {
+			"hits": self.hits,
+			"misses": self.misses,
+			"evictions": self.evictions,
+			"surfaces": len(self.surfaces),
+			"fonts": len(fonts),
+			"hitRate": self.hits / lookups if lookups else 0.0
+		}
+
+
+textCache = TextCache(config.TEXT_CACHE_SIZE)
+
 
 def displayText(screen, text, x, y, size=10, color=(255, 255, 255), font_type='capture it'):
 	"""
@@ -20,14 +120,15 @@ def displayText(screen, text, x, y, size=10, color=(255, 255, 255), font_type='c
 		color (tuple, optional): RGB color. Defaults to white (255, 255, 255).
 		font_type (str, optional): Font name. Defaults to 'capture it'.
 
+	Returns:
+		pygame.Rect: Screen area drawn to
+
 	Raises:
 		Exception: If there's an error rendering the font
 	"""
 	try:
-		text = str(text)
-		font = pygame.font.SysFont(font_type, size)
-		text_surface = font.render(text, True, color)
-		screen.blit(text_surface, (x, y))
+		text_surface = textCache.render(str(text), (font_type, size, False), color)
+		return screen.blit(text_surface, (x, y))
 
 	except Exception as e:
 		print("Font Error!")
@@ -48,18 +149,21 @@ def displayTextWithShadow(screen, text, x, y, size=10, color=(255, 255, 255), sh
 		shadow_color (tuple, optional): Shadow color. Defaults to black.
 		font_type (str, optional): Font name. Defaults to 'arial'.
 		bold (bool, optional): Use bold font. Defaults to False.
+
+	Returns:
+		pygame.Rect: Screen area drawn to (text and shadow)
 	"""
 	try:
 		text = str(text)
-		font = pygame.font.SysFont(font_type, size, bold=bold)
+		font = (font_type, size, bold)
 
 		# Render shadow (offset by a few pixels)
-		shadow_surface = font.render(text, True, shadow_color)
-		screen.blit(shadow_surface, (x + 3, y + 3))
+		shadow_surface = textCache.render(text, font, shadow_color)
+		shadow_rect = screen.blit(shadow_surface, (x + 3, y + 3))
 
 		# Render main text
-		text_surface = font.render(text, True, color)
-		screen.blit(text_surface, (x, y))
+		text_surface = textCache.render(text, font, color)
+		return screen.blit(text_surface, (x, y)).union(shadow_rect)
 
 	except Exception as e:
 		print("Font Error!")
@@ -0,0 +1,468 @@
+"""
+Hierarchical Pathfinding for Zombie Apocalypse
+
+HPA* over the tile grid, for maps too large to search tile by tile. The
+grid is split into square clusters. Wherever two neighbouring clusters
+share an open stretch of border, entrance cells are placed on both sides,
+and the shortest in-cluster distances between the entrances of each
+cluster are precomputed. A query searches this small entrance graph and
+then refines only the first leg of the route into tiles.
+
+When a wall is placed, only the clusters around the changed tiles have
+their entrances and distances rebuilt. Works for any grid shape.
+"""
+
+from collections import OrderedDict
+from heapq import heappush, heappop
+
+import numpy as np
+
+import config
+from AStar import search
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+INF = float('inf')
+
+
+class ClusterGraph:
+	"""
+	Abstract graph of cluster entrances over the tile grid.
+
+	Cells are flat indices (row * cols + col). Entrances come in pairs,
+	one cell on each side of a cluster border; `inter` holds the single
+	step across the border and `intra` the precomputed distances between
+	entrances of the same cluster.
+	"""
+
+	def __init__(self, size=config.HPA_CLUSTER_SIZE):
+		"""
+		Create a graph for the current map.
+
+		Args:
+			size (int, optional): Cluster edge in tiles. Defaults to
+				config.HPA_CLUSTER_SIZE.
+		"""
+		self.size = size
+		self.reset()
+
+	def reset(self):
+		"""Take a fresh copy of the map and build every cluster."""
+		self.rows, self.cols = Tile.walkableGrid.shape
+		self.clusterRows = -(-self.rows // self.size)
+		self.clusterCols = -(-self.cols // self.size)
+
+		self.walkable = Tile.walkableGrid.copy()
+		self.cost = Tile.costGrid.copy()
+		self.mapVersion = Tile.mapVersion
+
+		#Flat Python Lists Are Much Faster To Index Than The Arrays
+		self.open = self.walkable.ravel().tolist()
+		self.enter = self.cost.ravel().tolist()
+
+		self.borders = {}  # (cluster, neighbour cluster) -> [(cell, neighbour cell)]
+		self.inter = {}    # Cell -> {cell across a border: cost}
+		self.nodes = {}    # Cluster -> set of entrance cells
+		self.intra = {}    # Cluster -> {entrance: {entrance: in-cluster distance}}
+		self.rebuilds = 0  # Clusters rebuilt since the graph was created
+
+		self.legs = OrderedDict()  # (start, goal) -> first leg, LRU, dropped on any map change
+		self.toGoal = (None, {})   # Goal cell and in-cluster distances to it
+
+		clusters = range(self.clusterRows * self.clusterCols)
+		self.rebuild(set(clusters))
+
+	def clusterOf(self, cell):
+		"""
+		Get the cluster a cell belongs to.
+
+		Args:
+			cell (int): Flat cell index
+
+		Returns:
+			int: Cluster index (row-major over clusters)
+		"""
+		row, col = divmod(cell, self.cols)
+		return (row // self.size) * self.clusterCols + col // self.size
+
+	def bounds(self, cluster):
+		"""
+		Get the cell rectangle of a cluster.
+
+		Args:
+			cluster (int): Cluster index
+
+		Returns:
+			tuple: (first row, end row, first col, end col), ends exclusive
+		"""
+		clusterRow, clusterCol = divmod(cluster, self.clusterCols)
+		row, col = clusterRow * self.size, clusterCol * self.size
+		return row, min(row + self.size, self.rows), col, min(col + self.size, self.cols)
+
+	def neighbours(self, cluster):
+		"""
+		Get the clusters sharing a border with a cluster, below and right first.
+
+		Args:
+			cluster (int): Cluster index
+
+		Returns:
+			list: Neighbouring cluster indices
+		"""
+		clusterRow, clusterCol = divmod(cluster, self.clusterCols)
+
+		surrounding = []
+		if clusterCol < self.clusterCols - 1:
+			surrounding.append(cluster + 1)
+		if clusterRow < self.clusterRows - 1:
+			surrounding.append(cluster + self.clusterCols)
+		if clusterCol > 0:
+			surrounding.append(cluster - 1)
+		if clusterRow > 0:
+			surrounding.append(cluster - self.clusterCols)
+		return surrounding
+
+	def findEntrances(self, first, second):
+		"""
+		Place entrance pairs along the border between two clusters.
+
+		Each maximal run of cells open on both sides gets one pair in its
+		middle, or one at each end if it is long.
+
+		Args:
+			first (int): Cluster above or left of `second`
+
+		Returns:
+			list: (cell in first, cell in second) pairs
+		"""
+		row0, row1, col0, col1 = self.bounds(first)
+		cols, open_ = self.cols, self.open
+
+		if second // self.clusterCols == first // self.clusterCols:
+			#Vertical Border: Walk Down The Last Column Of `first`
+			pairs = [(row * cols + col1 - 1, row * cols + col1) for row in range(row0, row1)]
+		else:
+			#Horizontal Border: Walk Along The Last Row Of `first`
+			pairs = [((row1 - 1) * cols + col, row1 * cols + col) for col in range(col0, col1)]
+
+		entrances, run = [], []
+		for pair in pairs + [None]:
+			if pair is not None and open_[pair[0]] and open_[pair[1]]:
+				run.append(pair)
+				continue
+
+			if len(run) >= config.HPA_LONG_ENTRANCE:
+				entrances += [run[0], run[-1]]
+			elif run:
+				entrances.append(run[len(run) // 2])
+			run = []
+
+		return entrances
+
+	def distances(self, source, cluster, reverse=False):
+		"""
+		Dijkstra from one cell to every cell of its cluster, staying inside it.
+
+		Args:
+			source (int): Flat cell index inside the cluster
+			cluster (int): Cluster to search
+			reverse (bool, optional): Measure the cost of reaching `source`
+				from each cell instead of the other way round. Defaults to False.
+
+		Returns:
+			dict: Cell -> distance, for every reachable cell
+		"""
+		row0, row1, col0, col1 = self.bounds(cluster)
+		cols, open_, enter = self.cols, self.open, self.enter
+
+		dist = {source: 0}
+		heap = [(0, source)]
+
+		while heap:
+			d, cell = heappop(heap)
+			if d > dist[cell]:
+				continue
+
+			row, col = divmod(cell, cols)
+			surrounding = []
+			if row > row0:
+				surrounding.append(cell - cols)
+			if col < col1 - 1:
+				surrounding.append(cell + 1)
+			if row < row1 - 1:
+				surrounding.append(cell + cols)
+			if col > col0:
+				surrounding.append(cell - 1)
+
+			for node in surrounding:
+				if not open_[node]:
+					continue
+
+				value = d + (enter[cell] if reverse else enter[node])
+				if value < dist.get(node, INF):
+					dist[node] = value
+					heappush(heap, (value, node))
+
+		return dist
+
+	def rebuild(self, dirty):
+		"""
+		Rebuild the entrances and distances of a set of clusters.
+
+		Every border touching a dirty cluster is re-scanned, which can move
+		entrances in the clusters next to it, so their distances are redone too.
+
+		Args:
+			dirty (set): Cluster indices whose cells changed
+		"""
+		borders = {(min(cluster, neighbour), max(cluster, neighbour)) for cluster in dirty for neighbour in self.neighbours(cluster)}
+		affected = set(dirty).union(*borders)
+
+		for border in borders:
+			for cell, other in self.borders.pop(border, ()):
+				del self.inter[cell][other]
+				del self.inter[other][cell]
+
+			entrances = self.findEntrances(*border)
+			for cell, other in entrances:
+				self.inter.setdefault(cell, {})[other] = self.enter[other]
+				self.inter.setdefault(other, {})[cell] = self.enter[cell]
+			self.borders[border] = entrances
+
+		for cluster in affected:
+			nodes = set()
+			for neighbour in self.neighbours(cluster):
+				border = (min(cluster, neighbour), max(cluster, neighbour))
+				for pair in self.borders.get(border, ()):
+					nodes.add(pair[0] if cluster == border[0] else pair[1])
+
+			self.nodes[cluster] = nodes
+			self.intra[cluster] = {}
+			for node in nodes:
+				dist = self.distances(node, cluster)
+				self.intra[cluster][node] = {other: dist[other] for other in nodes if other != node and other in dist}
+
+			self.rebuilds += 1
+
+	def sync(self):
+		"""
+		Bring the graph up to date with the map.
+
+		Changed cells are found by diffing against the graph's copy of the
+		grid, and only their clusters (and the ones next to them) are rebuilt.
+		"""
+		if Tile.walkableGrid.shape != (self.rows, self.cols):
+			self.reset()
+			return
+
+		if Tile.mapVersion == self.mapVersion:
+			return
+
+		changed = np.flatnonzero((self.walkable != Tile.walkableGrid) | (self.cost != Tile.costGrid))
+
+		self.walkable[...] = Tile.walkableGrid
+		self.cost[...] = Tile.costGrid
+		self.mapVersion = Tile.mapVersion
+
+		flatWalkable, flatCost = self.walkable.ravel(), self.cost.ravel()
+		for cell in changed.tolist():
+			self.open[cell] = bool(flatWalkable[cell])
+			self.enter[cell] = int(flatCost[cell])
+
+		self.rebuild({self.clusterOf(cell) for cell in changed.tolist()})
+		self.legs.clear()
+		self.toGoal = (None, {})
+
+	def refine(self, start, goal, cluster):
+		"""
+		Get the tile-level path between two cells of one cluster.
+
+		Args:
+			start (int): Flat cell index to search from
+			goal (int): Flat cell index to reach
+			cluster (int): Cluster both cells are in
+
+		Returns:
+			list: Flat cell indices from start to goal, or an empty list
+		"""
+		row0, row1, col0, col1 = self.bounds(cluster)
+		cols = self.cols
+
+		cells = search(
+			self.walkable[row0:row1, col0:col1],
+			(start % cols - col0, start // cols - row0),
+			(goal % cols - col0, goal // cols - row0),
+			self.cost[row0:row1, col0:col1]
+		)
+		return [(row + row0) * cols + col + col0 for col, row in cells]
+
+	def firstLeg(self, start, goal):
+		"""
+		Find a route through the entrance graph and refine its first leg.
+
+		The leg runs from `start` out of its cluster and across the next
+		cluster to its exit entrance, or all the way to `goal` if that is
+		closer. Later legs are refined when a zombie gets there.
+
+		Args:
+			start (int): Flat cell index to search from
+			goal (int): Flat cell index to reach
+
+		Returns:
+			list: Flat cell indices from start, ending at goal if the route
+			is complete; empty if the goal cannot be reached
+		"""
+		key = (start, goal)
+		path = self.legs.get(key)
+
+		if path is None:
+			path = self.searchLeg(start, goal)
+			self.legs[key] = path
+			if len(self.legs) > config.PATH_CACHE_SIZE:
+				self.legs.popitem(last=False)	#Evict Least Recently Used
+		else:
+			self.legs.move_to_end(key)
+
+		return path
+
+	def searchLeg(self, start, goal):
+		"""
+		Uncached firstLeg.
+
+		Args:
+			start (int): Flat cell index to search from
+			goal (int): Flat cell index to reach
+
+		Returns:
+			list: Flat cell indices, as for firstLeg
+		"""
+		startCluster, goalCluster = self.clusterOf(start), self.clusterOf(goal)
+
+		if startCluster == goalCluster:
+			path = self.refine(start, goal, startCluster)
+			if path:
+				return path
+
+		#Temporary Edges: Start To Its Cluster's Entrances, Entrances To Goal
+		fromStart = self.distances(start, startCluster)
+		if self.toGoal[0] != goal:
+			self.toGoal = (goal, self.distances(goal, goalCluster, reverse=True))
+		toGoal = self.toGoal[1]
+		startEdges = {node: fromStart[node] for node in self.nodes[startCluster] if node in fromStart}
+		goalEdges = {node: toGoal[node] for node in self.nodes[goalCluster] if node in toGoal}
+
+		#A* Over Entrances; Manhattan Distance Stays Admissible Since Every Step Costs >= TILE_STEP_COST
+		cols, step = self.cols, config.TILE_STEP_COST
+		goalRow, goalCol = divmod(goal, cols)
+
+		def heuristic(cell):
+			row, col = divmod(cell, cols)
+			return step * (abs(row - goalRow) + abs(col - goalCol))
+
+		G, parent = {start: 0}, {start: None}
+		heap = [(heuristic(start), start)]
+		closed = set()
+
+		while heap:
+			current = heappop(heap)[1]
+			if current in closed:
+				continue
+			if current == goal:
+				break
+			closed.add(current)
+
+			if current == start:
+				edges = list(startEdges.items())
+			else:
+				edges = list(self.intra[self.clusterOf(current)].get(current, {}).items())
+			edges += self.inter.get(current, {}).items()
+			if current in goalEdges:
+				edges.append((goal, goalEdges[current]))
+
+			for node, cost in edges:
+				value = G[current] + cost
+				if value < G.get(node, INF):
+					G[node] = value
+					parent[node] = current
+					heappush(heap, (value + heuristic(node), node))
+		else:
+			return []
+
+		route = []
+		node = goal
+		while node is not None:
+			route.append(node)
+			node = parent[node]
+		route.reverse()
+
+		#Refine Hops Until The Leg Has Crossed Into Another Cluster And Through It
+		path, crossed = [start], False
+		for first, second in zip(route, route[1:]):
+			cluster = self.clusterOf(first)
+
+			if cluster == self.clusterOf(second):
+				path += self.refine(first, second, cluster)[1:]
+				if crossed:
+					break
+			else:
+				path.append(second)
+				crossed = True
+
+		return path
+
+	def stats(self):
+		"""
+		Get the graph size.
+
+		Returns:
+			dict: clusters, entrance cells, intra-cluster edges and clusters rebuilt
+		"""
+		return {
+			"clusters": self.clusterRows * self.clusterCols,
+			"entrances": sum(len(nodes) for nodes in self.nodes.values()),
+			"edges": sum(len(edges) for intra in self.intra.values() for edges in intra.values()),
+			"rebuilds": self.rebuilds
+		}
+
+
+graph = ClusterGraph()
+
+
+def HPAStar(screen, survivor, FPS, totalFrames):
+	"""
+	Steer all idle zombies along hierarchical paths to the player.
+
+	Drop-in alternative to AStar.AStar with the same signature.
+
+	Args:
+		screen: Pygame screen surface
+		survivor: Player character
+		FPS (int): Frames per second
+		totalFrames (int): Total frames elapsed
+	"""
+	graph.sync()
+
+	survivorTile = survivor.getTile()
+	pathKey = (survivorTile.number, Tile.mapVersion)
+	goal = survivorTile.row * graph.cols + survivorTile.col
+
+	for zombie in Zombie.List:
+
+		if zombie.tx != None or zombie.ty != None:
+			continue
+
+		zombieTile = zombie.getTile()
+
+		#Same Goal And Map: Keep Walking The Current Leg While It Has Tiles Left
+		if zombie.pathKey == pathKey and len(zombie.path) > 3 and zombie.path[1] is zombieTile:
+			path = zombie.path[1:]
+		else:
+			cells = graph.firstLeg(zombieTile.row * graph.cols + zombieTile.col, goal)
+			path = [Tile.at(cell % graph.cols, cell // graph.cols) for cell in cells]
+
+		zombie.path, zombie.pathKey = path, pathKey
+
+		#Move Zombies - Chase The Player (Stop On The Adjacent Tile)
+		if len(path) > 2:
+			zombie.setTarget(path[1])
@@ -0,0 +1,232 @@
+"""
+Headless Fast-Forward Simulation for Zombie Apocalypse
+
+Runs the game logic (Game.update_game_state) with no window, no sound, no
+drawing and no frame limiter, as fast as the CPU allows, for a given
+number of simulated seconds. Input is scripted or random. When the
+survivor dies a new game starts, so long runs cover many games.
+
+Usage:
+	python Headless.py [--seconds N] [--dt SECONDS] [--seed N] [--script FILE] [--record FILE]
+
+A script is a JSON list of [seconds, "keys"] steps played in a loop,
+where keys is a space-separated mix of up, down, left, right, fire and
+switch, e.g. [[1.5, "up fire"], [0.5, "left"], [0.2, "switch"]].
+
+With --record the first game is saved for Replay.py, which reproduces
+it exactly (e.g. to profile one heavy session before and after a change).
+"""
+
+import argparse
+import json
+import random
+import time
+
+import config
+from Interaction import InputState
+
+
+class RandomInput:
+	"""Random player: holds a random direction for a while and fires often."""
+
+	def __init__(self, seed=0, fireChance=0.6):
+		"""
+		Create a random input source.
+
+		Args:
+			seed (int, optional): Random seed. Defaults to 0.
+			fireChance (float, optional): Chance of holding fire during
+				each hold. Defaults to 0.6.
+		"""
+		self.rng = random.Random(seed)
+		self.fireChance = fireChance
+		self.keys, self.remaining = (), 0.0
+
+	def next(self, delta_time):
+		"""
+		Get the input for the next tick.
+
+		Args:
+			delta_time (float): Simulated tick length in seconds
+
+		Returns:
+			InputState: Input for this tick
+		"""
+		rng = self.rng
+		self.remaining -= delta_time
+
+		gunSwitches = 0
+		if self.remaining <= 0:
+			self.remaining = rng.uniform(0.2, 1.5)
+			self.keys = (rng.choice(("up", "down", "left", "right", None)),)
+			if rng.random() < self.fireChance:
+				self.keys += ("fire",)
+			if rng.random() < 0.1:
+				gunSwitches = 1
+
+		return makeState(self.keys, gunSwitches)
+
+
+class ScriptedInput:
+	"""Plays a fixed list of timed key steps in a loop."""
+
+	def __init__(self, steps):
+		"""
+		Create a scripted input source.
+
+		Args:
+			steps (list): [seconds, "keys"] pairs, see the module docstring
+
+		Raises:
+			ValueError: If the script is empty, has a negative duration or
+				lasts 0 seconds in total (it would never advance)
+		"""
+		self.steps = [(float(seconds), keys.split()) for seconds, keys in steps]
+
+		if not self.steps:
+			raise ValueError("Input script has no steps")
+		if any(seconds < 0 for seconds, _ in self.steps):
+			raise ValueError("Input script has a step with a negative duration")
+		if sum(seconds for seconds, _ in self.steps) <= 0:
+			raise ValueError("Input script lasts 0 seconds in total")
+
+		self.index, self.remaining = 0, self.steps[0][0]
+		self.switched = False
+
+	def next(self, delta_time):
+		"""
+		Get the input for the next tick.
+
+		Args:
+			delta_time (float): Simulated tick length in seconds
+
+		Returns:
+			InputState: Input for this tick
+		"""
+		while self.remaining <= 0:
+			self.index = (self.index + 1) % len(self.steps)
+			self.remaining += self.steps[self.index][0]
+			self.switched = False
+
+		self.remaining -= delta_time
+		keys = self.steps[self.index][1]
+
+		#Switching Guns Is A Key Press, Not A Held Key
+		gunSwitches = 0
+		if "switch" in keys and not self.switched:
+			gunSwitches, self.switched = 1, True
+
+		return makeState(keys, gunSwitches)
+
+
+def makeState(keys, gunSwitches=0):
+	"""
+	Build an InputState from key names.
+
+	Args:
+		keys (iterable): Held keys out of up, down, left, right, fire
+		gunSwitches (int, optional): Gun switches this tick. Defaults to 0.
+
+	Returns:
+		InputState: Matching input
+	"""
+	return InputState(
+		up="up" in keys, down="down" in keys, left="left" in keys, right="right" in keys,
+		fire="fire" in keys, gunSwitches=gunSwitches
+	)
+
+
+def simulate(seconds, delta_time=1 / config.FPS, inputs=None, seed=0, recorder=None):
+	"""
+	Run the game logic headless for a number of simulated seconds.
+
+	Args:
+		seconds (float): Simulated time to run
+		delta_time (float, optional): Fixed tick length in seconds.
+			Defaults to one frame at config.FPS.
+		inputs (optional): Object with next(delta_time) -> InputState.
+			Defaults to RandomInput(seed).
+		seed (int, optional): Seed for the game's own randomness (spawn
+			points, zombie speeds). Defaults to 0.
+		recorder (Replay.Recorder, optional): Records the first game.
+			Defaults to None.
+
+	Returns:
+		dict: ticks, simulated and wall-clock seconds, ticks per second,
+		speed-up over real time, games played, kills and peak zombies
+	"""
+	import Main  # Imported here so the module can be read without pygame
+	from ObjectClass import Zombie
+
+	game = Main.Game(headless=True, recorder=recorder)
+	inputs = inputs if inputs is not None else RandomInput(seed)
+
+	if recorder is not None:
+		recorder.start(game, seed)
+	else:
+		game.start_session(seed)
+
+	ticks = int(seconds / delta_time)
+	games, kills, peak = 1, 0, 0
+
+	start = time.perf_counter()
+	for _ in range(ticks):
+		game.update_game_state(delta_time, inputs.next(delta_time))
+		peak = max(peak, len(Zombie.List))
+
+		if game.check_game_over():
+			if game.recorder is not None:
+				game.recorder.finish(game)
+				game.recorder = None
+
+			kills += game.survivor.kills
+			games += 1
+			game.reset_game_state()
+
+	wall = time.perf_counter() - start
+	kills += game.survivor.kills
+
+	return {
+		"ticks": ticks,
+		"simSeconds": ticks * delta_time,
+		"wallSeconds": wall,
+		"ticksPerSecond": ticks / wall if wall else float('inf'),
+		"speedup": ticks * delta_time / wall if wall else float('inf'),
+		"games": games,
+		"kills": kills,
+		"peakZombies": peak
+	}
+
+
+def main():
+	"""Parse the command line, run the simulation and print a report."""
+	parser = argparse.ArgumentParser(description="Run Zombie Apocalypse headless and fast-forwarded.")
+	parser.add_argument("--seconds", type=float, default=600, help="simulated seconds to run (default 600)")
+	parser.add_argument("--dt", type=float, default=1 / config.FPS, help="fixed tick length in seconds")
+	parser.add_argument("--seed", type=int, default=0, help="random seed")
+	parser.add_argument("--script", help="JSON input script; random input if omitted")
+	parser.add_argument("--record", metavar="FILE", help="record the first game for Replay.py")
+	args = parser.parse_args()
+
+	inputs = None
+	if args.script:
+		with open(args.script) as file:
+			try:
+				inputs = ScriptedInput(json.load(file))
+			except ValueError as error:
+				parser.error(f"{args.script}: {error}")
+
+	recorder = None
+	if args.record:
+		from Replay import Recorder
+		recorder = Recorder(args.record)
+
+	result = simulate(args.seconds, args.dt, inputs, args.seed, recorder)
+
+	print(f"Simulated {result['simSeconds']:.0f} s in {result['wallSeconds']:.2f} s "
+		f"({result['ticksPerSecond']:.0f} ticks/s, {result['speedup']:.0f}x real time)")
+	print(f"Games: {result['games']}  Kills: {result['kills']}  Peak zombies: {result['peakZombies']}")
+
+
+if __name__ == "__main__":
+	main()
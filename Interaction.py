@@ -12,7 +12,81 @@ from TileClass import Tile
 from ObjectClass import Bullets
 
 
-def interaction(screen, survivor, paused=False):
+class InputState:
+	"""
+	One frame of player input, independent of where it came from.
+
+	The game reads it from pygame with fromPygame(); headless runs and
+	replays build it directly.
+	"""
+
+	def __init__(self, up=False, down=False, left=False, right=False, fire=False,
+			gunSwitches=0, pause=False, quit=False, clicks=(), toggleProfiler=False):
+		"""
+		Create an input frame.
+
+		Args:
+			up, down, left, right (bool, optional): Movement keys held
+			fire (bool, optional): Fire key held
+			gunSwitches (int, optional): Times the switch-gun key was pressed
+			pause (bool, optional): Pause key pressed
+			quit (bool, optional): Window close requested
+			clicks (sequence, optional): Screen positions clicked (place walls)
+			toggleProfiler (bool, optional): Profiler key pressed
+		"""
+		self.up, self.down, self.left, self.right = up, down, left, right
+		self.fire = fire
+		self.gunSwitches = gunSwitches
+		self.pause = pause
+		self.quit = quit
+		self.clicks = list(clicks)
+		self.toggleProfiler = toggleProfiler
+
+	@staticmethod
+	def fromPygame():
+		"""
+		Read this frame's input from the pygame event queue and keyboard.
+
+		Returns:
+			InputState: Current input
+		"""
+		state = InputState()
+
+		#Mouse Pointer Coordinates
+		Mpos = pygame.mouse.get_pos()
+
+		for event in pygame.event.get():
+
+			#For Window close button
+			if event.type == pygame.QUIT:
+				state.quit = True
+
+			if event.type == pygame.KEYDOWN:
+				#Handle ESC key for pause
+				if event.key == pygame.K_ESCAPE:
+					state.pause = True
+
+				#Switch between guns
+				if event.key == pygame.K_LSHIFT:
+					state.gunSwitches += 1
+
+				#Show or hide the frame profiler
+				if event.key == pygame.K_F3:
+					state.toggleProfiler = True
+
+			#Create Solid Tiles: Mouse Click
+			if event.type == pygame.MOUSEBUTTONDOWN:
+				state.clicks.append(Mpos)
+
+		keys = pygame.key.get_pressed()
+		state.up, state.down = keys[pygame.K_UP], keys[pygame.K_DOWN]
+		state.right, state.left = keys[pygame.K_RIGHT], keys[pygame.K_LEFT]
+		state.fire = keys[pygame.K_SPACE]
+
+		return state
+
+
+def interaction(screen, survivor, paused=False, state=None, current_time=None, camera=None):
 	"""
 	Handle all player input and interactions.
 
@@ -20,97 +94,71 @@ def interaction(screen, survivor, paused=False):
 		screen: Pygame screen surface
 		survivor: Player character
 		paused (bool): Current pause state
+		state (InputState, optional): Input to apply. Defaults to reading
+			it from pygame.
+		current_time (float, optional): Game time in milliseconds for the
+			fire-rate check. Defaults to pygame.time.get_ticks().
+		camera (Camera, optional): View the clicks were made in. Defaults
+			to clicks being world positions.
 
 	Returns:
 		bool: New pause state
 	"""
+	if state is None:
+		state = InputState.fromPygame()
 
-	#Mouse Pointer Coordinates
-	Mpos = pygame.mouse.get_pos()
-	Mx = Mpos[0] // Tile.width
-	My = Mpos[1] // Tile.height
-
+	#For Window close button
+	if state.quit:
+		pygame.quit()
+		sys.exit()
 
+	#Handle ESC key for pause
+	if state.pause:
+		return not paused  # Toggle pause state
 
-	for event in pygame.event.get():
+	#Create Solid Tiles: Mouse Click
+	for x, y in state.clicks:
+		if camera is not None:
+			x, y = camera.toWorld(x, y)
+		tile = Tile.at_pixel(x, y)
+		if tile is not None:
+			tile.setSolid()
 
-		#For Window close button
-		if event.type == pygame.QUIT:
-			pygame.quit()
-			sys.exit()
-
-		#Handle ESC key for pause
-		if event.type == pygame.KEYDOWN:
-			if event.key == pygame.K_ESCAPE:
-				return not paused  # Toggle pause state
-
-		#Create Solid Tiles: Mouse Click
-		if event.type == pygame.MOUSEBUTTONDOWN:
-			for tile in Tile.List:
-				if tile.x == (Mx * Tile.width) and tile.y == (My * Tile.height):
-					tile.type = 'solid'
-					tile.walkable = False
-					break
-
-		#Switch between guns
-		if event.type == pygame.KEYDOWN:
-			if event.key == pygame.K_LSHIFT:
-				survivor.gun += 1
-				survivor.gun %= 3
+	#Switch between guns
+	survivor.gun += state.gunSwitches
+	survivor.gun %= 3
 
 
 	#Character Movement
-	keys = pygame.key.get_pressed()
 
 	# Movement with arrow keys (also sets facing direction)
-	if keys[pygame.K_UP]:
-		futureTileNumber = survivor.getNumber() - Tile.Vt
-
-		#Prevent Out Of Bounds Movement If Exits Are Provided
-		if futureTileNumber in range(1, Tile.totalTiles + 1):
-			futureTile = Tile.getTile(futureTileNumber)
-			if futureTile.walkable:
-				survivor.setTarget(futureTile)
-				survivor.rotate('N')
-
-	if keys[pygame.K_DOWN]:
-		futureTileNumber = survivor.getNumber() + Tile.Vt
-
-		if futureTileNumber in range(1, Tile.totalTiles + 1):
-			futureTile = Tile.getTile(futureTileNumber)
-			if futureTile.walkable:
-				survivor.setTarget(futureTile)
-				survivor.rotate('S')
-
-	if keys[pygame.K_RIGHT]:
-		futureTileNumber = survivor.getNumber() + Tile.Hz
-
-		if futureTileNumber in range(1, Tile.totalTiles + 1):
-			futureTile = Tile.getTile(futureTileNumber)
-			if futureTile.walkable:
-				survivor.setTarget(futureTile)
-				survivor.rotate('E')
-
-	if keys[pygame.K_LEFT]:
-		futureTileNumber = survivor.getNumber() - Tile.Hz
-
-		if futureTileNumber in range(1, Tile.totalTiles + 1):
-			futureTile = Tile.getTile(futureTileNumber)
-			if futureTile.walkable:
+	currentTile = survivor.getTile()
+	moves = (
+		(state.up, 0, -1, 'N'),
+		(state.down, 0, 1, 'S'),
+		(state.right, 1, 0, 'E'),
+		(state.left, -1, 0, 'W')
+	)
+
+	for held, dCol, dRow, direction in moves:
+		if held:
+			#Prevent Out Of Bounds Movement If Exits Are Provided
+			futureTile = Tile.at(currentTile.col + dCol, currentTile.row + dRow)
+			if futureTile is not None and futureTile.walkable:
 				survivor.setTarget(futureTile)
-				survivor.rotate('W')
+				survivor.rotate(direction)
 
 	# Shooting with spacebar in current facing direction
-	if keys[pygame.K_SPACE]:
+	if state.fire:
 		# Check if weapon can fire (time-based fire rate)
-		if survivor.canFire():
+		if survivor.canFire(current_time):
 			if survivor.direction == 'N':
-				Bullets(survivor.centerx, survivor.centery, 0, -config.BULLET_SPEED, 'N', survivor.getBulletType())
+				Bullets.fire(survivor.centerx, survivor.centery, 0, -config.BULLET_SPEED, 'N', survivor.getBulletType())
 			elif survivor.direction == 'S':
-				Bullets(survivor.centerx, survivor.centery, 0, config.BULLET_SPEED, 'S', survivor.getBulletType())
+				Bullets.fire(survivor.centerx, survivor.centery, 0, config.BULLET_SPEED, 'S', survivor.getBulletType())
 			elif survivor.direction == 'E':
-				Bullets(survivor.centerx, survivor.centery, config.BULLET_SPEED, 0, 'E', survivor.getBulletType())
+				Bullets.fire(survivor.centerx, survivor.centery, config.BULLET_SPEED, 0, 'E', survivor.getBulletType())
 			elif survivor.direction == 'W':
-				Bullets(survivor.centerx, survivor.centery, -config.BULLET_SPEED, 0, 'W', survivor.getBulletType())
+				Bullets.fire(survivor.centerx, survivor.centery, -config.BULLET_SPEED, 0, 'W', survivor.getBulletType())
 
 	return paused  # Return unchanged pause state
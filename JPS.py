@@ -0,0 +1,214 @@
+"""
+Jump Point Search for Zombie Apocalypse
+
+A drop-in replacement for AStar.search on maps where every tile costs the
+same to enter. Open areas have many equally short blocky paths between
+two tiles; A* expands most of them, while Jump Point Search only keeps
+one canonical path (vertical moves first, then horizontal ones) and jumps
+along straight lines until something forces a turn. Only the tiles where
+a turn may be needed (jump points) go on the open list.
+
+Rules for the 4-connected grid:
+	Horizontal moves keep going horizontally, and stop at the goal or
+	next to a wall corner that forces a turn up or down.
+	Vertical moves keep going vertically, and stop at the goal or where a
+	horizontal scan from the tile finds a jump point.
+
+After a search, `expanded` holds the nodes taken off the open list and
+`scanned` the tiles stepped over while jumping, to compare with
+AStar.expanded.
+"""
+
+from heapq import heappush, heappop
+
+import numpy as np
+
+import config
+
+
+expanded = 0  # Jump points expanded by the last search
+scanned = 0  # Tiles stepped over while jumping in the last search
+
+#Padded Grid Of The Last Keyed Search, Reused Until The Key Changes
+paddedKey = None
+paddedGrid = None  # (padded walkable list, uniform step cost or None)
+
+
+def padGrid(walkable, cost, key=None):
+	"""
+	Get the grid ringed with walls as a flat list, and its step cost if uniform.
+
+	Args:
+		walkable (ndarray): (rows, cols) bool array
+		cost (ndarray): (rows, cols) step costs, or None
+		key (hashable, optional): Identifies the grid's contents; None
+			always rebuilds. Defaults to None.
+
+	Returns:
+		tuple: (flat (rows + 2) x (cols + 2) walkable list, step cost, or
+		None if walkable cells cost different amounts)
+	"""
+	global paddedKey, paddedGrid
+
+	if key is None or key != paddedKey:
+		step = config.TILE_STEP_COST
+		if cost is not None:
+			enter = cost[walkable]
+			step = int(enter[0]) if enter.size else step
+			if enter.size and enter.min() != enter.max():
+				step = None
+
+		rows, cols = walkable.shape
+		ring = np.zeros((rows + 2, cols + 2), dtype=bool)
+		ring[1:-1, 1:-1] = walkable
+
+		paddedGrid = (ring.ravel().tolist(), step)
+		paddedKey = key
+
+	return paddedGrid
+
+
+def search(walkable, start, goal, cost=None, key=None):
+	"""
+	Find the shortest blocky (4-directional) path on a walkability array.
+
+	Same arguments and result as AStar.search. Jump Point Search needs a
+	uniform step cost, so when `cost` varies between tiles the search is
+	handed to AStar.search instead.
+
+	Args:
+		walkable (ndarray): (rows, cols) bool array, True where a cell can be entered
+		start (tuple): (col, row) cell to search from
+		goal (tuple): (col, row) cell to reach
+		cost (ndarray, optional): (rows, cols) cost of entering each cell.
+			Defaults to config.TILE_STEP_COST everywhere.
+		key (hashable, optional): Changes whenever walkable or cost do,
+			e.g. (Tile.mapVersion, shape); lets repeated searches reuse the
+			padded grid. Defaults to None.
+
+	Returns:
+		list: (col, row) cells from start to goal (both included), or an
+		empty list if the goal cannot be reached
+	"""
+	global expanded, scanned
+
+	#Pad The Grid With A Ring Of Walls So Jumps Need No Bounds Checks
+	open_, step = padGrid(walkable, cost, key)
+	if step is None:
+		import AStar
+		path = AStar.search(walkable, start, goal, cost, key)
+		expanded = scanned = AStar.expanded
+		return path
+
+	expanded, scanned = 0, 0
+	if start == goal:
+		return [start]
+
+	width = walkable.shape[1] + 2
+
+	source = (start[1] + 1) * width + start[0] + 1
+	target = (goal[1] + 1) * width + goal[0] + 1
+	goalCol, goalRow = target % width, target // width
+	steps = 0
+
+	def jumpAcross(cell, dx):
+		"""Jump east (dx=1) or west (dx=-1); return the jump point or None."""
+		nonlocal steps
+
+		while True:
+			cell += dx
+			if not open_[cell]:
+				return None
+
+			steps += 1
+			if cell == target:
+				return cell
+
+			#Forced Turn: Open Above/Below, But Walled Above/Below The Tile We Came From
+			up, down = cell - width, cell + width
+			if (open_[up] and not open_[up - dx]) or (open_[down] and not open_[down - dx]):
+				return cell
+
+	def jumpAlong(cell, dy):
+		"""Jump north (dy=-width) or south (dy=width); return the jump point or None."""
+		nonlocal steps
+
+		while True:
+			cell += dy
+			if not open_[cell]:
+				return None
+
+			steps += 1
+			if cell == target or jumpAcross(cell, 1) is not None or jumpAcross(cell, -1) is not None:
+				return cell
+
+	def heuristic(cell):
+		return step * (abs(cell % width - goalCol) + abs(cell // width - goalRow))
+
+	openHeap = [(heuristic(source), 0, source)]
+	G = {source: 0}
+	parent = {source: None}
+	came = {source: 0}  # Direction each node was jumped to from its parent, 0 for the start
+	closed = set()
+
+	while openHeap:
+		current = heappop(openHeap)[2]
+
+		#Stale Heap Entry: Node Already Expanded With A Lower G
+		if current in closed:
+			continue
+
+		if current == target:
+			break
+
+		closed.add(current)
+		g = G[current]
+		direction = came[current]
+
+		#Prune Neighbours A Canonical Path Would Reach Another Way
+		if direction == 0:
+			directions = (-width, 1, width, -1)
+		elif direction in (1, -1):
+			directions = [direction]
+			if open_[current - width] and not open_[current - width - direction]:
+				directions.append(-width)
+			if open_[current + width] and not open_[current + width - direction]:
+				directions.append(width)
+		else:
+			directions = (direction, 1, -1)
+
+		for move in directions:
+			if move in (1, -1):
+				node = jumpAcross(current, move)
+			else:
+				node = jumpAlong(current, move)
+
+			if node is None or node in closed:
+				continue
+
+			moveCost = g + step * ((node - current) // move)
+
+			if moveCost < G.get(node, moveCost + 1):
+				G[node] = moveCost
+				parent[node] = current
+				came[node] = move
+				#Prefer Deeper Nodes On F Ties
+				heappush(openHeap, (moveCost + heuristic(node), -moveCost, node))
+	else:
+		expanded, scanned = len(closed), steps
+		return []
+
+	expanded, scanned = len(closed), steps
+
+	#Walk The Parents Back From The Goal, Filling In The Straight Runs Between Jump Points
+	path = []
+	node = target
+	while parent[node] is not None:
+		previous, move = parent[node], came[node]
+		while node != previous:
+			path.append((node % width - 1, node // width - 1))
+			node -= move
+	path.append(start)
+
+	path.reverse()
+	return path
@@ -0,0 +1,240 @@
+"""
+Incremental Pathfinding for Zombie Apocalypse
+
+Lifelong Planning A* (the incremental core of D* Lite) over the tile grid.
+A single search tree rooted at the player's tile is kept between calls.
+When a wall is placed or the player steps onto another tile, only the part
+of the tree whose distances actually change is repaired, instead of
+searching from scratch for every zombie.
+"""
+
+from heapq import heappush, heappop
+
+import numpy as np
+
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+INF = float('inf')
+
+
+class Planner:
+	"""
+	Incremental shortest-path tree towards the player.
+
+	g[cell] is the current distance estimate from a cell to the player and
+	rhs[cell] its one-step lookahead. Cells where the two differ are queued
+	and repaired in order of min(g, rhs). The player's tile is the root
+	(rhs = 0), so moving the player is handled as two changed vertices.
+	"""
+
+	def __init__(self):
+		"""Create a planner for the current map."""
+		self.reset()
+
+	def reset(self):
+		"""Drop all search state and take a fresh copy of the map."""
+		self.rows, self.cols = Tile.walkableGrid.shape
+		total = self.rows * self.cols
+
+		self.walkable = Tile.walkableGrid.copy()
+		self.cost = Tile.costGrid.copy()
+		self.mapVersion = Tile.mapVersion
+
+		#Flat Python Lists Are Much Faster To Index Than The Arrays
+		self.open = self.walkable.ravel().tolist()
+		self.enter = self.cost.ravel().tolist()
+
+		self.g = [INF] * total
+		self.rhs = [INF] * total
+		self.heap = []
+		self.queued = {}  # Cell -> key of its live heap entry
+		self.goal = None
+		self.expanded = 0  # Cells expanded by the last computeShortestPath call
+
+		self.adjacent = []
+		for cell in range(total):
+			row, col = divmod(cell, self.cols)
+			surrounding = []
+			if row > 0:
+				surrounding.append(cell - self.cols)	#N
+			if col < self.cols - 1:
+				surrounding.append(cell + 1)			#E
+			if row < self.rows - 1:
+				surrounding.append(cell + self.cols)	#S
+			if col > 0:
+				surrounding.append(cell - 1)			#W
+			self.adjacent.append(surrounding)
+
+	def cellOf(self, tile):
+		"""
+		Get the flat cell index of a tile.
+
+		Args:
+			tile (Tile): Tile on the game map
+
+		Returns:
+			int: row * cols + col
+		"""
+		return tile.row * self.cols + tile.col
+
+	def updateVertex(self, cell):
+		"""
+		Recompute a cell's lookahead value and (re)queue it if inconsistent.
+
+		Args:
+			cell (int): Flat cell index
+		"""
+		g, rhs, open_, enter = self.g, self.rhs, self.open, self.enter
+
+		if cell != self.goal:
+			best = INF
+			for node in self.adjacent[cell]:
+				if open_[node]:
+					value = enter[node] + g[node]
+					if value < best:
+						best = value
+			rhs[cell] = best
+
+		if g[cell] != rhs[cell]:
+			key = min(g[cell], rhs[cell])
+			self.queued[cell] = key
+			heappush(self.heap, (key, cell))
+		else:
+			self.queued.pop(cell, None)	#Lazy Deletion: Heap Entry Becomes Stale
+
+	def sync(self, goalTile):
+		"""
+		Bring the tree up to date with the map and the player's position.
+
+		Cells whose walkability or cost changed since the last call are found
+		by diffing against the planner's copy of the grid.
+
+		Args:
+			goalTile (Tile): Tile the player is standing on
+		"""
+		if Tile.walkableGrid.shape != (self.rows, self.cols):
+			self.reset()
+
+		if Tile.mapVersion != self.mapVersion:
+			changed = np.flatnonzero((self.walkable != Tile.walkableGrid) | (self.cost != Tile.costGrid))
+
+			self.walkable[...] = Tile.walkableGrid
+			self.cost[...] = Tile.costGrid
+			self.mapVersion = Tile.mapVersion
+
+			flatWalkable, flatCost = self.walkable.ravel(), self.cost.ravel()
+			for cell in changed.tolist():
+				self.open[cell] = bool(flatWalkable[cell])
+				self.enter[cell] = int(flatCost[cell])
+
+				#Only Edges Leading Into The Changed Cell Are Affected
+				for node in self.adjacent[cell]:
+					self.updateVertex(node)
+
+		goal = self.cellOf(goalTile)
+
+		if goal != self.goal:
+			oldGoal, self.goal = self.goal, goal
+			self.rhs[goal] = 0
+			self.updateVertex(goal)
+
+			if oldGoal is not None:
+				self.updateVertex(oldGoal)
+
+	def computeShortestPath(self, targets):
+		"""
+		Repair the tree until every target cell has its exact distance.
+
+		Args:
+			targets (list): Flat cell indices that need a consistent value
+		"""
+		g, rhs, heap, queued = self.g, self.rhs, self.heap, self.queued
+		bound = -1
+		self.expanded = 0
+
+		while heap:
+			key, cell = heap[0]
+
+			if queued.get(cell) != key:
+				heappop(heap)
+				continue
+
+			#Stop Once Every Target Sorts Before The Rest Of The Queue
+			if key > bound:
+				bound = max((min(g[t], rhs[t]) for t in targets), default=-1)
+				if key > bound:
+					break
+
+			heappop(heap)
+			del queued[cell]
+			self.expanded += 1
+
+			if g[cell] > rhs[cell]:
+				g[cell] = rhs[cell]
+			else:
+				g[cell] = INF
+				self.updateVertex(cell)
+
+			#Walls Are Never Entered, So Nothing Depends On Their Distance
+			if self.open[cell]:
+				for node in self.adjacent[cell]:
+					self.updateVertex(node)
+
+	def nextCell(self, cell):
+		"""
+		Get the next cell on a shortest path from a cell to the player.
+
+		Args:
+			cell (int): Flat cell index (must have been a target of the last
+				computeShortestPath call)
+
+		Returns:
+			int: Flat index of the next cell, or None if the player cannot be
+			reached or is already adjacent
+		"""
+		if cell == self.goal:
+			return None
+
+		best, nextCell = INF, None
+		for node in self.adjacent[cell]:
+			if self.open[node]:
+				value = self.enter[node] + self.g[node]
+				if value < best:
+					best, nextCell = value, node
+
+		if nextCell == self.goal:
+			return None
+
+		return nextCell
+
+
+planner = Planner()
+
+
+def LPAStar(screen, survivor, FPS, totalFrames):
+	"""
+	Steer all idle zombies along the incrementally repaired search tree.
+
+	Drop-in alternative to AStar.AStar with the same signature.
+
+	Args:
+		screen: Pygame screen surface
+		survivor: Player character
+		FPS (int): Frames per second
+		totalFrames (int): Total frames elapsed
+	"""
+	planner.sync(survivor.getTile())
+
+	idle = [zombie for zombie in Zombie.List if zombie.tx == None and zombie.ty == None]
+	cells = [planner.cellOf(zombie.getTile()) for zombie in idle]
+
+	planner.computeShortestPath(cells)
+
+	for zombie, cell in zip(idle, cells):
+		nextCell = planner.nextCell(cell)
+
+		if nextCell is not None:
+			row, col = divmod(nextCell, planner.cols)
+			zombie.setTarget(Tile.at(col, row))
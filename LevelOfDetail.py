@@ -0,0 +1,159 @@
+"""
+AI Level Of Detail for Zombie Apocalypse
+
+Zombies are sorted into distance bands around the player every time paths
+are updated. Near zombies are left to the pathfinder as before. Zombies
+in the mid and far bands only get a full path search every so often; in
+between, an idle one keeps walking its last (possibly stale) route, or
+steps straight towards the player if it has none. Whatever this pass
+does not move is left idle for the pathfinder, so it works in front of
+every PATHFINDING_MODE.
+"""
+
+import numpy as np
+
+import config
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+BANDS = config.AI_LOD_BAND_NAMES
+NEAR, MID, FAR = range(len(BANDS))
+
+
+class LevelOfDetail:
+	"""
+	Cuts pathfinding work for zombies far from the player.
+
+	A zombie's band is its Manhattan distance to the player in tiles,
+	measured against `bands`. Each mid/far zombie has a time before which
+	it is not searched for again; `intervals` sets how long that is.
+	"""
+
+	def __init__(self, bands=config.AI_LOD_BANDS, intervals=config.AI_LOD_REPLAN_INTERVALS):
+		"""
+		Create the level of detail pass.
+
+		Args:
+			bands (tuple, optional): Tile distances where the mid and far
+				bands start. Defaults to config.AI_LOD_BANDS.
+			intervals (tuple, optional): Seconds between full path searches
+				in the mid and far bands. Defaults to
+				config.AI_LOD_REPLAN_INTERVALS.
+		"""
+		self.bands = np.asarray(bands)
+		self.intervals = np.asarray((0.0,) + tuple(intervals))  # Indexed by band
+		self.due, self.detour = Zombie.lodDue, Zombie.lodDetour  # Per-slot schedule, cleared by Zombie.reset
+		self.counts = [0] * len(BANDS)  # Zombies per band at the last update
+		self.routed, self.straight, self.searched = 0, 0, 0
+
+	def reset(self):
+		"""Forget every zombie's schedule (the game clock restarts with a new game)."""
+		self.due[:] = np.nan
+		self.detour[:] = 0.0
+		self.counts = [0] * len(BANDS)
+
+	def update(self, survivor, now):
+		"""
+		Band the horde and move idle mid/far zombies that are not due a search.
+
+		Call just before the pathfinder; zombies given a target here are
+		no longer idle, so the pathfinder skips them.
+
+		Args:
+			survivor: Player character
+			now (float): Game time in seconds
+		"""
+		live = np.fromiter((zombie.slot for zombie in Zombie.List), dtype=np.intp, count=len(Zombie.List))
+		survivorTile = survivor.getTile()
+
+		distance = (np.abs(Zombie.posX[live] // Tile.width - survivorTile.col)
+			+ np.abs(Zombie.posY[live] // Tile.height - survivorTile.row))
+		band = np.searchsorted(self.bands, distance, side="right")
+		self.counts = np.bincount(band, minlength=len(BANDS)).tolist()
+
+		idle = np.isnan(Zombie.targetX[live]) & np.isnan(Zombie.targetY[live]) & (band > NEAR)
+		if not idle.any():
+			return
+
+		#First Time Out Of The Near Band: Spread The First Searches Over One Interval
+		unbooked = idle & np.isnan(self.due[live])
+		stagger = (live[unbooked] % 16 + 1) / 16
+		self.due[live[unbooked]] = now + self.intervals[band[unbooked]] * stagger
+
+		#Due A Search: Leave It Idle For The Pathfinder And Book The Next One
+		due = idle & (self.due[live] <= now)
+		self.due[live[due]] = now + self.intervals[band[due]]
+
+		#Walked Into A Wall Recently: Straight Steps Would Lead It Back, So Keep Searching
+		cheap = idle & ~due & (self.detour[live] <= now)
+		self.searched += int(np.count_nonzero(idle & ~cheap))
+		slots = Zombie.slots
+		for slot, zombieBand in zip(live[cheap].tolist(), band[cheap].tolist()):
+			zombie = slots[slot]
+
+			if self.followRoute(zombie):
+				self.routed += 1
+			elif self.stepTowards(zombie, survivorTile):
+				self.straight += 1
+			else:
+				self.detour[slot] = now + self.intervals[zombieBand]
+				self.searched += 1
+
+	@staticmethod
+	def followRoute(zombie):
+		"""
+		Take the next tile of the zombie's last path, whatever goal it was for.
+
+		Args:
+			zombie (Zombie): Idle zombie
+
+		Returns:
+			bool: True if the zombie was given a target
+		"""
+		path = zombie.path
+
+		#Stop On The Adjacent Tile, Like The Pathfinders Do
+		if len(path) > 3 and path[1] is zombie.getTile():
+			zombie.path = path[1:]
+			zombie.setTarget(zombie.path[1])
+			return True
+
+		return False
+
+	@staticmethod
+	def stepTowards(zombie, survivorTile):
+		"""
+		Step one tile straight towards the player, along the longer axis first.
+
+		Args:
+			zombie (Zombie): Idle zombie
+			survivorTile (Tile): Player's tile
+
+		Returns:
+			bool: False if both tiles towards the player are walls
+		"""
+		tile = zombie.getTile()
+		dx, dy = survivorTile.col - tile.col, survivorTile.row - tile.row
+		moves = [(int(np.sign(dx)), 0), (0, int(np.sign(dy)))]
+		if abs(dy) > abs(dx):
+			moves.reverse()
+
+		for moveX, moveY in moves:
+			col, row = tile.col + moveX, tile.row + moveY
+			if (moveX or moveY) and Tile.walkableGrid[row, col]:
+				zombie.setTarget(Tile.at(col, row))
+				return True
+
+		return False
+
+	def stats(self):
+		"""
+		Get the level of detail counters.
+
+		Returns:
+			dict: zombies per band at the last update, and moves made by
+			following an old route, by stepping straight, and left to a
+			full search
+		"""
+		return dict(zip(BANDS, self.counts), routed=self.routed, straight=self.straight, searched=self.searched)
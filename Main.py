@@ -7,16 +7,33 @@ powered by the A* pathfinding algorithm.
 Zombie Apocalypse Beta v1.0
 """
 
+import argparse
+import atexit
+import os
 import pygame
 import sys
 from time import sleep
 
 import config
 import Functions
+import ObjectClass
 from TileClass import Tile
 from ObjectClass import Zombie, Survivor, Bullets
-from Interaction import interaction
+from Sprites import Sprites
+from SoundBank import SoundBank
+from Renderer import DirtyRenderer
+from Camera import Camera
+from BulletStore import BulletStore
+from Interaction import interaction, InputState
+from Profiler import Profiler, SPAWN, SURVIVOR, BULLETS, PATHFINDING, ZOMBIES, INPUT, RENDER
+from Replay import Recorder
 from AStar import AStar
+from FlowField import FlowField
+from LPAStar import LPAStar
+from ParallelAStar import ParallelAStar
+from PathScheduler import ScheduledAStar
+from HPAStar import HPAStar
+from LevelOfDetail import LevelOfDetail
 
 
 class Button:
@@ -50,8 +67,9 @@ class Button:
         pygame.draw.rect(screen, config.COLOR_WHITE, self.rect, 2)  # Border
 
         # Calculate text width properly for centering
-        font = pygame.font.SysFont("monospace", config.MENU_TEXT_SIZE)
-        text_surface = font.render(self.text, True, self.text_color)
+        text_surface = Functions.textCache.render(
+            self.text, ("monospace", config.MENU_TEXT_SIZE, False), self.text_color
+        )
         text_width = text_surface.get_width()
         text_height = text_surface.get_height()
 
@@ -73,30 +91,67 @@ class Button:
 class Game:
     """Main game class that manages game state and game loop."""
 
-    def __init__(self):
-        """Initialize pygame and game components."""
+    exit_profiler = None  # Profiler of the newest Game, written to CSV on exit
+
+    def __init__(self, headless=False, recorder=None, seed=None):
+        """
+        Initialize pygame and game components.
+
+        Args:
+            headless (bool, optional): Run without a window or sound (SDL
+                dummy drivers), for simulations. Defaults to False.
+            recorder (Recorder, optional): Records the first game played
+                (see Replay.py). Defaults to None.
+            seed (int, optional): Seed for the recorded game. Defaults to
+                a random seed.
+        """
+        self.headless = headless
+        self.recorder = recorder
+        self.seed = seed
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.init()
-        pygame.mixer.init()
         pygame.font.init()
 
+        if not headless:
+            pygame.mixer.init()
+
+            # Decode sound effects once
+            SoundBank.load()
+
         # Set up display
         self.screen = pygame.display.set_mode(
             (config.SCREEN_WIDTH, config.SCREEN_HEIGHT), 0, 32
         )
         pygame.display.set_caption(config.WINDOW_TITLE)
 
-        # Load background map
-        self.map_image = pygame.image.load(config.IMAGE_MAP)
+        # Reload sprites in the display's pixel format
+        Sprites.load()
+
+        # Load background map; the visible part of the world is composed
+        # into self.view from chunk backgrounds whenever the camera scrolls
+        self.map_image = pygame.image.load(config.IMAGE_MAP).convert()
+        self.view = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), 0, self.map_image)
+        self.view_offset = None
+        self.renderer = DirtyRenderer(self.screen, self.view)
 
         # Initialize tile system
-        Tile.preInit(self.screen, config.SCREEN_HEIGHT, config.SCREEN_WIDTH)
+        Tile.preInit(self.screen, config.WORLD_HEIGHT, config.WORLD_WIDTH)
+
+        # Array-backed bullets (optional)
+        if config.BULLET_BACKEND == "arrays":
+            Bullets.store = BulletStore(config.BULLET_STORE_CAPACITY)
 
         # Set up game clock
         self.clock = pygame.time.Clock()
         self.total_frames = 0
 
-        # Create player
+        # Create player and a camera following them
         self.survivor = Survivor(config.PLAYER_START_X, config.PLAYER_START_Y)
+        self.camera = Camera(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.camera.follow(self.survivor)
 
         # Game state
         self.paused = False
@@ -104,11 +159,26 @@ class Game:
         self.last_update_time = pygame.time.get_ticks()  # For delta time calculation
         self.pathfinding_timer = 0.0  # Timer for A* pathfinding updates
         self.spawn_timer = 0.0  # Timer for zombie spawning
+        self.game_time = 0.0  # Simulated time in milliseconds (drives fire rates)
+
+        # Distance bands for cheaper far-away zombie AI (AI_LOD)
+        self.lod = LevelOfDetail()
+
+        # Frame profiler (F3), dumped to CSV on exit; one exit hook however many games are created
+        self.profiler = Profiler()
+        if Game.exit_profiler is None:
+            atexit.register(lambda: Game.exit_profiler.dumpCsv())
+        Game.exit_profiler = self.profiler
+
+        # Close a recording cut short by quitting mid-game
+        if recorder is not None:
+            atexit.register(lambda: self.recorder and self.recorder.finish(self))
 
         # Load and play background music
-        pygame.mixer.music.load(config.AUDIO_THEME)
-        pygame.mixer.music.set_volume(config.BACKGROUND_MUSIC_VOLUME)
-        pygame.mixer.music.play(-1)  # Loop indefinitely
+        if not headless:
+            pygame.mixer.music.load(config.AUDIO_THEME)
+            pygame.mixer.music.set_volume(config.BACKGROUND_MUSIC_VOLUME)
+            pygame.mixer.music.play(-1)  # Loop indefinitely
 
     def show_intro_screen(self):
         """
@@ -276,9 +346,12 @@ class Game:
         Draw the Heads-Up Display (HUD).
 
         Shows health, kills, and current weapon.
+
+        Returns:
+            list: Screen areas drawn to
         """
         # Health
-        Functions.displayText(
+        health = Functions.displayText(
             self.screen,
             f"H E A L T H : {self.survivor.health}",
             config.HUD_HEALTH_X,
@@ -287,7 +360,7 @@ class Game:
         )
 
         # Kills
-        Functions.displayText(
+        kills = Functions.displayText(
             self.screen,
             f"K I L L S : {self.survivor.kills}",
             config.HUD_KILLS_X,
@@ -296,7 +369,7 @@ class Game:
         )
 
         # Current weapon
-        Functions.displayText(
+        gun = Functions.displayText(
             self.screen,
             f"G U N : {Survivor.weapon[self.survivor.gun]}",
             config.HUD_WEAPON_X,
@@ -304,6 +377,8 @@ class Game:
             config.HUD_FONT_SIZE
         )
 
+        return [health, kills, gun]
+
     def handle_pause_input(self):
         """
         Handle input while game is paused.
@@ -327,63 +402,151 @@ class Game:
 
         return True  # Stay paused
 
-    def update_game_state(self, delta_time):
+    def update_game_state(self, delta_time, state=None):
         """
         Update all game entities and logic with delta time for smooth movement.
 
         Args:
             delta_time (float): Time elapsed since last frame in seconds
+            state (InputState, optional): Player input for this frame.
+                Defaults to reading it from pygame.
 
         Handles zombie spawning, movement, pathfinding, and collision detection.
+        Nothing is drawn here, so it also runs headless.
         """
+        if state is None:
+            state = InputState.fromPygame()
+        if self.recorder is not None:
+            self.recorder.write(delta_time, state)
+
+        self.game_time += delta_time * 1000
+        profiler = self.profiler
+        t = profiler.start()
+
         # Update spawn timer and spawn zombies
         self.spawn_timer += delta_time
         if self.spawn_timer >= config.ZOMBIE_SPAWN_INTERVAL:
-            Zombie.spawn_timed()
+            Zombie.spawn_timed(self.survivor.getTile())
             self.spawn_timer = 0.0
+        t = profiler.lap(SPAWN, t)
 
         # Update player movement
         self.survivor.movement(delta_time)
+        t = profiler.lap(SURVIVOR, t)
 
         # Update bullets and check collisions
-        Bullets.collisionLoop(self.screen, delta_time)
-
-        # Run A* pathfinding on a timer (not every frame for performance)
-        self.pathfinding_timer += delta_time
-        if self.pathfinding_timer >= config.PATHFINDING_UPDATE_INTERVAL:
-            AStar(self.screen, self.survivor, config.FPS, self.total_frames)
+        Bullets.collisionLoop(delta_time, config.WORLD_WIDTH, config.WORLD_HEIGHT)
+        t = profiler.lap(BULLETS, t)
+
+        # Run pathfinding on a timer (not every frame for performance),
+        # or every frame within a fixed time budget in "scheduled" mode
+        if config.PATHFINDING_MODE != "scheduled":
+            self.pathfinding_timer += delta_time
+        replan = config.PATHFINDING_MODE == "scheduled" or self.pathfinding_timer >= config.PATHFINDING_UPDATE_INTERVAL
+        if config.AI_LOD and replan:
+            # Move distant zombies cheaply first; the pathfinder gets the rest
+            self.lod.update(self.survivor, self.game_time / 1000)
+
+        if config.PATHFINDING_MODE == "scheduled":
+            ScheduledAStar(self.screen, self.survivor, config.FPS, self.total_frames)
+        elif self.pathfinding_timer >= config.PATHFINDING_UPDATE_INTERVAL:
+            if config.PATHFINDING_MODE == "flowfield":
+                FlowField(self.screen, self.survivor, config.FPS, self.total_frames)
+            elif config.PATHFINDING_MODE == "lpastar":
+                LPAStar(self.screen, self.survivor, config.FPS, self.total_frames)
+            elif config.PATHFINDING_MODE == "hpastar":
+                HPAStar(self.screen, self.survivor, config.FPS, self.total_frames)
+            elif config.PATHFINDING_MODE == "parallel":
+                ParallelAStar(self.screen, self.survivor, config.FPS, self.total_frames)
+            else:
+                AStar(self.screen, self.survivor, config.FPS, self.total_frames)
             self.pathfinding_timer = 0.0
+        t = profiler.lap(PATHFINDING, t)
 
         # Update zombie movement
         Zombie.update_movement(delta_time)
 
-        # Handle user input (including pause toggle)
-        self.paused = interaction(self.screen, self.survivor, self.paused)
+        # Damage the player and remove dead zombies
+        Zombie.update(self.survivor)
+        t = profiler.lap(ZOMBIES, t)
+
+        # Handle user input (including pause toggle); clicks are on screen,
+        # so the camera must be where this frame will be drawn from
+        self.camera.follow(self.survivor)
+        if state.toggleProfiler:
+            profiler.toggle()
+            self.renderer.invalidate()  # Clear the overlay when it is hidden
+        self.paused = interaction(self.screen, self.survivor, self.paused, state, self.game_time, self.camera)
+        profiler.lap(INPUT, t)
+
+        # Headless frames are never drawn, so the frame ends here
+        if self.headless:
+            self.end_frame()
 
     def render(self):
         """
         Render all game graphics to the screen.
 
-        Draws background, entities, and HUD.
+        Draws background, entities, and HUD. Only the areas drawn to this
+        frame or the last one are repainted and pushed to the display (see
+        Renderer.DirtyRenderer). Only chunks and entities inside the
+        camera's view are drawn. In a windowed game this also ends the
+        profiler's frame.
         """
-        # Draw background map
-        self.screen.blit(self.map_image, (0, 0))
+        profiler = self.profiler
+        t = profiler.start()
+
+        # Rebuild the background from the chunks in view after scrolling
+        if self.camera.offset != self.view_offset:
+            self.compose_view()
+
+        # Nothing to cull or offset while the whole world fits on screen
+        camera = self.camera if self.camera.scrolling else None
+
+        # Restore background map
+        self.renderer.begin()
 
         # Draw bullets
-        for bullet in Bullets.List:
-            self.screen.blit(bullet.img, (bullet.x, bullet.y))
+        if Bullets.store is not None:
+            drawn = Bullets.store.draw(self.screen, camera)
+        elif camera is not None:
+            ox, oy = camera.offset
+            drawn = [self.screen.blit(bullet.img, (bullet.x - ox, bullet.y - oy)) for bullet in Bullets.List if camera.visible(bullet)]
+        else:
+            drawn = [self.screen.blit(bullet.img, (bullet.x, bullet.y)) for bullet in Bullets.List]
 
         # Draw survivor
-        self.survivor.draw(self.screen)
+        drawn += self.survivor.draw(self.screen, camera)
 
         # Draw zombies
-        Zombie.update(self.screen, self.survivor)
+        drawn += Zombie.draw(self.screen, camera)
 
-        # Draw HUD
-        self.draw_hud()
+        # Draw HUD and profiler overlay
+        drawn += self.draw_hud()
+        drawn += profiler.draw(self.screen)
 
         # Update display
-        pygame.display.flip()
+        self.renderer.end(drawn)
+
+        profiler.lap(RENDER, t)
+        if not self.headless:
+            self.end_frame()
+
+    def end_frame(self):
+        """Close the profiler's frame with this frame's entity and band counts."""
+        bullets = len(Bullets.store) if Bullets.store is not None else len(Bullets.List)
+        self.profiler.endFrame(len(Zombie.List), bullets, self.lod.counts)
+
+    def compose_view(self):
+        """Paint the background of the chunks in the camera's view into self.view."""
+        ox, oy = self.camera.offset
+        self.view.fill(config.COLOR_BLACK)
+
+        for chunk in Tile.chunksIn(self.camera.rect):
+            self.view.blit(chunk.background(self.map_image), (chunk.rect.x - ox, chunk.rect.y - oy))
+
+        self.view_offset = self.camera.offset
+        self.renderer.invalidate()
 
     def check_game_over(self):
         """
@@ -522,26 +685,44 @@ class Game:
 
         return 'quit'
 
+    def start_session(self, seed):
+        """
+        Start a fresh game whose randomness is fully determined by a seed.
+
+        Args:
+            seed (int): Seed for spawn tiles and zombie speeds
+        """
+        ObjectClass.rng.seed(seed)
+        self.reset_game_state()
+
     def reset_game_state(self):
         """Reset the game state for a new game."""
         # Clear all zombies and bullets
-        Zombie.List.clear()
-        Bullets.List.clear()
+        Zombie.clear()
+        Bullets.pool.clear()
+        if Bullets.store is not None:
+            Bullets.store.clear()
 
-        # Reset frame counter
+        # Reset frame counter and clocks
         self.total_frames = 0
+        self.game_time = 0.0
+        self.spawn_timer = 0.0
+        self.pathfinding_timer = 0.0
+        self.lod.reset()
 
         # Create new player
         self.survivor = Survivor(config.PLAYER_START_X, config.PLAYER_START_Y)
+        self.camera.follow(self.survivor)
 
         # Reset pause state
         self.paused = False
 
         # Restart background music
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(config.AUDIO_THEME)
-        pygame.mixer.music.set_volume(config.BACKGROUND_MUSIC_VOLUME)
-        pygame.mixer.music.play(-1)
+        if not self.headless:
+            pygame.mixer.music.stop()
+            pygame.mixer.music.load(config.AUDIO_THEME)
+            pygame.mixer.music.set_volume(config.BACKGROUND_MUSIC_VOLUME)
+            pygame.mixer.music.play(-1)
 
     def run(self):
         """
@@ -561,16 +742,24 @@ class Game:
             # Show intro screen
             self.show_intro_screen()
 
+            # Record this game from a fresh seeded state
+            if self.recorder is not None:
+                seed = self.seed if self.seed is not None else ObjectClass.rng.randrange(2 ** 32)
+                self.recorder.start(self, seed)
+
             # Set game start time for statistics
             self.game_start_time = pygame.time.get_ticks()
+            self.last_update_time = self.game_start_time  # Don't count the menus as game time
 
             # Main gameplay loop
+            self.renderer.invalidate()
             running = True
             while running:
                 if self.paused:
                     # Handle pause state
                     self.draw_pause_menu()
                     self.paused = self.handle_pause_input()
+                    self.renderer.invalidate()  # Pause menu covered the screen
                     self.clock.tick(config.FPS)  # Keep frame rate consistent
                 else:
                     # Normal gameplay
@@ -593,6 +782,11 @@ class Game:
                     if self.check_game_over():
                         running = False
 
+            # Only the first game is recorded
+            if self.recorder is not None:
+                self.recorder.finish(self)
+                self.recorder = None
+
             # Show game over screen and get user choice
             game_over_action = self.show_game_over_screen()
 
@@ -615,7 +809,12 @@ class Game:
 
 def main():
     """Entry point for the game."""
-    game = Game()
+    parser = argparse.ArgumentParser(description="Zombie Apocalypse")
+    parser.add_argument("--record", metavar="FILE", help="record the first game to FILE (replay with Replay.py)")
+    parser.add_argument("--seed", type=int, help="random seed for the recorded game")
+    args = parser.parse_args()
+
+    game = Game(recorder=Recorder(args.record) if args.record else None, seed=args.seed)
     game.run()
 
 
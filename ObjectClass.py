@@ -4,13 +4,20 @@ Object Classes for Zombie Apocalypse
 Contains all game entity classes: Character, Zombie, Survivor, and Bullets.
 """
 
+import numpy as np
 import pygame
-from random import randint, choice
+from random import Random
 
 import config
 from TileClass import Tile
+from SpatialHash import SpatialHash
+from Sprites import Sprites
+from SoundBank import SoundBank
+from Pool import Pool
 
 
+rng = Random()  # Gameplay randomness (spawn tiles, zombie speeds); seeded for replays
+
 class Character(pygame.Rect):
 	"""
 	Base class for all game characters (Player and Zombies).
@@ -73,17 +80,86 @@ class Zombie(Character):
 
 	Zombies spawn at designated points, use A* pathfinding to chase the player,
 	and deal damage when adjacent.
+
+	Movement state lives in class-level arrays with one slot per pooled
+	zombie, so update_movement() steps the whole horde at once. The pygame
+	Rect is kept in sync with the (float) array position for drawing and
+	collisions.
 	"""
 
 	List = []
 	spawnTiles = config.ZOMBIE_SPAWN_TILES
-	originalImage = pygame.image.load(config.IMAGE_ZOMBIE)
 	base_health = config.ZOMBIE_HEALTH
 
+	#Movement Arrays, Indexed By Zombie.slot (Target Is NaN When Idle)
+	directions = ('N', 'E', 'S', 'W')
+	slots = []  # Slot -> Zombie
+	posX = np.zeros(config.ZOMBIE_POOL_SIZE)
+	posY = np.zeros(config.ZOMBIE_POOL_SIZE)
+	targetX = np.full(config.ZOMBIE_POOL_SIZE, np.nan)
+	targetY = np.full(config.ZOMBIE_POOL_SIZE, np.nan)
+	speed = np.zeros(config.ZOMBIE_POOL_SIZE)
+	facing = np.zeros(config.ZOMBIE_POOL_SIZE, dtype=np.int8)
+
+	#AI Level Of Detail Schedule (See LevelOfDetail), Cleared On Every Spawn
+	lodDue = np.full(config.ZOMBIE_POOL_SIZE, np.nan)  # Game time (s) of the next full search, NaN if unbooked
+	lodDetour = np.zeros(config.ZOMBIE_POOL_SIZE)  # Game time (s) until which only the pathfinder moves it
+
 	def __init__(self, x, y):
 		"""
 		Create a new zombie at the given position.
 
+		Zombies in play are taken from Zombie.pool rather than constructed
+		directly; the pool calls reset() each time one is reused.
+
+		Args:
+			x (int): X coordinate in pixels
+			y (int): Y coordinate in pixels
+		"""
+		if len(Zombie.slots) == len(Zombie.posX):
+			raise ValueError("No movement slots left (raise config.ZOMBIE_POOL_SIZE)")
+
+		self.slot = len(Zombie.slots)
+		Zombie.slots.append(self)
+
+		Character.__init__(self, x, y)
+		self.reset(x, y)
+
+
+	@property
+	def tx(self):
+		"""Target X coordinate, or None when the zombie is idle."""
+		value = Zombie.targetX[self.slot]
+		return None if value != value else float(value)
+
+	@tx.setter
+	def tx(self, value):
+		Zombie.targetX[self.slot] = np.nan if value is None else value
+
+	@property
+	def ty(self):
+		"""Target Y coordinate, or None when the zombie is idle."""
+		value = Zombie.targetY[self.slot]
+		return None if value != value else float(value)
+
+	@ty.setter
+	def ty(self, value):
+		Zombie.targetY[self.slot] = np.nan if value is None else value
+
+	@property
+	def vel(self):
+		"""Movement speed in pixels per second."""
+		return float(Zombie.speed[self.slot])
+
+	@vel.setter
+	def vel(self, value):
+		Zombie.speed[self.slot] = value
+
+
+	def reset(self, x, y):
+		"""
+		Reinitialise the zombie for a fresh spawn.
+
 		Args:
 			x (int): X coordinate in pixels
 			y (int): Y coordinate in pixels
@@ -91,90 +167,86 @@ class Zombie(Character):
 		self.health = Zombie.base_health
 
 		# Random movement speed selection
-		self.vel = choice(config.ZOMBIE_SPEEDS)
+		self.vel = rng.choice(config.ZOMBIE_SPEEDS)
 
 		self.direction = 'W'
-		self.img = Zombie.originalImage
-		Character.__init__(self, x, y)
-		Zombie.List.append(self)
+		self.img = Sprites.zombie['W']
+		Zombie.facing[self.slot] = Zombie.directions.index('W')
+
+		# Last path found by A* and the (goal tile, map version) it was found for
+		self.path, self.pathKey = [], None
 
+		self.tx, self.ty = None, None
+		self.topleft = (x, y)
+		Zombie.posX[self.slot], Zombie.posY[self.slot] = x, y
 
-	def rotate(self, direction, originalImage):
+		# A new zombie does not inherit the slot's previous search schedule
+		Zombie.lodDue[self.slot], Zombie.lodDetour[self.slot] = np.nan, 0.0
+
+
+	def rotate(self, direction):
 		"""
 		Rotate zombie sprite to face the given direction.
 
 		Args:
 			direction (str): Direction to face ('N', 'S', 'E', 'W')
-			originalImage: Base zombie image to rotate
-		"""
-
-		if direction == 'N':
-			if self.direction != 'N':
-				self.direction = 'N'
-				self.img = pygame.transform.rotate(Zombie.originalImage, 270)
-
-		if direction == 'S':
-			if self.direction != 'S':
-				self.direction = 'S'
-				self.img = pygame.transform.rotate(Zombie.originalImage, 90)
-			
-		if direction == 'E':
-			if self.direction != 'E':
-				self.direction = 'E'
-				self.img = pygame.transform.rotate(Zombie.originalImage, 180)
-			
-		if direction == 'W':
-			if self.direction != 'W':
-				self.direction = 'W'
-				self.img = Zombie.originalImage
-				
-
+		"""
+		if self.direction != direction:
+			self.direction = direction
+			self.img = Sprites.zombie[direction]
 
 
 	@staticmethod
-	def spawn(totalFrames, FPS):
+	def spawn(totalFrames, FPS, near=None):
 		"""
 		Spawn new zombies at designated spawn points.
 
 		Args:
 			totalFrames (int): Total frames elapsed since game start
 			FPS (int): Frames per second
+			near (Tile, optional): Spawn in the copy of the map around this
+				tile (see Tile.fromLayout). Defaults to the first copy.
 		"""
 		# Spawn a zombie every second (every FPS frames)
 		if totalFrames % FPS == 0:
-			# Play random zombie spawn sound
-			sound_path = choice(config.AUDIO_ZOMBIE_SPAWN)
-			sound = pygame.mixer.Sound(sound_path)
-			sound.set_volume(config.SFX_VOLUME)
-			sound.play()
+			# Play random zombie spawn sound (skipped if every spawn voice is busy)
+			SoundBank.play("zombieSpawn")
 
 			# Select random spawn tile
-			spawnTileNumber = choice(Zombie.spawnTiles)
-			spawnNode = Tile.getTile(spawnTileNumber)
+			spawnTileNumber = rng.choice(Zombie.spawnTiles)
+			spawnNode = Tile.fromLayout(spawnTileNumber, near)
 
-			# Create new zombie
-			Zombie(spawnNode.x, spawnNode.y)
+			# Take a zombie from the pool (skipped if the pool is exhausted)
+			Zombie.pool.acquire(spawnNode.x, spawnNode.y)
 
 
 	@staticmethod
-	def spawn_timed():
+	def spawn_timed(near=None):
 		"""
 		Spawn new zombies using time-based spawning (called by timer, not frames).
 
 		This method is called by the game loop's spawn timer for frame-independent spawning.
+
+		Args:
+			near (Tile, optional): Spawn in the copy of the map around this
+				tile (see Tile.fromLayout). Defaults to the first copy.
 		"""
-		# Play random zombie spawn sound
-		sound_path = choice(config.AUDIO_ZOMBIE_SPAWN)
-		sound = pygame.mixer.Sound(sound_path)
-		sound.set_volume(config.SFX_VOLUME)
-		sound.play()
+		# Play random zombie spawn sound (skipped if every spawn voice is busy)
+		SoundBank.play("zombieSpawn")
 
 		# Select random spawn tile
-		spawnTileNumber = choice(Zombie.spawnTiles)
-		spawnNode = Tile.getTile(spawnTileNumber)
+		spawnTileNumber = rng.choice(Zombie.spawnTiles)
+		spawnNode = Tile.fromLayout(spawnTileNumber, near)
+
+		# Take a zombie from the pool (skipped if the pool is exhausted)
+		Zombie.pool.acquire(spawnNode.x, spawnNode.y)
+
 
-		# Create new zombie
-		Zombie(spawnNode.x, spawnNode.y)
+	@staticmethod
+	def clear():
+		"""Return every zombie to the pool and stop all movement."""
+		Zombie.pool.clear()
+		Zombie.targetX[:], Zombie.targetY[:] = np.nan, np.nan
 
 
 	@staticmethod
@@ -182,60 +254,86 @@ class Zombie(Character):
 		"""
 		Update zombie movement with delta time for frame-independent movement.
 
+		Every zombie with a target is stepped towards it in one vectorized
+		pass. Only zombies that turned get their sprite rotated, and only
+		moving zombies have their Rect synced.
+
 		Args:
 			delta_time (float): Time elapsed since last frame in seconds
 		"""
-		for zombie in Zombie.List:
-			# Target Already Set by A* pathfinding
-			if zombie.tx != None and zombie.ty != None:
+		count = len(Zombie.slots)
+		targetX, targetY = Zombie.targetX[:count], Zombie.targetY[:count]
+
+		# Target Already Set by A* pathfinding
+		moving = np.flatnonzero(~np.isnan(targetX) & ~np.isnan(targetY))
+		if moving.size == 0:
+			return
 
-				X = zombie.x - zombie.tx
-				Y = zombie.y - zombie.ty
+		x, y = Zombie.posX[moving], Zombie.posY[moving]
+		goalX, goalY = targetX[moving], targetY[moving]
+		X, Y = goalX - x, goalY - y
 
-				# Calculate movement distance based on speed and delta time
-				move_distance = zombie.vel * delta_time
+		# Calculate movement distance based on speed and delta time, without overshooting
+		step = Zombie.speed[moving] * delta_time
+		x += np.clip(X, -step, step)
+		y += np.clip(Y, -step, step)
 
-				# Move Right
-				if X < 0:
-					zombie.x += min(move_distance, abs(X))
-					zombie.rotate('E', zombie.originalImage)
+		# Facing: vertical movement wins over horizontal, as before (N=0, E=1, S=2, W=3)
+		old = Zombie.facing[moving]
+		new = np.where(X > 0, 1, np.where(X < 0, 3, old))
+		new = np.where(Y < 0, 0, np.where(Y > 0, 2, new)).astype(np.int8)
 
-				# Move Left
-				elif X > 0:
-					zombie.x -= min(move_distance, abs(X))
-					zombie.rotate('W', zombie.originalImage)
+		# Target Reached (check if close enough due to floating point)
+		arrived = (np.abs(goalX - x) < 1) & (np.abs(goalY - y) < 1)
+		x[arrived], y[arrived] = goalX[arrived], goalY[arrived]
 
-				# Move Up
-				if Y > 0:
-					zombie.y -= min(move_distance, abs(Y))
-					zombie.rotate('N', zombie.originalImage)
+		Zombie.posX[moving], Zombie.posY[moving] = x, y
+		Zombie.facing[moving] = new
+		done = moving[arrived]
+		Zombie.targetX[done], Zombie.targetY[done] = np.nan, np.nan
 
-				# Move Down
-				elif Y < 0:
-					zombie.y += min(move_distance, abs(Y))
-					zombie.rotate('S', zombie.originalImage)
+		slots = Zombie.slots
+		for slot in moving[new != old].tolist():
+			slots[slot].rotate(Zombie.directions[Zombie.facing[slot]])
 
-				# Target Reached (check if close enough due to floating point)
-				if abs(X) < 1 and abs(Y) < 1:
-					zombie.x = zombie.tx
-					zombie.y = zombie.ty
-					zombie.tx, zombie.ty = None, None
+		for slot, px, py in zip(moving.tolist(), x.astype(np.intp).tolist(), y.astype(np.intp).tolist()):
+			slots[slot].topleft = (px, py)
 
 
 	@staticmethod
-	def update(screen, survivor):
+	def draw(screen, camera=None):
 		"""
-		Update all zombies - render them and check for player collision.
+		Draw the zombies in view; the rest keep moving but are not blitted.
 
 		Args:
 			screen: Pygame screen surface
-			survivor (Survivor): Player character to check collision with
+			camera (Camera, optional): View to draw. Defaults to drawing in
+				world coordinates.
+
+		Returns:
+			list: Screen areas drawn to
+		"""
+		if camera is None:
+			return [screen.blit(zombie.img, (zombie.x, zombie.y)) for zombie in Zombie.List]
+
+		view = camera.rect
+		ox, oy = view.topleft
+		return [screen.blit(zombie.img, (zombie.x - ox, zombie.y - oy)) for zombie in Zombie.List if view.colliderect(zombie)]
+
+
+	@staticmethod
+	def update(survivor):
 		"""
+		Update all zombies - damage the player when adjacent and remove the dead.
 
+		Drawing is done separately by draw(), so this also runs headless.
 
-		for zombie in Zombie.List:
+		Args:
+			survivor (Survivor): Player character to check collision with
+		"""
 
-			screen.blit(zombie.img, (zombie.x, zombie.y))
+		# Walk backwards so releasing a dead zombie (swap-remove) skips nobody
+		for zombie in reversed(Zombie.List):
 
 			if survivor.x % Tile.width == 0 and survivor.y % Tile.height == 0:
 				if zombie.x % Tile.width == 0 and zombie.y % Tile.height == 0:
@@ -262,7 +360,8 @@ class Zombie(Character):
 
 
 			if zombie.health <= 0:
-				Zombie.List.remove(zombie)
+				zombie.tx, zombie.ty = None, None
+				Zombie.pool.release(zombie)
 				survivor.kills += 1
 
 			# Note: Movement is now handled in update_movement() method
@@ -272,6 +371,9 @@ class Zombie(Character):
 
 
 
+Zombie.pool = Pool(lambda: Zombie(0, 0), config.ZOMBIE_POOL_SIZE, Zombie.List)
+
+
 
 class Survivor(Character):
 	"""
@@ -281,12 +383,6 @@ class Survivor(Character):
 	and switch between three weapons.
 	"""
 
-	gunsImg = [
-		pygame.image.load(config.IMAGE_PISTOL),
-		pygame.image.load(config.IMAGE_SHOTGUN),
-		pygame.image.load(config.IMAGE_AUTOMATIC)
-	]
-
 	weapon = config.WEAPON_NAMES
 
 	def __init__(self, x, y):
@@ -301,37 +397,42 @@ class Survivor(Character):
 		self.kills = 0
 		self.gun = 0  # Current weapon index (0=pistol, 1=shotgun, 2=auto)
 		self.direction = 'W'
-		self.img = pygame.image.load(config.IMAGE_SURVIVOR_W)
-		self.last_shot_time = 0  # Track last time weapon was fired (in milliseconds)
+		self.img = Sprites.survivor['W']
+		self.last_shot_time = None  # Game time of the last shot in milliseconds (None = never fired)
 		Character.__init__(self, x, y)
 		
 
 
-	def draw(self, screen):
+	def draw(self, screen, camera=None):
 		"""
 		Draw the survivor and current weapon to the screen.
 
 		Args:
 			screen: Pygame screen surface
+			camera (Camera, optional): View to draw. Defaults to drawing in
+				world coordinates.
+
+		Returns:
+			list: Screen areas drawn to
 		"""
 		h = self.width // 2
+		x, y = self.x, self.y
+		if camera is not None:
+			x, y = x - camera.rect.x, y - camera.rect.y
 
 		# Draw survivor sprite
-		screen.blit(self.img, (self.x, self.y))
+		drawn = [screen.blit(self.img, (x, y))]
 		
-		img = Survivor.gunsImg[self.gun]
+		img = Sprites.guns[self.gun][self.direction]
 
 		if self.direction == 'W':
-			screen.blit(img, (self.x, self.y + h))
-		elif self.direction == 'E':
-			img = pygame.transform.flip(img, True, False)
-			screen.blit(img, (self.x +h, self.y + h))
-		elif self.direction == 'S':
-			img = pygame.transform.rotate(img, 90)
-			screen.blit(img, (self.x +h, self.y + h))
+			drawn.append(screen.blit(img, (x, y + h)))
+		elif self.direction in ('E', 'S'):
+			drawn.append(screen.blit(img, (x +h, y + h)))
 		elif self.direction == 'N':
-			img = pygame.transform.rotate(img, 270)
-			screen.blit(img, (self.x +h, self.y - h//2))
+			drawn.append(screen.blit(img, (x +h, y - h//2)))
+
+		return drawn
 
 
 	def movement(self, delta_time):
@@ -381,25 +482,9 @@ class Survivor(Character):
 		Args:
 			direction (str): Direction to face ('N', 'S', 'E', 'W')
 		"""
-		if direction == 'N':
-			if self.direction != 'N':
-				self.direction = 'N'
-				self.img = pygame.image.load(config.IMAGE_SURVIVOR_N)
-
-		if direction == 'S':
-			if self.direction != 'S':
-				self.direction = 'S'
-				self.img = pygame.image.load(config.IMAGE_SURVIVOR_S)
-
-		if direction == 'E':
-			if self.direction != 'E':
-				self.direction = 'E'
-				self.img = pygame.image.load(config.IMAGE_SURVIVOR_E)
-
-		if direction == 'W':
-			if self.direction != 'W':
-				self.direction = 'W'
-				self.img = pygame.image.load(config.IMAGE_SURVIVOR_W)
+		if self.direction != direction:
+			self.direction = direction
+			self.img = Sprites.survivor[direction]
 
 
 	def getBulletType(self):
@@ -417,14 +502,19 @@ class Survivor(Character):
 			return "automatic"
 
 
-	def canFire(self):
+	def canFire(self, current_time=None):
 		"""
 		Check if enough time has passed since last shot for current weapon.
 
+		Args:
+			current_time (float, optional): Game time in milliseconds.
+				Defaults to pygame.time.get_ticks().
+
 		Returns:
 			bool: True if weapon can fire, False otherwise
 		"""
-		current_time = pygame.time.get_ticks()
+		if current_time is None:
+			current_time = pygame.time.get_ticks()
 
 		# Get fire rate for current weapon (in seconds)
 		if self.gun == 0:
@@ -440,7 +530,7 @@ class Survivor(Character):
 		fire_rate_ms = fire_rate * 1000
 
 		# Check if enough time has passed
-		if current_time - self.last_shot_time >= fire_rate_ms:
+		if self.last_shot_time is None or current_time - self.last_shot_time >= fire_rate_ms:
 			self.last_shot_time = current_time
 			return True
 		return False
@@ -459,18 +549,15 @@ class Bullets(pygame.Rect):
 	width, height = config.BULLET_WIDTH, config.BULLET_HEIGHT
 	List = []
 
-	img = {
-		"pistol": pygame.image.load(config.IMAGE_PISTOL_BULLET),
-		"shotgun": pygame.image.load(config.IMAGE_SHOTGUN_BULLET),
-		"automatic": pygame.image.load(config.IMAGE_AUTOMATIC_BULLET)
-	}
-
 	gunDmg = {
 		"pistol": config.PISTOL_DAMAGE,
 		"shotgun": config.SHOTGUN_DAMAGE,
 		"automatic": config.AUTOMATIC_DAMAGE
 	}
 
+	zombieHash = SpatialHash()  # Rebuilt from Zombie.List every collision pass
+	store = None  # BulletStore when config.BULLET_BACKEND == "arrays"
+
 
 	def __init__(self, x, y, velx, vely, direction, type_):
 		"""
@@ -487,60 +574,82 @@ class Bullets(pygame.Rect):
 		Note:
 			Fire rate is now controlled by time-based checking in Survivor.canFire()
 			rather than spatial distance between bullets.
+
+			Bullets in play are taken from Bullets.pool (see fire()); the pool
+			calls reset() each time one is reused.
+		"""
+		pygame.Rect.__init__(self, x, y, Bullets.width, Bullets.height)
+		self.reset(x, y, velx, vely, direction, type_)
+
+
+	def reset(self, x, y, velx, vely, direction, type_):
+		"""
+		Reinitialise the bullet for a new shot.
+
+		Takes the same arguments as the constructor.
 		"""
 		self.type = type_
 		self.direction = direction
 		self.velx, self.vely = velx, vely
 
-		if direction == 'N':
-			self.img = pygame.transform.rotate(Bullets.img[type_], 270)
+		self.img = Sprites.bullets[type_][direction]
+		self.topleft = (x, y)
 
-		if direction == 'S':
-			self.img = pygame.transform.rotate(Bullets.img[type_], 90)
-			
-		if direction == 'E':
-			self.img = pygame.transform.rotate(Bullets.img[type_], 180)
-			
-		if direction == 'W':
-			self.img = Bullets.img[type_]
 
+	@staticmethod
+	def fire(x, y, velx, vely, direction, type_):
+		"""
+		Fire a bullet into whichever bullet backend is active.
 
-		pygame.Rect.__init__(self, x, y, Bullets.width, Bullets.height)
-		Bullets.List.append(self)
+		Takes the same arguments as the Bullets constructor.
+		"""
+		if Bullets.store is not None:
+			Bullets.store.fire(x, y, velx, vely, direction, type_)
+		else:
+			Bullets.pool.acquire(x, y, velx, vely, direction, type_)
 
 
-	def offScreen(self, screen):
+	def offScreen(self, width, height):
 		"""
 		Check if bullet has moved off screen.
 
 		Args:
-			screen: Pygame screen surface
+			width (int): World width in pixels
+			height (int): World height in pixels
 
 		Returns:
-			bool: True if bullet is off screen, False otherwise
+			bool: True if bullet has left the world, False otherwise
 		"""
 		if self.x < 0:
 			return True
 		elif self.y < 0:
 			return True
-		elif self.x + self.width > screen.get_width():
+		elif self.x + self.width > width:
 			return True
-		elif self.y + self.height > screen.get_height():
+		elif self.y + self.height > height:
 			return True
 		else:
 			return False
 
 	@staticmethod
-	def collisionLoop(screen, delta_time):
+	def collisionLoop(delta_time, width=config.WORLD_WIDTH, height=config.WORLD_HEIGHT):
 		"""
 		Update all bullets and check for collisions.
 
 		Args:
-			screen: Pygame screen surface
 			delta_time (float): Time elapsed since last frame in seconds
+			width (int, optional): World width in pixels. Defaults to config.WORLD_WIDTH.
+			height (int, optional): World height in pixels. Defaults to config.WORLD_HEIGHT.
 		"""
 
-		for bullet in Bullets.List:
+		Bullets.zombieHash.rebuild(Zombie.List)
+
+		if Bullets.store is not None:
+			Bullets.store.update(width, height, delta_time, Bullets.zombieHash)
+			return
+
+		# Walk backwards so releasing a spent bullet (swap-remove) skips nobody
+		for bullet in reversed(Bullets.List):
 
 			# Update bullet position based on velocity and delta time
 			bullet.x += bullet.velx * delta_time
@@ -549,23 +658,22 @@ class Bullets(pygame.Rect):
 			# Note: Bullets are now rendered in Main.render() method
 			# This method only updates positions and checks collisions
 
-			if bullet.offScreen(screen):
-				Bullets.List.remove(bullet)
+			if bullet.offScreen(width, height):
+				Bullets.pool.release(bullet)
 				continue
 
-
-			for zombie in Zombie.List:
+			# Only zombies in the bullet's own and neighbouring cells can be hit
+			for zombie in Bullets.zombieHash.query(bullet):
 
 				if bullet.colliderect(zombie):
 					zombie.health -= Bullets.gunDmg[bullet.type]
-					Bullets.List.remove(bullet)
+					Bullets.pool.release(bullet)
 					break
 
+			else:
+				# No zombie hit: drop it if a corner is on a wall tile
+				if not Tile.rectWalkable(bullet):
+					Bullets.pool.release(bullet)
 
-			for tile in Tile.List:
 
-				if bullet.colliderect(tile) and not(tile.walkable):
-					try:
-						Bullets.List.remove(bullet)
-					except:
-						pass	#Bullet not in List
+Bullets.pool = Pool(lambda: Bullets(0, 0, 0, 0, 'W', "pistol"), config.BULLET_POOL_SIZE, Bullets.List)
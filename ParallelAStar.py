@@ -0,0 +1,266 @@
+"""
+Multi-Process Pathfinding for Zombie Apocalypse
+
+Runs AStar.search in a pool of worker processes so path searches do not
+compete with the game loop for the GIL. The walkable and cost grids are
+published once per map change into multiprocessing.shared_memory, which
+every worker maps directly instead of receiving a copy per request.
+
+Requests are fire-and-forget: idle zombies are grouped by tile, spread
+over the workers, and the results are applied with Zombie.setTarget on a
+later frame once they are ready. Until then a zombie keeps its last target.
+Which frame that is depends on the machine, so while a session is recorded
+or replayed the pool runs in lockstep instead (see setLockstep).
+"""
+
+import atexit
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import config
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+#Worker Side: Views Onto The Shared Grid, Set Up Once Per Process
+workerMemory = None
+workerWalkable = None
+workerCost = None
+
+
+def gridLayout(shape):
+	"""
+	Byte layout of the shared grid: walkable bytes, then int32 costs.
+
+	Args:
+		shape (tuple): (rows, cols)
+
+	Returns:
+		tuple: (cost offset, total size) in bytes
+	"""
+	cells = shape[0] * shape[1]
+	offset = (cells + 7) // 8 * 8  # Keep the int32 costs aligned
+	return offset, offset + cells * 4
+
+
+def attach(name, shape):
+	"""
+	Pool initializer: map the shared grid into this worker.
+
+	Args:
+		name (str): Shared memory block name
+		shape (tuple): (rows, cols)
+	"""
+	global workerMemory, workerWalkable, workerCost
+
+	workerMemory = shared_memory.SharedMemory(name=name)
+	offset, _ = gridLayout(shape)
+	workerWalkable = np.ndarray(shape, dtype=bool, buffer=workerMemory.buf)
+	workerCost = np.ndarray(shape, dtype=np.int32, buffer=workerMemory.buf, offset=offset)
+
+
+def solve(goal, starts, version):
+	"""
+	Worker task: search from several start cells to one goal.
+
+	Args:
+		goal (tuple): (col, row) of the player's tile
+		starts (list): (col, row) start cells
+		version (int): Tile.mapVersion the shared grid was published for
+
+	Returns:
+		list: (start, path) pairs, path being (col, row) cells
+	"""
+	import AStar
+	import JPS
+
+	search = JPS.search if config.PATH_SEARCH == "jps" else AStar.search
+	key = (version, workerWalkable.shape)
+	return [(start, search(workerWalkable, start, goal, workerCost, key)) for start in starts]
+
+
+class WorkerPool:
+	"""
+	Process pool plus the shared grid it searches.
+
+	The main process rewrites the shared grid whenever Tile.mapVersion
+	moves. Every request remembers the map version it was made for, and
+	results for an older map are thrown away.
+	"""
+
+	def __init__(self, processes=config.PATH_WORKERS):
+		"""
+		Publish the grid and start the workers.
+
+		Args:
+			processes (int, optional): Worker count; 0 means one per CPU
+				core except the one running the game. Defaults to
+				config.PATH_WORKERS.
+		"""
+		self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+		self.shape = Tile.walkableGrid.shape
+
+		offset, size = gridLayout(self.shape)
+		self.memory = shared_memory.SharedMemory(create=True, size=size)
+		self.walkable = np.ndarray(self.shape, dtype=bool, buffer=self.memory.buf)
+		self.cost = np.ndarray(self.shape, dtype=np.int32, buffer=self.memory.buf, offset=offset)
+		self.mapVersion = None
+		self.publish()
+
+		self.pool = multiprocessing.Pool(self.processes, initializer=attach, initargs=(self.memory.name, self.shape))
+		self.pending = []  # (AsyncResult, map version)
+		self.inFlight = set()  # Start cells with an unanswered request
+		self.requested, self.applied, self.stale = 0, 0, 0
+
+		atexit.register(self.close)
+
+	def publish(self):
+		"""Copy the map into shared memory if it changed since the last copy."""
+		if self.mapVersion != Tile.mapVersion:
+			self.walkable[...] = Tile.walkableGrid
+			self.cost[...] = Tile.costGrid
+			self.mapVersion = Tile.mapVersion
+
+	def request(self, goal, starts):
+		"""
+		Spread searches from a set of start cells over the workers.
+
+		Args:
+			goal (tuple): (col, row) of the player's tile
+			starts (list): (col, row) start cells
+		"""
+		chunk = -(-len(starts) // self.processes)
+
+		for i in range(0, len(starts), chunk):
+			batch = starts[i:i + chunk]
+			self.pending.append((self.pool.apply_async(solve, (goal, batch, self.mapVersion)), self.mapVersion))
+			self.inFlight.update(batch)
+			self.requested += len(batch)
+
+	def collect(self, wait=False):
+		"""
+		Take the results that are ready.
+
+		Args:
+			wait (bool, optional): Wait for every pending result instead
+				of only taking finished ones. Defaults to False.
+
+		Returns:
+			dict: Start cell -> path, for results still valid on this map
+		"""
+		paths, waiting = {}, []
+
+		for result, version in self.pending:
+			if not wait and not result.ready():
+				waiting.append((result, version))
+				continue
+
+			for start, path in result.get():
+				self.inFlight.discard(start)
+				if version == Tile.mapVersion:
+					paths[start] = path
+				else:
+					self.stale += 1
+
+		self.pending = waiting
+		return paths
+
+	def stats(self):
+		"""
+		Get the pool counters.
+
+		Returns:
+			dict: workers, searches requested, paths applied, stale results
+			and requests still in flight
+		"""
+		return {
+			"workers": self.processes,
+			"requested": self.requested,
+			"applied": self.applied,
+			"stale": self.stale,
+			"inFlight": len(self.inFlight)
+		}
+
+	def close(self):
+		"""Stop the workers and free the shared memory."""
+		if self.pool is None:
+			return
+
+		self.pool.terminate()
+		self.pool.join()
+		self.pool = None
+		self.memory.close()
+		self.memory.unlink()
+
+
+workers = None  # Started on first use
+lockstep = False  # Apply every batch on the update after it was requested
+
+
+def setLockstep(enabled):
+	"""
+	Switch lockstep mode, in which results never depend on worker speed.
+
+	Every batch is applied on the next update, waiting for it if need be,
+	so a recorded session replays exactly. Batches still in flight are
+	drained first, so recording and replay both start with none.
+
+	Args:
+		enabled (bool): True while recording or replaying
+	"""
+	global lockstep
+
+	lockstep = enabled
+	if workers is not None:
+		workers.collect(wait=True)
+
+
+def ParallelAStar(screen, survivor, FPS, totalFrames):
+	"""
+	Hand idle zombies' path searches to the worker pool and apply finished ones.
+
+	Drop-in alternative to AStar.AStar with the same signature.
+
+	Args:
+		screen: Pygame screen surface
+		survivor: Player character
+		FPS (int): Frames per second
+		totalFrames (int): Total frames elapsed
+	"""
+	global workers
+
+	if workers is None or workers.shape != Tile.walkableGrid.shape:
+		if workers is not None:
+			workers.close()
+		workers = WorkerPool()
+
+	workers.publish()
+	paths = workers.collect(wait=lockstep)
+
+	survivorTile = survivor.getTile()
+	goal = (survivorTile.col, survivorTile.row)
+	waiting = []
+
+	for zombie in Zombie.List:
+
+		if zombie.tx != None or zombie.ty != None:
+			continue
+
+		zombieTile = zombie.getTile()
+		start = (zombieTile.col, zombieTile.row)
+		path = paths.get(start)
+
+		#Move Zombies - Chase The Player (Stop On The Adjacent Tile)
+		if path is not None:
+			if len(path) > 2:
+				zombie.setTarget(Tile.at(*path[1]))
+				workers.applied += 1
+
+		elif start not in workers.inFlight:
+			waiting.append(start)
+
+	if waiting:
+		workers.request(goal, list(dict.fromkeys(waiting)))
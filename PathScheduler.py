@@ -0,0 +1,141 @@
+"""
+Frame-Budgeted Pathfinding for Zombie Apocalypse
+
+Instead of searching for every idle zombie on one timer tick, the
+scheduler runs every frame and spends at most a fixed time budget on path
+requests. Idle zombies are served nearest-to-the-player first, with
+zombies that have waited longer moving up the queue, and whatever does
+not fit in the budget is carried over to the next frame. A burst of idle
+zombies therefore costs a few frames of latency instead of one long frame.
+
+A time budget depends on the machine, so while a session is recorded or
+replayed the scheduler serves a fixed number of requests per frame instead.
+"""
+
+import time
+
+import numpy as np
+
+import config
+import AStar
+from ObjectClass import Zombie
+from TileClass import Tile
+
+
+class PathScheduler:
+	"""
+	Serves idle zombies' path requests within a per-frame time budget.
+
+	Priority is the zombie's tile distance to the player minus
+	`staleness` tiles for every second it has been waiting, so nearby
+	zombies react first and distant ones are never starved.
+	"""
+
+	def __init__(self, budget=config.PATH_SCHEDULER_BUDGET, staleness=config.PATH_SCHEDULER_STALENESS):
+		"""
+		Create a scheduler.
+
+		Args:
+			budget (float, optional): Milliseconds of path requests per
+				frame. Defaults to config.PATH_SCHEDULER_BUDGET.
+			staleness (float, optional): Priority gained per second of
+				waiting, in tiles. Defaults to config.PATH_SCHEDULER_STALENESS.
+		"""
+		self.budget = budget / 1000
+		self.staleness = staleness
+		self.requests = None  # Fixed requests per frame replacing the budget (recording/replay)
+		self.frame = 0
+		self.since = np.full(len(Zombie.posX), -1, dtype=np.int64)  # Slot -> frame it went idle, -1 if not waiting
+		self.served, self.deferred, self.maxWait = 0, 0, 0
+
+	def update(self, survivor, FPS):
+		"""
+		Serve as many idle zombies as fit in this frame's budget.
+
+		Args:
+			survivor: Player character
+			FPS (int): Frames per second, to turn waiting frames into seconds
+		"""
+		start = time.perf_counter()
+		self.frame += 1
+		frame, since = self.frame, self.since
+
+		#Idle Zombies In Play (Dead Zombies Keep Their Pool Slot, So Go Through Zombie.List)
+		live = np.fromiter((zombie.slot for zombie in Zombie.List), dtype=np.intp, count=len(Zombie.List))
+		idle = live[np.isnan(Zombie.targetX[live]) & np.isnan(Zombie.targetY[live])]
+
+		#Already Next To The Player (Or Cut Off) On This Goal And Map: Nothing To Request
+		survivorTile = survivor.getTile()
+		pathKey = (survivorTile.number, Tile.mapVersion)
+		slots = Zombie.slots
+		settled = np.fromiter(
+			(slots[slot].pathKey == pathKey and len(slots[slot].path) <= 2 for slot in idle.tolist()),
+			dtype=bool, count=len(idle)
+		)
+		idle = idle[~settled]
+
+		#Anyone Not Idle Any More (Moving Or Dead) Stops Waiting
+		waited = since >= 0
+		waited[idle] = False
+		since[waited] = -1
+
+		if idle.size == 0:
+			return
+
+		since[idle[since[idle] < 0]] = frame
+
+		#Queue By Tile Distance To The Player, Minus The Time Waited
+		distance = (np.abs(Zombie.posX[idle] // Tile.width - survivorTile.col)
+			+ np.abs(Zombie.posY[idle] // Tile.height - survivorTile.row))
+		priority = distance - (frame - since[idle]) * (self.staleness / FPS)
+		queue = idle[np.argsort(priority, kind="stable")].tolist()
+
+		#Always Serve At Least One Zombie So Every Frame Makes Progress
+		served = 0
+		for slot in queue:
+			AStar.followPath(slots[slot], survivorTile, pathKey)
+			self.maxWait = max(self.maxWait, frame - int(since[slot]))
+			since[slot] = -1
+			served += 1
+
+			if self.requests is not None:
+				if served >= self.requests:
+					break
+			elif time.perf_counter() - start >= self.budget:
+				break
+
+		self.served += served
+		self.deferred += len(queue) - served
+
+	def stats(self):
+		"""
+		Get the scheduler counters.
+
+		Returns:
+			dict: zombies served, requests carried over to a later frame,
+			zombies waiting now and the longest wait in frames
+		"""
+		return {
+			"served": self.served,
+			"deferred": self.deferred,
+			"waiting": int(np.count_nonzero(self.since >= 0)),
+			"maxWaitFrames": self.maxWait
+		}
+
+
+scheduler = PathScheduler()
+
+
+def ScheduledAStar(screen, survivor, FPS, totalFrames):
+	"""
+	Run one frame's worth of budgeted A* pathfinding.
+
+	Same signature as AStar.AStar, but meant to be called every frame.
+
+	Args:
+		screen: Pygame screen surface
+		survivor: Player character
+		FPS (int): Frames per second
+		totalFrames (int): Total frames elapsed
+	"""
+	scheduler.update(survivor, FPS)
@@ -0,0 +1,102 @@
+"""
+Object Pools for Zombie Apocalypse
+
+Preallocates game objects once and hands them out again, so spawning
+zombies and firing bullets does not allocate new objects in the frame loop.
+"""
+
+
+class Pool:
+	"""
+	Fixed-capacity object pool with an O(1) swap-remove live list.
+
+	Pooled objects must provide reset(*args), which reinitialises them on
+	acquire. Each live object stores its position in the live list in
+	poolIndex, so release() can swap the last live object into the freed
+	slot instead of shifting the list.
+	"""
+
+	def __init__(self, factory, capacity, live=None):
+		"""
+		Create a pool and preallocate all of its objects.
+
+		Args:
+			factory (callable): Builds one new (inactive) object
+			capacity (int): Number of objects to preallocate
+			live (list, optional): List that receives acquired objects,
+				e.g. Zombie.List. Defaults to a new list.
+		"""
+		self.capacity = capacity
+		self.live = live if live is not None else []
+		self.free = [factory() for _ in range(capacity)]
+
+		self.highWater = 0  # Most objects ever live at once
+		self.acquired, self.released, self.exhausted = 0, 0, 0
+
+	def acquire(self, *args):
+		"""
+		Take a free object, reset it and add it to the live list.
+
+		Args:
+			*args: Passed on to the object's reset()
+
+		Returns:
+			The object, or None if every object is already in use
+		"""
+		if not self.free:
+			self.exhausted += 1
+			return None
+
+		obj = self.free.pop()
+		obj.reset(*args)
+		obj.poolIndex = len(self.live)
+		self.live.append(obj)
+
+		self.acquired += 1
+		if len(self.live) > self.highWater:
+			self.highWater = len(self.live)
+
+		return obj
+
+	def release(self, obj):
+		"""
+		Return a live object to the pool.
+
+		Safe to call while iterating the live list backwards; the object
+		swapped into the freed slot has already been visited.
+
+		Args:
+			obj: Object previously returned by acquire()
+		"""
+		index = obj.poolIndex
+		last = self.live.pop()
+
+		if last is not obj:
+			self.live[index] = last
+			last.poolIndex = index
+
+		obj.poolIndex = -1
+		self.free.append(obj)
+		self.released += 1
+
+	def clear(self):
+		"""Release every live object."""
+		while self.live:
+			self.release(self.live[-1])
+
+	def stats(self):
+		"""
+		Get the pool counters.
+
+		Returns:
+			dict: capacity, live, free, highWater, acquired, released, exhausted
+		"""
+		return {
+			"capacity": self.capacity,
+			"live": len(self.live),
+			"free": len(self.free),
+			"highWater": self.highWater,
+			"acquired": self.acquired,
+			"released": self.released,
+			"exhausted": self.exhausted
+		}
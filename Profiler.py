@@ -0,0 +1,202 @@
+"""
+Frame Profiler for Zombie Apocalypse
+
+Times each phase of a frame (spawning, survivor movement, bullets,
+pathfinding, zombies, input, rendering) into a fixed-size ring buffer,
+together with the entity counts and zombies per LevelOfDetail band,
+draws a toggleable overlay with the numbers, and dumps the history to CSV
+on exit. When disabled, each phase costs one method call.
+"""
+
+import csv
+import time
+
+import numpy as np
+
+import config
+import Functions
+
+
+PHASES = ("spawn", "survivor", "bullets", "pathfinding", "zombies", "input", "render")
+SPAWN, SURVIVOR, BULLETS, PATHFINDING, ZOMBIES, INPUT, RENDER = range(len(PHASES))
+BANDS = config.AI_LOD_BAND_NAMES
+
+
+class Profiler:
+	"""
+	Per-phase frame timer backed by a ring buffer.
+
+	Usage inside a frame:
+		t = profiler.start()
+		...spawn...
+		t = profiler.lap(SPAWN, t)
+		...
+		profiler.endFrame(zombies, bullets, bands)
+	"""
+
+	def __init__(self, size=config.PROFILER_HISTORY, enabled=config.PROFILER_ENABLED):
+		"""
+		Create a profiler.
+
+		Args:
+			size (int, optional): Frames kept in the ring buffer. Defaults
+				to config.PROFILER_HISTORY.
+			enabled (bool, optional): Start timing straight away. Defaults
+				to config.PROFILER_ENABLED.
+		"""
+		self.enabled = enabled
+		self.overlay = enabled
+
+		#Ring Buffer: One Row Per Frame, Phase Times In Milliseconds
+		self.times = np.zeros((size, len(PHASES)))
+		self.entities = np.zeros((size, 2), dtype=np.int32)  # Zombies, bullets
+		self.bands = np.zeros((size, len(BANDS)), dtype=np.int32)  # Zombies per AI level of detail band
+		self.index, self.frames = 0, 0
+
+		self.current = [0.0] * len(PHASES)
+		self.lines = []  # Overlay text, refreshed every few frames
+
+	def toggle(self):
+		"""Switch timing and the overlay on or off together."""
+		self.enabled = self.overlay = not self.enabled
+		self.current = [0.0] * len(PHASES)
+
+	def start(self):
+		"""
+		Get the start time for the first phase of a frame.
+
+		Returns:
+			float: Timestamp, or 0.0 when disabled
+		"""
+		return time.perf_counter() if self.enabled else 0.0
+
+	def lap(self, phase, start):
+		"""
+		Charge the time since `start` to a phase.
+
+		Args:
+			phase (int): Phase index (SPAWN, SURVIVOR, ...)
+			start (float): Timestamp from start() or the previous lap()
+
+		Returns:
+			float: Timestamp to pass to the next lap()
+		"""
+		if not self.enabled:
+			return 0.0
+
+		now = time.perf_counter()
+		self.current[phase] += (now - start) * 1000
+		return now
+
+	def endFrame(self, zombies, bullets, bands=None):
+		"""
+		Store the frame's phase times in the ring buffer.
+
+		Args:
+			zombies (int): Zombies in play
+			bullets (int): Bullets in play
+			bands (list, optional): Zombies per LevelOfDetail band.
+				Defaults to none in any band.
+		"""
+		if not self.enabled:
+			return
+
+		row = self.index
+		self.times[row] = self.current
+		self.entities[row] = (zombies, bullets)
+		self.bands[row] = bands if bands is not None else 0
+
+		self.index = (row + 1) % len(self.times)
+		self.frames += 1
+		self.current = [0.0] * len(PHASES)
+
+	def history(self):
+		"""
+		Get the buffered frames in chronological order.
+
+		Returns:
+			tuple: (phase times array, entity counts array, band counts array)
+		"""
+		count = min(self.frames, len(self.times))
+		order = (np.arange(count) + (self.index - count)) % len(self.times)
+		return self.times[order], self.entities[order], self.bands[order]
+
+	def summary(self):
+		"""
+		Summarise the buffered frames.
+
+		Returns:
+			dict: frames, mean ms per phase, p50/p95/p99 frame ms and the
+			latest entity and band counts; None if nothing was recorded
+		"""
+		times, entities, bands = self.history()
+		if len(times) == 0:
+			return None
+
+		totals = times.sum(axis=1)
+		p50, p95, p99 = np.percentile(totals, (50, 95, 99))
+
+		return {
+			"frames": len(times),
+			"phases": dict(zip(PHASES, times.mean(axis=0).tolist())),
+			"p50": float(p50), "p95": float(p95), "p99": float(p99),
+			"zombies": int(entities[-1, 0]), "bullets": int(entities[-1, 1]),
+			"bands": dict(zip(BANDS, bands[-1].tolist()))
+		}
+
+	def draw(self, screen):
+		"""
+		Draw the overlay (if shown).
+
+		Args:
+			screen: Pygame screen surface
+
+		Returns:
+			list: Screen areas drawn to
+		"""
+		if not self.overlay:
+			return []
+
+		#Rebuild The Text A Few Times A Second So The Text Cache Can Keep Up
+		if self.frames % config.PROFILER_OVERLAY_REFRESH == 0 or not self.lines:
+			stats = self.summary()
+			if stats is None:
+				return []
+
+			self.lines = [
+				f"FRAME p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  p99 {stats['p99']:.2f} ms",
+				f"ZOMBIES {stats['zombies']}  BULLETS {stats['bullets']}"
+			]
+			if config.AI_LOD:
+				self.lines.append("LOD " + "  ".join(f"{name.upper()} {count}" for name, count in stats["bands"].items()))
+			self.lines += [f"{name.upper()} {ms:.2f} ms" for name, ms in stats["phases"].items()]
+
+		drawn = []
+		y = config.PROFILER_OVERLAY_Y
+		for line in self.lines:
+			drawn.append(Functions.displayText(
+				screen, line, config.PROFILER_OVERLAY_X, y, config.PROFILER_FONT_SIZE, config.COLOR_YELLOW
+			))
+			y += config.PROFILER_FONT_SIZE
+
+		return drawn
+
+	def dumpCsv(self, path=config.PROFILER_CSV):
+		"""
+		Write the buffered frames to a CSV file (skipped if none were recorded).
+
+		Args:
+			path (str, optional): Output file. Defaults to config.PROFILER_CSV.
+		"""
+		times, entities, bands = self.history()
+		if not path or len(times) == 0:
+			return
+
+		first = self.frames - len(times)
+		with open(path, "w", newline="") as file:
+			writer = csv.writer(file)
+			#Phase Columns Are Named After PHASES, So The Counts Need Names Of Their Own
+			writer.writerow(("frame",) + PHASES + ("total", "zombieCount", "bulletCount") + BANDS)
+
+			for offset, (row, counts, banded) in enumerate(zip(times.tolist(), entities.tolist(), bands.tolist())):
+				writer.writerow([first + offset] + [f"{ms:.4f}" for ms in row] + [f"{sum(row):.4f}"] + counts + banded)
@@ -0,0 +1,96 @@
+"""
+Dirty-Rectangle Renderer for Zombie Apocalypse
+
+Instead of repainting the whole background and flipping the full window
+every frame, only the areas that were drawn to last frame or this frame
+are restored from the background and pushed to the display.
+"""
+
+import pygame
+
+import config
+
+
+class DirtyRenderer:
+	"""
+	Tracks the screen areas drawn each frame and updates only those.
+
+	Call begin() before drawing and end() with the rects drawn this frame.
+	Whenever something else has drawn over the whole screen (menus, pause
+	overlay), call invalidate() so the next frame is a full redraw.
+	"""
+
+	def __init__(self, screen, background, threshold=config.DIRTY_RECT_FULL_FLIP):
+		"""
+		Create a renderer for a screen and its static background.
+
+		Args:
+			screen: Pygame screen surface
+			background: Surface the same size as the screen
+			threshold (float, optional): Fraction of the screen area above
+				which a full flip is used instead. Defaults to
+				config.DIRTY_RECT_FULL_FLIP.
+		"""
+		self.screen = screen
+		self.background = background
+		self.threshold = threshold * screen.get_width() * screen.get_height()
+
+		self.previous = []  # Rects drawn last frame
+		self.full = True  # Next frame must redraw everything
+
+		self.frames, self.fullFrames = 0, 0
+		self.dirtyArea = 0  # Area pushed by the last partial update, in pixels
+
+	def invalidate(self):
+		"""Force a full redraw and flip on the next frame."""
+		self.full = True
+
+	def begin(self):
+		"""Erase last frame's sprites by restoring the background under them."""
+		if self.full or not config.DIRTY_RECTS:
+			self.screen.blit(self.background, (0, 0))
+			return
+
+		screen, background = self.screen, self.background
+		for rect in self.previous:
+			screen.blit(background, rect, rect)
+
+	def end(self, rects):
+		"""
+		Push this frame to the display.
+
+		Args:
+			rects (list): Screen areas drawn to this frame
+		"""
+		dirty = self.previous + rects
+		self.previous = rects
+		self.frames += 1
+
+		#Overlapping Rects Are Counted Twice, Which Only Makes Us Flip Sooner
+		area = 0
+		for rect in dirty:
+			area += rect.width * rect.height
+
+		if self.full or not config.DIRTY_RECTS or area > self.threshold:
+			pygame.display.flip()
+			self.fullFrames += 1
+
+			#A Crowded Screen Is Cheaper To Repaint In One Blit Than Rect By Rect
+			self.full = area > self.threshold
+		else:
+			pygame.display.update(dirty)
+			self.dirtyArea = area
+
+	def stats(self):
+		"""
+		Get the renderer counters.
+
+		Returns:
+			dict: frames, full flips, partial updates and last partial area
+		"""
+		return {
+			"frames": self.frames,
+			"fullFrames": self.fullFrames,
+			"partialFrames": self.frames - self.fullFrames,
+			"dirtyArea": self.dirtyArea
+		}
@@ -0,0 +1,266 @@
+"""
+Input Recording and Replay for Zombie Apocalypse
+
+A recording holds everything a game session depends on: the random seed,
+the starting map, and for every simulated frame its delta time and the
+InputState handed to Interaction.interaction. Replaying it runs
+Game.update_game_state with exactly the same inputs, so the simulation
+(and its cost) is identical between runs, headless or rendered. The
+pathfinding modes that depend on wall-clock time ("parallel" and
+"scheduled") run in lockstep while recording and replaying.
+
+Files are gzip-compressed binary:
+	header  "ZREC", version (B), seed (Q), rows (H), cols (H),
+	        scheduler requests per frame (H, version 2), packed walkable grid
+	frame   delta time (d), flags (B), gun switches (B), click count (B), clicks (HH each)
+	end     flags with END set, then a checksum (I) of the final game state
+
+Usage:
+	python Main.py --record session.zrec [--seed N]
+	python Headless.py --seconds 600 --record session.zrec
+	python Replay.py session.zrec [--render]
+"""
+
+import argparse
+import gzip
+import struct
+import time
+import zlib
+
+import numpy as np
+
+import config
+from Interaction import InputState
+
+
+MAGIC, VERSION = b"ZREC", 2
+HEADER = struct.Struct("<4sBQHH")
+REQUESTS = struct.Struct("<H")
+FRAME = struct.Struct("<dBBB")
+CLICK = struct.Struct("<HH")
+CHECKSUM = struct.Struct("<I")
+
+# Frame flag bits
+UP, DOWN, LEFT, RIGHT, FIRE, PAUSE, PROFILER, END = (1 << bit for bit in range(8))
+
+
+def checksum(game):
+	"""
+	Fingerprint the simulation state so two runs can be compared.
+
+	Args:
+		game (Main.Game): Game to fingerprint
+
+	Returns:
+		int: CRC32 of the survivor, zombies and game clock
+	"""
+	from ObjectClass import Zombie
+
+	survivor = game.survivor
+	zombies = sorted((zombie.x, zombie.y, zombie.health) for zombie in Zombie.List)
+	state = (survivor.x, survivor.y, survivor.health, survivor.kills, survivor.gun, round(game.game_time, 6), zombies)
+	return zlib.crc32(repr(state).encode())
+
+
+def lockstep(pathRequests):
+	"""
+	Make the pathfinding modes that depend on wall-clock time deterministic.
+
+	Args:
+		pathRequests (int): Path requests the scheduler serves per frame
+			instead of its time budget; None switches lockstep off
+	"""
+	import ParallelAStar
+	from PathScheduler import scheduler
+
+	ParallelAStar.setLockstep(pathRequests is not None)
+	scheduler.requests = pathRequests
+
+
+class Recorder:
+	"""Writes a session's seed, map and per-frame input to a recording file."""
+
+	def __init__(self, path):
+		"""
+		Open a recording file.
+
+		Args:
+			path (str): File to write
+		"""
+		self.path = path
+		self.file = None
+		self.frames = 0
+
+	def start(self, game, seed):
+		"""
+		Start a fresh seeded session in the game and write the header.
+
+		Args:
+			game (Main.Game): Game to record
+			seed (int): Seed for the game's randomness
+		"""
+		from TileClass import Tile
+
+		requests = config.PATH_SCHEDULER_REPLAY_REQUESTS
+		lockstep(requests)
+		game.start_session(seed)
+
+		rows, cols = Tile.walkableGrid.shape
+		self.file = gzip.open(self.path, "wb")
+		self.file.write(HEADER.pack(MAGIC, VERSION, seed, rows, cols))
+		self.file.write(REQUESTS.pack(requests))
+		self.file.write(np.packbits(Tile.walkableGrid).tobytes())
+
+	def write(self, delta_time, state):
+		"""
+		Record one simulated frame.
+
+		Args:
+			delta_time (float): Frame delta time in seconds
+			state (InputState): Input applied this frame
+		"""
+		flags = ((UP if state.up else 0) | (DOWN if state.down else 0) | (LEFT if state.left else 0)
+			| (RIGHT if state.right else 0) | (FIRE if state.fire else 0) | (PAUSE if state.pause else 0)
+			| (PROFILER if state.toggleProfiler else 0))
+
+		clicks = state.clicks[:255]
+		self.file.write(FRAME.pack(delta_time, flags, min(state.gunSwitches, 255), len(clicks)))
+		for x, y in clicks:
+			self.file.write(CLICK.pack(x, y))
+
+		self.frames += 1
+
+	def finish(self, game):
+		"""
+		Write the end marker with the final state checksum and close the file.
+
+		Args:
+			game (Main.Game): Recorded game
+		"""
+		if self.file is None:
+			return
+
+		self.file.write(FRAME.pack(0.0, END, 0, 0))
+		self.file.write(CHECKSUM.pack(checksum(game)))
+		self.file.close()
+		self.file = None
+		lockstep(None)
+
+
+class Recording:
+	"""A recording file read back into memory."""
+
+	def __init__(self, path):
+		"""
+		Read and decode a recording.
+
+		Args:
+			path (str): File to read
+
+		Raises:
+			ValueError: If the file is not a recording of a supported version
+		"""
+		with gzip.open(path, "rb") as file:
+			data = file.read()
+
+		magic, version, self.seed, rows, cols = HEADER.unpack_from(data)
+		if magic != MAGIC or version not in (1, VERSION):
+			raise ValueError(f"{path} is not a version 1 or {VERSION} recording")
+
+		offset = HEADER.size
+
+		#Version 1 Predates The Fixed Scheduler Budget
+		self.pathRequests = config.PATH_SCHEDULER_REPLAY_REQUESTS
+		if version >= 2:
+			(self.pathRequests,) = REQUESTS.unpack_from(data, offset)
+			offset += REQUESTS.size
+		cells = rows * cols
+		packed = np.frombuffer(data, dtype=np.uint8, count=(cells + 7) // 8, offset=offset)
+		self.walkable = np.unpackbits(packed)[:cells].astype(bool).reshape(rows, cols)
+		offset += len(packed)
+
+		self.frames = []  # (delta time, InputState)
+		self.checksum = None
+
+		while offset < len(data):
+			delta_time, flags, gunSwitches, clickCount = FRAME.unpack_from(data, offset)
+			offset += FRAME.size
+
+			if flags & END:
+				(self.checksum,) = CHECKSUM.unpack_from(data, offset)
+				break
+
+			clicks = [CLICK.unpack_from(data, offset + i * CLICK.size) for i in range(clickCount)]
+			offset += clickCount * CLICK.size
+
+			self.frames.append((delta_time, InputState(
+				up=bool(flags & UP), down=bool(flags & DOWN), left=bool(flags & LEFT), right=bool(flags & RIGHT),
+				fire=bool(flags & FIRE), gunSwitches=gunSwitches, pause=bool(flags & PAUSE), clicks=clicks,
+				toggleProfiler=bool(flags & PROFILER)
+			)))
+
+
+def replay(path, render=False, game=None):
+	"""
+	Run a recorded session as fast as possible.
+
+	Args:
+		path (str): Recording file
+		render (bool, optional): Draw every frame as well. Defaults to False.
+		game (Main.Game, optional): Game to replay into. Defaults to a new
+			one, headless unless render is set.
+
+	Returns:
+		dict: frames, wall-clock seconds, frames per second, the final
+		checksum and whether it matches the recorded one
+	"""
+	import Main
+	from TileClass import Tile
+
+	recording = Recording(path)
+
+	if game is None:
+		game = Main.Game(headless=not render)
+
+	lockstep(recording.pathRequests)
+	Tile.setMap(recording.walkable)
+	game.start_session(recording.seed)
+
+	start = time.perf_counter()
+	try:
+		for delta_time, state in recording.frames:
+			game.update_game_state(delta_time, state)
+			game.paused = False  # Pause menus are not part of the simulation
+
+			if render:
+				game.render()
+	finally:
+		lockstep(None)
+
+	wall = time.perf_counter() - start
+	final = checksum(game)
+
+	return {
+		"frames": len(recording.frames),
+		"wallSeconds": wall,
+		"framesPerSecond": len(recording.frames) / wall if wall else float('inf'),
+		"checksum": final,
+		"matches": recording.checksum is None or final == recording.checksum
+	}
+
+
+def main():
+	"""Parse the command line and replay a recording."""
+	parser = argparse.ArgumentParser(description="Replay a recorded Zombie Apocalypse session.")
+	parser.add_argument("recording", help="recording file")
+	parser.add_argument("--render", action="store_true", help="draw every frame (profiler: press F3 or set PROFILER_ENABLED)")
+	args = parser.parse_args()
+
+	result = replay(args.recording, args.render)
+
+	print(f"Replayed {result['frames']} frames in {result['wallSeconds']:.2f} s ({result['framesPerSecond']:.0f} frames/s)")
+	print(f"Final state {result['checksum']:08x}: {'matches the recording' if result['matches'] else 'DIVERGED from the recording'}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,91 @@
+"""
+Sound Bank for Zombie Apocalypse
+
+Decodes every sound effect once at startup and plays them through a fixed
+set of reserved mixer channels, so nothing is read from disk in the frame
+loop and a wave of spawns cannot flood the mixer. Music is still streamed
+through pygame.mixer.music.
+"""
+
+from random import choice
+
+import pygame
+
+import config
+
+
+class SoundBank:
+	"""
+	Preloaded sound effects with a fixed voice pool per effect.
+
+	Each effect owns its own reserved channels (its voices). play() uses a
+	free voice or, if they are all busy, skips the sound.
+	"""
+
+	# Effect name -> (sound files, voices)
+	effects = {
+		"zombieSpawn": (config.AUDIO_ZOMBIE_SPAWN, config.MAX_SPAWN_SOUNDS)
+	}
+
+	sounds = {}  # Effect name -> list of decoded Sounds
+	voices = {}  # Effect name -> list of reserved Channels
+	played, skipped = 0, 0
+
+	@staticmethod
+	def load():
+		"""
+		Decode every effect and reserve its channels.
+
+		Does nothing if the mixer could not be initialised (no audio
+		device), in which case play() stays silent.
+		"""
+		if pygame.mixer.get_init() is None:
+			return
+
+		reserved = sum(voices for _, voices in SoundBank.effects.values())
+		pygame.mixer.set_num_channels(max(config.AUDIO_CHANNELS, reserved))
+		pygame.mixer.set_reserved(reserved)  # Keep find_channel() off the voice pools
+
+		channel = 0
+		for name, (paths, voices) in SoundBank.effects.items():
+			sounds = [pygame.mixer.Sound(path) for path in paths]
+			for sound in sounds:
+				sound.set_volume(config.SFX_VOLUME)
+
+			SoundBank.sounds[name] = sounds
+			SoundBank.voices[name] = [pygame.mixer.Channel(i) for i in range(channel, channel + voices)]
+			channel += voices
+
+	@staticmethod
+	def play(name):
+		"""
+		Play a random variant of an effect on one of its free voices.
+
+		Args:
+			name (str): Effect name, e.g. "zombieSpawn"
+
+		Returns:
+			bool: True if the sound started, False if it was skipped
+		"""
+		sounds = SoundBank.sounds.get(name)
+		if not sounds:
+			return False
+
+		for voice in SoundBank.voices[name]:
+			if not voice.get_busy():
+				voice.play(choice(sounds))
+				SoundBank.played += 1
+				return True
+
+		SoundBank.skipped += 1
+		return False
+
+	@staticmethod
+	def stats():
+		"""
+		Get the playback counters.
+
+		Returns:
+			dict: sounds played, sounds skipped because every voice was busy
+		"""
+		return {"played": SoundBank.played, "skipped": SoundBank.skipped}
@@ -0,0 +1,84 @@
+"""
+Spatial Hash for Zombie Apocalypse
+
+Buckets rectangles into a uniform grid of cells so collision checks only
+look at objects in nearby cells instead of every object in the game.
+"""
+
+import config
+
+
+class SpatialHash:
+	"""
+	Uniform-grid spatial hash of rectangles.
+
+	Each rect is filed under the cell holding its top-left corner. A query
+	scans the 3x3 block of cells around the queried rect, which finds every
+	overlap as long as neither rect is larger than one cell.
+	"""
+
+	def __init__(self, cellSize=config.SPATIAL_HASH_CELL_SIZE):
+		"""
+		Create an empty spatial hash.
+
+		Args:
+			cellSize (int, optional): Cell edge in pixels. Defaults to
+				config.SPATIAL_HASH_CELL_SIZE.
+		"""
+		self.cellSize = cellSize
+		self.cells = {}  # (cx, cy) -> list of rects
+
+	def clear(self):
+		"""Remove every rect from the hash."""
+		self.cells.clear()
+
+	def insert(self, rect):
+		"""
+		Add a rect to the cell under its top-left corner.
+
+		Args:
+			rect (pygame.Rect): Object to store
+		"""
+		key = (int(rect.x) // self.cellSize, int(rect.y) // self.cellSize)
+		bucket = self.cells.get(key)
+
+		if bucket is None:
+			self.cells[key] = [rect]
+		else:
+			bucket.append(rect)
+
+	def rebuild(self, rects):
+		"""
+		Replace the contents of the hash.
+
+		Args:
+			rects (iterable): Rects to store
+		"""
+		self.cells.clear()
+		for rect in rects:
+			self.insert(rect)
+
+	def query(self, rect):
+		"""
+		Get the stored rects in the 3x3 block of cells around a rect.
+
+		Args:
+			rect (pygame.Rect): Area to look around
+
+		Returns:
+			list: Candidate rects (may not actually overlap)
+		"""
+		cells = self.cells
+		if not cells:
+			return []
+
+		cx, cy = int(rect.x) // self.cellSize, int(rect.y) // self.cellSize
+		candidates = []
+
+		for x in (cx - 1, cx, cx + 1):
+			for y in (cy - 1, cy, cy + 1):
+				bucket = cells.get((x, y))
+				if bucket:
+					candidates.extend(bucket)
+
+		return candidates
@@ -0,0 +1,82 @@
+"""
+Sprite Cache for Zombie Apocalypse
+
+Loads every character, gun and bullet image once and keeps all four facings
+of each, so nothing is decoded from disk or rotated inside the frame loop.
+"""
+
+import pygame
+
+import config
+
+
+DIRECTIONS = ('N', 'E', 'S', 'W')
+
+# Sprites are drawn facing west; degrees to rotate them for each facing
+ROTATION = {'N': 270, 'E': 180, 'S': 90, 'W': 0}
+
+
+def facings(image):
+	"""
+	Rotate a west-facing image into all four facings.
+
+	Args:
+		image: West-facing pygame Surface
+
+	Returns:
+		dict: Direction -> Surface
+	"""
+	return {direction: pygame.transform.rotate(image, ROTATION[direction]) for direction in DIRECTIONS}
+
+
+class Sprites:
+	"""
+	Pre-rotated sprite cache.
+
+	Each entry maps a direction ('N', 'E', 'S', 'W') to a Surface. The
+	dicts are refilled in place by load(), so references to them stay valid.
+	"""
+
+	zombie = {}
+	survivor = {}
+	guns = [{}, {}, {}]  # Indexed by Survivor.gun (pistol, shotgun, automatic)
+	bullets = {"pistol": {}, "shotgun": {}, "automatic": {}}
+
+	@staticmethod
+	def load():
+		"""
+		Load and rotate every sprite.
+
+		Runs once on import so the game classes can be built, and again from
+		Game.__init__ once the display exists, which converts every surface
+		to the display's pixel format with convert_alpha().
+		"""
+		prepare = pygame.image.load
+		if pygame.display.get_surface() is not None:
+			prepare = lambda path: pygame.image.load(path).convert_alpha()
+
+		Sprites.zombie.update(facings(prepare(config.IMAGE_ZOMBIE)))
+
+		# The survivor has its own drawing for each facing
+		Sprites.survivor.update({
+			'N': prepare(config.IMAGE_SURVIVOR_N),
+			'E': prepare(config.IMAGE_SURVIVOR_E),
+			'S': prepare(config.IMAGE_SURVIVOR_S),
+			'W': prepare(config.IMAGE_SURVIVOR_W)
+		})
+
+		# Guns are mirrored rather than turned upside down when facing east
+		for gun, path in zip(Sprites.guns, (config.IMAGE_PISTOL, config.IMAGE_SHOTGUN, config.IMAGE_AUTOMATIC)):
+			image = prepare(path)
+			gun.update(facings(image))
+			gun['E'] = pygame.transform.flip(image, True, False)
+
+		for name, path in (
+			("pistol", config.IMAGE_PISTOL_BULLET),
+			("shotgun", config.IMAGE_SHOTGUN_BULLET),
+			("automatic", config.IMAGE_AUTOMATIC_BULLET)
+		):
+			Sprites.bullets[name].update(facings(prepare(path)))
+
+
+Sprites.load()
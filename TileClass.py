@@ -2,8 +2,13 @@
 Tile System for Zombie Apocalypse
 
 Manages the tile-based grid system used for movement and pathfinding.
+
+The world can be larger than the screen. Tile objects (and the background
+image behind them) are created a chunk at a time, the first time a tile in
+the chunk is looked up or drawn.
 """
 
+import numpy as np
 import pygame
 
 import config
@@ -15,13 +20,21 @@ class Tile(pygame.Rect):
 	Tile class for grid-based game world.
 
 	Inherits from pygame.Rect for collision detection.
-	Stores pathfinding data (F, G, H values) and walkability status.
+	Walkability and step cost live in the NumPy arrays Tile.walkableGrid and
+	Tile.costGrid (indexed [row, col]); each Tile is a view onto its cell.
 	"""
 	
-	List = []
+	Index = {}  # Tile number -> Tile, for the chunks created so far
+	Grid = {}   # (col, row) -> Tile, for the chunks created so far
+	chunks = {}  # (chunk col, chunk row) -> Chunk
 	width, height = config.TILE_WIDTH, config.TILE_HEIGHT
-	totalTiles = 1
-	Hz, Vt = 1, config.GRID_COLUMNS  # Horizontal and Vertical tile counts
+	totalTiles = 1  # One past the highest tile number
+	Hz, Vt = 1, config.WORLD_COLUMNS  # Horizontal and Vertical tile counts
+	mapVersion = 0  # Bumped whenever a tile's walkability changes
+
+	#Source Of Truth For The Map, Indexed [row, col]
+	walkableGrid = np.zeros((config.WORLD_ROWS, config.WORLD_COLUMNS), dtype=bool)
+	costGrid = np.full((config.WORLD_ROWS, config.WORLD_COLUMNS), config.TILE_STEP_COST, dtype=np.int32)
 
 	#Invalids For Current Screen Spec
 	invalids = (1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,
@@ -36,45 +49,121 @@ class Tile(pygame.Rect):
 				435,437,438,440,442,444,450,451,452,453,454,456,457,458,459,460,461,462,464,467,468,469,470,
 				472,476,490,498.499,504,506,508,509,511,512,520,525,526,527,498,499,534,539,540,543,374,249)
 
-	def __init__(self, x, y, Type):
+	def __init__(self, x, y):
 		"""
-		Create a new tile.
+		Create the tile for a cell (done by its Chunk).
 
 		Args:
 			x (int): X coordinate in pixels
 			y (int): Y coordinate in pixels
-			Type (str): Tile type ('empty' or 'solid')
 		"""
-		self.parent = None
-		self.F, self.G, self.H = 0, 0, 0  # A* pathfinding values
-
-		self.type = Type
-		self.number = Tile.totalTiles
-		Tile.totalTiles += 1
-
-		self.walkable = (Type == 'empty')
+		self.col, self.row = x // Tile.width, y // Tile.height
+		self.number = self.row * Tile.Vt + self.col + Tile.Hz
 
 		pygame.Rect.__init__(self, (x, y), (Tile.width, Tile.height))
-		Tile.List.append(self)
+		Tile.Index[self.number] = self
+		Tile.Grid[(self.col, self.row)] = self
 
 	@staticmethod
 	def preInit(screen, SCREENHEIGHT, SCREENWIDTH):
 		"""
-		Initialize the entire tile grid.
+		Initialize the tile grid for a world of the given pixel size.
 
-		Creates all tiles for the game map, marking some as solid (walls).
+		Fills Tile.walkableGrid from the shipped map (Tile.invalids, laid
+		out on one screen of GRID_COLUMNS x GRID_ROWS tiles). A larger world
+		repeats that map, with the border walls between copies opened up so
+		every copy is reachable. Tile objects are created later, a chunk at
+		a time.
 
 		Args:
 			screen: Pygame screen surface
-			SCREENHEIGHT (int): Height of the screen
-			SCREENWIDTH (int): Width of the screen
+			SCREENHEIGHT (int): Height of the world in pixels
+			SCREENWIDTH (int): Width of the world in pixels
+		"""
+		rows, cols = SCREENHEIGHT // Tile.height, SCREENWIDTH // Tile.width
+		layoutRows, layoutCols = config.GRID_ROWS, config.GRID_COLUMNS
+
+		layout = np.ones(layoutRows * layoutCols, dtype=bool)
+		layout[[number - 1 for number in Tile.invalids if isinstance(number, int)]] = False
+		layout = layout.reshape(layoutRows, layoutCols)
+
+		walkable = np.tile(layout, (-(-rows // layoutRows), -(-cols // layoutCols)))[:rows, :cols]
+
+		if rows > layoutRows or cols > layoutCols:
+			rowIndex, colIndex = np.indices((rows, cols))
+			seam = ((rowIndex % layoutRows == 0) | (rowIndex % layoutRows == layoutRows - 1)
+				| (colIndex % layoutCols == 0) | (colIndex % layoutCols == layoutCols - 1))
+			walkable |= seam
+
+			walkable[0, :] = walkable[-1, :] = False	#Keep The World's Own Border
+			walkable[:, 0] = walkable[:, -1] = False
+
+		Tile.walkableGrid = walkable
+		Tile.costGrid = np.full((rows, cols), config.TILE_STEP_COST, dtype=np.int32)
+		Tile.Vt = cols
+		Tile.totalTiles = rows * cols + 1
+
+		Tile.Index.clear()
+		Tile.Grid.clear()
+		Tile.chunks.clear()
+
+		Tile.mapVersion += 1	#New Map: Anything Built Before This Is Stale
+
+	@staticmethod
+	def setMap(walkable):
+		"""
+		Replace the walkability of every tile at once.
+
+		Used to swap maps on an initialised grid (benchmarks, tests)
+		without rebuilding the tiles.
+
+		Args:
+			walkable (numpy.ndarray): Bool array shaped like Tile.walkableGrid
+		"""
+		Tile.walkableGrid[...] = walkable
+		Tile.mapVersion += 1
+
+	@property
+	def type(self):
+		"""str: 'empty' or 'solid'."""
+		return 'empty' if Tile.walkableGrid[self.row, self.col] else 'solid'
+
+	@property
+	def walkable(self):
+		"""bool: Whether zombies and the player can enter this tile."""
+		return bool(Tile.walkableGrid[self.row, self.col])
+
+	@walkable.setter
+	def walkable(self, value):
+		if bool(value) != self.walkable:
+			Tile.walkableGrid[self.row, self.col] = value
+			Tile.mapVersion += 1
+
+	def setSolid(self):
+		"""
+		Turn this tile into a wall.
+
+		Bumps Tile.mapVersion so pathfinders know their cached data is stale.
+		"""
+		if self.walkable:
+			self.walkable = False
+
+	def getNeighbours(self):
+		"""
+		Get the tiles orthogonally adjacent to this one (N, E, S, W).
+
+		Returns:
+			list: Neighbouring tiles inside the grid
 		"""
-		for y in range(0, SCREENHEIGHT, Tile.height):
-			for x in range(0, SCREENWIDTH, Tile.width):
-				if Tile.totalTiles in Tile.invalids:
-					Tile(x, y, 'solid')
-				else:
-					Tile(x, y, 'empty')
+		col, row = self.col, self.row
+
+		neighbours = []
+		for cell in ((col, row - 1), (col + 1, row), (col, row + 1), (col - 1, row)):
+			tile = Tile.at(*cell)
+			if tile is not None:
+				neighbours.append(tile)
+
+		return neighbours
 
 	@staticmethod
 	def getTile(number):
@@ -87,9 +176,171 @@ class Tile(pygame.Rect):
 		Returns:
 			Tile: The tile with the given number, or None if not found
 		"""
-		for tile in Tile.List:
-			if tile.number == number:
-				return tile
+		tile = Tile.Index.get(number)
+		if tile is None and 0 < number < Tile.totalTiles:
+			row, col = divmod(number - Tile.Hz, Tile.Vt)
+			tile = Tile.at(col, row)
+		return tile
+
+	@staticmethod
+	def at(col, row):
+		"""
+		Get a tile by its grid position.
+
+		Args:
+			col (int): Column index (0-based)
+			row (int): Row index (0-based)
+
+		Returns:
+			Tile: The tile in that cell, or None if outside the grid
+		"""
+		tile = Tile.Grid.get((col, row))
+		if tile is None:
+			rows, cols = Tile.walkableGrid.shape
+			if 0 <= col < cols and 0 <= row < rows:
+				tile = Tile.chunkAt(col, row).tiles[(row % config.CHUNK_SIZE) * config.CHUNK_SIZE + col % config.CHUNK_SIZE]
+		return tile
+
+	@staticmethod
+	def at_pixel(x, y):
+		"""
+		Get the tile covering a pixel position.
+
+		Args:
+			x (int): X coordinate in pixels
+			y (int): Y coordinate in pixels
+
+		Returns:
+			Tile: The tile under the point, or None if outside the grid
+		"""
+		return Tile.at(int(x) // Tile.width, int(y) // Tile.height)
+
+	@staticmethod
+	def chunkAt(col, row):
+		"""
+		Get the chunk holding a cell, creating it on first use.
+
+		Args:
+			col (int): Column index (inside the grid)
+			row (int): Row index (inside the grid)
+
+		Returns:
+			Chunk: The chunk containing the cell
+		"""
+		key = (col // config.CHUNK_SIZE, row // config.CHUNK_SIZE)
+		chunk = Tile.chunks.get(key)
+		if chunk is None:
+			chunk = Tile.chunks[key] = Chunk(*key)
+		return chunk
+
+	@staticmethod
+	def chunksIn(rect):
+		"""
+		Get every chunk overlapping a pixel area, creating them as needed.
+
+		Args:
+			rect (pygame.Rect): Area in world pixels
+
+		Returns:
+			list: Chunks overlapping the area
+		"""
+		rows, cols = Tile.walkableGrid.shape
+		chunkWidth, chunkHeight = config.CHUNK_SIZE * Tile.width, config.CHUNK_SIZE * Tile.height
+
+		firstCol, lastCol = max(rect.left, 0) // chunkWidth, min(rect.right - 1, cols * Tile.width - 1) // chunkWidth
+		firstRow, lastRow = max(rect.top, 0) // chunkHeight, min(rect.bottom - 1, rows * Tile.height - 1) // chunkHeight
+
+		return [
+			Tile.chunkAt(chunkCol * config.CHUNK_SIZE, chunkRow * config.CHUNK_SIZE)
+			for chunkRow in range(firstRow, lastRow + 1)
+			for chunkCol in range(firstCol, lastCol + 1)
+		]
+
+	@staticmethod
+	def fromLayout(number, near=None):
+		"""
+		Find a shipped-map tile number in the copy of the map around a tile.
+
+		Tile numbers in config (spawn tiles) and Tile.invalids refer to the
+		one-screen shipped map; in a larger world that map is repeated.
+
+		Args:
+			number (int): Tile number on the shipped map
+			near (Tile, optional): Use the copy this tile is in (the last
+				whole copy at the world's edge). Defaults to the first copy.
+
+		Returns:
+			Tile: The matching tile, or None if it lies outside the world
+		"""
+		layoutRows, layoutCols = config.GRID_ROWS, config.GRID_COLUMNS
+		row, col = divmod(number - 1, layoutCols)
+
+		if near is not None:
+			rows, cols = Tile.walkableGrid.shape
+			col += max(0, min(near.col - near.col % layoutCols, cols - layoutCols))
+			row += max(0, min(near.row - near.row % layoutRows, rows - layoutRows))
+
+		return Tile.at(col, row)
+
+	@staticmethod
+	def rectWalkable(rect):
+		"""
+		Check whether a small rect lies entirely on walkable tiles.
+
+		Maps the rect's four corners to grid cells and reads Tile.walkableGrid,
+		so the cost does not depend on the number of tiles. The rect must be
+		inside the grid and no larger than one tile.
+
+		Args:
+			rect (pygame.Rect): Area to test
+
+		Returns:
+			bool: False if any corner is on a wall
+		"""
+		walkable = Tile.walkableGrid
+		left, right = rect.left // Tile.width, (rect.right - 1) // Tile.width
+		top, bottom = rect.top // Tile.height, (rect.bottom - 1) // Tile.height
+
+		return bool(walkable[top, left] and walkable[top, right]
+					and walkable[bottom, left] and walkable[bottom, right])
+
+	@staticmethod
+	def distanceMap(col, row):
+		"""
+		Blocky step distance from one cell to every reachable cell.
+
+		Grows a breadth-first wavefront one ring per iteration with whole-array
+		shifts instead of visiting tiles one by one.
+
+		Args:
+			col (int): Column of the source cell
+			row (int): Row of the source cell
+
+		Returns:
+			ndarray: (rows, cols) int32 array of steps, -1 where
+			the cell cannot be reached
+		"""
+		walkable = Tile.walkableGrid
+		distance = np.full(walkable.shape, -1, dtype=np.int32)
+		distance[row, col] = 0
+
+		frontier = np.zeros(walkable.shape, dtype=bool)
+		frontier[row, col] = True
+		step = 0
+
+		while frontier.any():
+			step += 1
+
+			grown = np.zeros_like(frontier)
+			grown[1:, :] |= frontier[:-1, :]
+			grown[:-1, :] |= frontier[1:, :]
+			grown[:, 1:] |= frontier[:, :-1]
+			grown[:, :-1] |= frontier[:, 1:]
+
+			frontier = grown & walkable & (distance < 0)
+			distance[frontier] = step
+
+		return distance
 
 	@staticmethod
 	def drawTiles(screen):
@@ -99,21 +350,68 @@ class Tile(pygame.Rect):
 		Args:
 			screen: Pygame screen surface
 		"""
+		for row, col in np.argwhere(~Tile.walkableGrid).tolist():
 
-		half = Tile.width // 2
-
-		for tile in Tile.List:
-
+			tile = Tile.at(col, row)
 			if not(tile.type == 'empty'):
 				pygame.draw.rect(screen, [100, 50, 10], tile)	#Grey Colour For non-Empty Tiles
 
-			#Display F, G, H Values of Tiles
-			# if tile.G !=0:
-			# 	Functions.displayText(screen, tile.G, tile.x, tile.y + half, color = [120, 157, 40])
-			# if tile.H !=0:
-			# 	Functions.displayText(screen, tile.H, tile.x + half, tile.y + half, color = [20, 67, 150])
-			# if tile.F !=0:
-			# 	Functions.displayText(screen, tile.F, tile.x + half, tile.y, color = [57, 177, 177])
-
 			#Display Tile Number
 			#Functions.displayText(screen, tile.number, tile.x, tile.y)
+
+
+class Chunk:
+	"""
+	Square block of CHUNK_SIZE x CHUNK_SIZE tiles (smaller at the world's edge).
+
+	Created the first time one of its tiles is needed, so a large world only
+	pays for the parts that are used. Its background image is built the
+	first time it is drawn.
+	"""
+
+	def __init__(self, chunkCol, chunkRow):
+		"""
+		Create the chunk and its tiles.
+
+		Args:
+			chunkCol (int): Chunk column
+			chunkRow (int): Chunk row
+		"""
+		size = config.CHUNK_SIZE
+		rows, cols = Tile.walkableGrid.shape
+		firstCol, firstRow = chunkCol * size, chunkRow * size
+
+		#Tiles In Row-Major Order, Padded With None Past The World's Edge
+		self.tiles = [
+			Tile(col * Tile.width, row * Tile.height) if col < cols and row < rows else None
+			for row in range(firstRow, firstRow + size)
+			for col in range(firstCol, firstCol + size)
+		]
+
+		self.rect = pygame.Rect(
+			firstCol * Tile.width, firstRow * Tile.height,
+			(min(firstCol + size, cols) - firstCol) * Tile.width, (min(firstRow + size, rows) - firstRow) * Tile.height
+		)
+		self.surface = None
+
+	def background(self, image):
+		"""
+		Get the chunk's part of the background, repeating the image as needed.
+
+		Args:
+			image: Background image for one screen of the map
+
+		Returns:
+			pygame.Surface: Background the size of the chunk
+		"""
+		if self.surface is None:
+			surface = pygame.Surface(self.rect.size, 0, image)
+			width, height = image.get_size()
+
+			for y in range(self.rect.top - self.rect.top % height, self.rect.bottom, height):
+				for x in range(self.rect.left - self.rect.left % width, self.rect.right, width):
+					surface.blit(image, (x - self.rect.left, y - self.rect.top))
+
+			self.surface = surface
+
+		return self.surface
@@ -18,6 +18,16 @@ TILE_WIDTH = 40
 TILE_HEIGHT = 40
 GRID_COLUMNS = 32  # SCREEN_WIDTH // TILE_WIDTH
 GRID_ROWS = 18     # SCREEN_HEIGHT // TILE_HEIGHT
+TILE_STEP_COST = 10  # Pathfinding cost of one straight move (keep per-tile costs >= this)
+
+# World Settings
+# World size in tiles. Anything larger than one screen scrolls with the
+# player, and the shipped map is repeated to fill it.
+WORLD_COLUMNS = GRID_COLUMNS
+WORLD_ROWS = GRID_ROWS
+WORLD_WIDTH = WORLD_COLUMNS * TILE_WIDTH
+WORLD_HEIGHT = WORLD_ROWS * TILE_HEIGHT
+CHUNK_SIZE = 16  # Chunk edge in tiles; tiles and background are created a chunk at a time
 
 # Player Settings
 PLAYER_START_X = 640  # Center of screen
@@ -30,6 +40,7 @@ ZOMBIE_HEALTH = 100
 ZOMBIE_DAMAGE = 5  # Damage per frame when adjacent
 ZOMBIE_SPAWN_INTERVAL = 1.0  # Spawn every N seconds
 ZOMBIE_SPEEDS = [80, 160]  # Pixels per second (was [4, 8] * 20 FPS)
+ZOMBIE_POOL_SIZE = 2048  # Preallocated zombies; spawns are skipped once all are in play
 
 # Weapon Settings - Damage values
 PISTOL_DAMAGE = ZOMBIE_HEALTH // 3 + 1      # ~34 damage (3 shots to kill)
@@ -46,13 +57,43 @@ AUTOMATIC_FIRE_RATE = 0.08  # Fastest fire rate - 0.08 second delay (low damage)
 BULLET_SPEED = 500  # Pixels per second - faster than player for better visuals
 BULLET_WIDTH = 7
 BULLET_HEIGHT = 10
+BULLET_BACKEND = "objects"  # "objects" (one Rect per bullet) or "arrays" (NumPy BulletStore)
+BULLET_STORE_CAPACITY = 4096  # Maximum live bullets for the "arrays" backend
+BULLET_POOL_SIZE = 1024  # Preallocated Bullets for the "objects" backend
+
+# Collision Settings
+SPATIAL_HASH_CELL_SIZE = 40  # Cell edge in pixels; must be >= zombie and bullet size
 
 # A* Pathfinding Settings
 PATHFINDING_UPDATE_INTERVAL = 0.05  # Update paths every 0.05 seconds (20 times per second)
+# "astar" (search per zombie), "flowfield" (one shared field) or
+# "lpastar" (incremental tree repaired on wall edits and player moves) or
+# "parallel" (A* in worker processes over a shared-memory grid) or
+# "scheduled" (A* every frame within a time budget, nearest zombies first) or
+# "hpastar" (hierarchical A* over clusters, for large maps)
+PATHFINDING_MODE = "astar"
+# Search behind "astar", "scheduled" and "parallel": "astar" or "jps"
+# (Jump Point Search; falls back to A* if tile costs are not all equal)
+PATH_SEARCH = "astar"
+PATH_CACHE_SIZE = 512  # Maximum number of A* paths kept in the LRU path cache
+PATH_WORKERS = 0  # Worker processes for "parallel" mode; 0 = one per CPU core minus one
+PATH_SCHEDULER_BUDGET = 2.0  # Milliseconds of path requests per frame in "scheduled" mode
+PATH_SCHEDULER_STALENESS = 20.0  # Priority (in tiles) a waiting zombie gains per second
+PATH_SCHEDULER_REPLAY_REQUESTS = 32  # Requests per frame instead of the time budget while recording or replaying
+HPA_CLUSTER_SIZE = 8  # Cluster edge in tiles for "hpastar" mode
+HPA_LONG_ENTRANCE = 6  # Border openings this wide get an entrance at each end instead of one in the middle
+
+# AI Level Of Detail Settings
+AI_LOD = False  # Search paths less often for zombies far from the player
+AI_LOD_BANDS = (12, 24)  # Tile distance (Manhattan) where the mid and far bands start
+AI_LOD_BAND_NAMES = ("near", "mid", "far")  # Names for the profiler overlay and CSV
+AI_LOD_REPLAN_INTERVALS = (0.5, 2.0)  # Seconds between full path searches in the mid and far bands
 
 # Audio Settings
 BACKGROUND_MUSIC_VOLUME = 0.7  # 0.0 to 1.0
 SFX_VOLUME = 0.5  # 0.0 to 1.0
+AUDIO_CHANNELS = 8  # Mixer channels opened at startup
+MAX_SPAWN_SOUNDS = 3  # Zombie spawn sounds allowed at once; further spawns are silent
 
 # UI Settings
 INTRO_DURATION = 6  # Seconds to show intro screen
@@ -68,6 +109,7 @@ COLOR_YELLOW = (255, 255, 0)
 
 # HUD Settings
 HUD_FONT_SIZE = 25
+TEXT_CACHE_SIZE = 256  # Maximum number of rendered text surfaces kept in the LRU text cache
 HUD_HEALTH_X = 10
 HUD_HEALTH_Y = 0
 HUD_KILLS_X = 500
@@ -75,6 +117,19 @@ HUD_KILLS_Y = 0
 HUD_WEAPON_X = 1000
 HUD_WEAPON_Y = 0
 
+# Rendering Settings
+DIRTY_RECTS = True  # Only repaint and update the screen areas that changed each frame
+DIRTY_RECT_FULL_FLIP = 0.3  # Flip the whole screen once dirty rects cover this fraction of it
+
+# Profiler Settings (F3 toggles timing and the overlay in game)
+PROFILER_ENABLED = False  # Time every frame phase from the start
+PROFILER_HISTORY = 600  # Frames kept in the ring buffer
+PROFILER_CSV = "profile.csv"  # Written on exit if any frames were timed; None disables
+PROFILER_OVERLAY_X = 10
+PROFILER_OVERLAY_Y = 40
+PROFILER_FONT_SIZE = 18
+PROFILER_OVERLAY_REFRESH = 15  # Frames between overlay text updates
+
 # Intro Screen Settings
 INTRO_TITLE_SIZE = 100
 INTRO_TEXT_SIZE = 40